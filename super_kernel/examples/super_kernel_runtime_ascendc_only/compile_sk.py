@@ -18,6 +18,7 @@ import ctypes
 import dataclasses
 
 from superkernel import super_kernel
+from superkernel.super_kernel_workspace_plan import load_workspace_plan
 from utils import SkCompileContext
 
 # TODO: AscendC需要重构部分，需要与tbe解耦
@@ -191,6 +192,10 @@ class SuperkernelResult(KernelResult):
     def output(self, value: List[str]):
         self._output = value
 
+    def workspace_plan(self):
+        """编译生成的workspace规划, 子kernel的workspace共用一块内存"""
+        return load_workspace_plan(self.root / "kernel_meta", self.name)
+
 
 def _compile_sub_kernel(kernel_meta_dir, op_name, op_type, func, extend_op_info: dict = None):
     current_build_config()[kernel_meta_parent_dir] = kernel_meta_dir
@@ -16,6 +16,7 @@ import ctypes
 from utils import print_float_array_ptr, write_data_to_host_memory, \
     allocat_memory_with_reuse, free_all_memorys, SkCompileContext, assert_true
 from compile_sk import compile_superkernel, compile_subkernel
+from superkernel.super_kernel_workspace_plan import patch_workspace_args
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from third_party.acl.acl_wrapper import acl
@@ -53,6 +54,10 @@ if __name__ == '__main__':
         super_kernel_result.output = sub_kernels[1].output
 
     # 3. 准备输入数据, 申请子kernel的输入输出内存
+    # 按照superkernel编译生成的workspace规划, 所有子kernel的workspace共用一块内存
+    workspace_plan = super_kernel_result.workspace_plan()
+    if workspace_plan is not None and len(workspace_plan["unplanned"]) != 0:
+        workspace_plan = None
     size = 1024 * 4
     host_ptr = ctypes.c_void_p()
     acl.aclrt_malloc_host(ctypes.byref(host_ptr), size)
@@ -70,6 +75,10 @@ if __name__ == '__main__':
             sub_kernel.output_addr.append(addr)
 
         for ws_size in sub_kernel.workspaces_size():
+            if workspace_plan is not None:
+                # 占位, launch前修改为workspace规划中的地址
+                sub_kernel.workspaces_addr.append(None)
+                continue
             dev_ptr = ctypes.c_void_p()
             acl.aclrt_malloc_align32(ctypes.byref(dev_ptr), ws_size,
                                      acl.aclrt_mem_malloc_policy.ACL_MEM_MALLOC_HUGE_FIRST)
@@ -117,6 +126,12 @@ if __name__ == '__main__':
         args_list.extend(sub_kernel.input_addr)
         args_list.extend(sub_kernel.output_addr)
         args_list.extend(sub_kernel.workspaces_addr)
+    arena_ptr = ctypes.c_void_p()
+    if workspace_plan is not None:
+        if workspace_plan["arena_size"] > 0:
+            acl.aclrt_malloc_align32(ctypes.byref(arena_ptr), workspace_plan["arena_size"],
+                                     acl.aclrt_mem_malloc_policy.ACL_MEM_MALLOC_HUGE_FIRST)
+        args_list = patch_workspace_args(workspace_plan, args_list, arena_ptr.value or 0)
     args_array = (ctypes.c_void_p * len(args_list))(*args_list)
 
     args = ctypes.cast(args_array, ctypes.c_void_p)
@@ -141,6 +156,8 @@ if __name__ == '__main__':
 
     # 7. 释放资源
     free_all_memorys()
+    if arena_ptr.value is not None:
+        acl.aclrt_free(arena_ptr)
     acl.aclrt_free(host_out_ptr)
     acl.aclrt_free(host_ptr)
     acl.aclrt_dev_binary_unregister(hdl)
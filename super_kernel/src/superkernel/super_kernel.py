@@ -13,8 +13,14 @@
 super kernel
 """
 import os
-import stat
-from asc_op_compile_base.asc_op_compiler.super_kernel_utility import get_soc_spec, KernelMetaType, \
+import time
+import asyncio
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import KernelMetaType, \
     CommonUtility, gen_func_align_attribute
 from asc_op_compile_base.asc_op_compiler.super_kernel_op_compile import super_kernel_compile, gen_file_header
 from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SuperKernelPreLoadMode, \
@@ -23,10 +29,30 @@ from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SuperKern
 from asc_op_compile_base.asc_op_compiler.global_storage import global_var_storage
 from .super_kernel_compile_base import gen_super_dump_code
 from .super_kernel_sub_op_infos import indent_code_func, SubOperatorInfos
-from .super_kernel_op_infos import SuperOperatorInfos
-
-
-def gen_early_start_config(pre_sub_operator: SubOperatorInfos, sub_operator: SubOperatorInfos):
+from .super_kernel_op_infos import SuperOperatorInfos, SYNC_ALL_SLOT_SIZE
+from .super_kernel_cost_model import get_core_num
+from .super_kernel_workspace_plan import write_workspace_plan
+from .super_kernel_cache import SuperKernelCompileCache, gen_compile_cache_key, restore_super_kernel
+from .super_kernel_artifact_store import SubOpArtifactStore, SUB_OP_ARTIFACT_DIR_NAME
+from .super_kernel_context import SuperKernelCompileContext, get_compile_context, use_compile_context
+from .super_kernel_code_emitter import CodeEmitter, FileCodeEmitter
+from .super_kernel_codegen_ir import NodeKind, BarrierScope, CodeGenNode, CodeGenBody, run_codegen_passes, \
+    print_codegen_nodes, gen_code_of_nodes
+from .super_kernel_codegen_passes import RedundantBarrierPass
+from .super_kernel_options import get_extension_option
+from .super_kernel_preload import gen_icache_preload_plan, gen_data_cache_preload_plan, DATA_CACHE_LINE_PARAMS
+
+# global_var_storage reset and compile context capture of concurrent compiles must not interleave
+_global_config_lock = threading.Lock()
+# compiles in flight, super_kernel_compile and gen_file_header of a running compile still read global state
+_running_compile_num = 0
+
+
+class CompileCancelledError(Exception):
+    pass
+
+
+def calc_early_start_config(pre_sub_operator: SubOperatorInfos, sub_operator: SubOperatorInfos):
     aiv_configs = [
         KernelMetaType.KERNEL_TYPE_AIV_ONLY,
         KernelMetaType.KERNEL_TYPE_MIX_AIV_1_0,
@@ -59,11 +85,11 @@ def gen_early_start_config(pre_sub_operator: SubOperatorInfos, sub_operator: Sub
         CommonUtility().ascendc_raise_python_err(ERR_CODE, \
             f"current sub kernel type {sub_operator.kernel_type} do not support!")
 
-    super_kernel_early_start_config = (prev_sub_kernel_config << 2) | cur_sub_kernel_config
-    # sub_operator.elf.early_start_complement_wait_flag_block
-    sub_operator.early_start_complement_wait_flag_block = sub_operator.early_start_complement_wait_flag_block.replace(
-        "__placehoder__earlay_config__", f"{super_kernel_early_start_config}")
-    return f"g_super_kernel_early_start_config = {super_kernel_early_start_config};\n"
+    return (prev_sub_kernel_config << 2) | cur_sub_kernel_config
+
+
+def gen_early_start_config(pre_sub_operator: SubOperatorInfos, sub_operator: SubOperatorInfos):
+    return f"g_super_kernel_early_start_config = {calc_early_start_config(pre_sub_operator, sub_operator)};\n"
 
 
 def gen_notify_wait_func():
@@ -129,22 +155,41 @@ wait_flag_dev(AscendC::SYNC_AIV_ONLY_ALL);
 """
 
 
-def gen_inter_ops_barrier(super_operator: SuperOperatorInfos, \
+def get_barrier_scope_by_kernel_type(kernel_type):
+    """cores synchronized by get_sync_code_by_kernel_type"""
+    if kernel_type in [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]:
+        return BarrierScope.SYNC_ALL
+    elif kernel_type in [KernelMetaType.KERNEL_TYPE_AIC_ONLY, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0]:
+        return BarrierScope.AIC_ALL
+    else:
+        return BarrierScope.AIV_ALL
+
+
+def build_inter_ops_barrier_node(super_operator: SuperOperatorInfos, \
     pre_sub_operator: SubOperatorInfos, sub_operator: SubOperatorInfos):
-    inter_ops_bar = "// begin inter ops barrier\n"
+    inter_ops_bar = CodeGenNode(NodeKind.BARRIER, "// begin inter ops barrier\n", sub_op=sub_operator)
     if super_operator.early_start_mode != SuperKernelEarlyStartMode.EarlyStartDisable:
-        inter_ops_bar += pre_sub_operator.early_start_complement_set_flag_block
+        inter_ops_bar.scope = BarrierScope.EARLY_START
+        inter_ops_bar.add_code(pre_sub_operator.early_start_complement_set_flag_block)
         if super_operator.early_start_mode == SuperKernelEarlyStartMode.EarlyStartEnableV2 or \
             super_operator.early_start_mode == SuperKernelEarlyStartMode.EarlyStartV2DisableSubKernel:
-            inter_ops_bar += gen_early_start_config(pre_sub_operator, sub_operator)
-        inter_ops_bar += sub_operator.early_start_complement_wait_flag_block
+            early_start_config = calc_early_start_config(pre_sub_operator, sub_operator)
+            inter_ops_bar.add_code(f"g_super_kernel_early_start_config = {early_start_config};\n")
+            inter_ops_bar.placeholders["__placehoder__earlay_config__"] = f"{early_start_config}"
+        inter_ops_bar.add_code(sub_operator.early_start_complement_wait_flag_block)
     else:
-        inter_ops_bar += "// reason2: inter op barrier when EarlyStartDisable\n"
-        inter_ops_bar += get_sync_code_by_kernel_type(super_operator.kernel_type)
+        inter_ops_bar.scope = get_barrier_scope_by_kernel_type(super_operator.kernel_type)
+        inter_ops_bar.add_code("// reason2: inter op barrier when EarlyStartDisable\n")
+        inter_ops_bar.add_code(get_sync_code_by_kernel_type(super_operator.kernel_type))
 
     return inter_ops_bar
 
 
+def gen_inter_ops_barrier(super_operator: SuperOperatorInfos, \
+    pre_sub_operator: SubOperatorInfos, sub_operator: SubOperatorInfos):
+    return gen_code_of_nodes([build_inter_ops_barrier_node(super_operator, pre_sub_operator, sub_operator)])
+
+
 def gen_op_end_debug_dcci_all(super_operator: SuperOperatorInfos):
     op_end_debug_dcci_all = ""
     if super_operator.debug_dcci_all_mode == SuperKernelDebugDcciAllMode.DebugDcciAllEnable:
@@ -224,7 +269,7 @@ indent_code_func(f"AscendC::SyncAll<false>(); // reason3: dynamic gen_switch_cas
 def print_params_addr(super_kernel_params):
     result = ''
     index = 0
-    if not CommonUtility.is_c310():
+    if not get_compile_context().is_c310():
         result += 'AscendC::printf("ffts_addr: %p\\n", ffts_addr); //para index: 0\n'
         index += 1
     for param in super_kernel_params:
@@ -256,234 +301,180 @@ def gen_clear_wait_sync_addr_code(super_operator):
     return result
 
 
+def gen_pipe_all_for_ops_code(super_operator, op, arch):
+    """pipe all between sub ops of one arch which need no inter-core sync"""
+    arch_op_list = super_operator.cub_op_list if arch == 'aic' else super_operator.vec_op_list
+    if len(op.send_info) == 0 and op != arch_op_list[-1]:
+        return "// insert pipe all for ops\n   pipe_barrier(PIPE_ALL);\n"
+    return ""
+
+
 def process_gen_stream_send_code(super_operator, op, arch, need_flag, code):
-    code_str = ""
-    if arch == 'aic':
-        if need_flag:
-            code_str += code
-        else:
-            if len(op.send_info) == 0 and op != super_operator.cub_op_list[-1]:
-                code_str += f"// insert pipe all for ops\n"
-                code_str += "   pipe_barrier(PIPE_ALL);\n"
-    else:
-        if need_flag:
-            code_str += code
-        else:
-            if len(op.send_info) == 0 and op != super_operator.vec_op_list[-1]:
-                code_str += f"// insert pipe all for ops\n"
-                code_str += "   pipe_barrier(PIPE_ALL);\n"
-    return code_str
+    if need_flag:
+        return code
+    return gen_pipe_all_for_ops_code(super_operator, op, arch)
 
 
-def gen_2_real_stream_send_code(super_operator, op, arch):
-    super_kernel_file = ''
+def build_2_real_stream_send_nodes(super_operator, op, arch):
     need_sync_self = False
     need_sync_event_for_notify = (op.is_last_op is True) and \
         (op.notify_block.get('aic', "") != "" or op.notify_block.get('aiv', "") != "")
     if op.index == super_operator.info_base[-1].index:
-        return super_kernel_file
+        return []
+    send_nodes = []
     if arch == 'aic':
         code = f'// Rule 1 : sync all {arch} must be insert behind each {arch} sub operator, when has real send info\n'
         code += f'// sync all C->C kernel_name:{op.kernel_name}, send_info:{op.send_info}\n'
         code += 'ffts_cross_core_sync(PIPE_FIX, AscendC::GetffstMsg(0x0, AscendC::SYNC_AIC_FLAG));\n'
         code += 'wait_flag_dev(AscendC::SYNC_AIC_FLAG);\n\n'
+        send_nodes.append(CodeGenNode(NodeKind.BARRIER, code, sub_op=op, scope=BarrierScope.AIC_ALL))
 
         for single in op.send_info:
             info_pairs = op.send_info[single].split(';')
             if 'cub:cub' in info_pairs or "vec:cub" in info_pairs:
                 need_sync_self = True
             if 'cub:vec' in info_pairs:
-                code += f'// Rule 3.1 : sync all c2v must be insert when sendinfo has c2v, \
+                code = f'// Rule 3.1 : sync all c2v must be insert when sendinfo has c2v, \
 kernel_name:{op.kernel_name}, send_info:{op.send_info}\n'
                 code += '// send sync of C->V;\n'
                 code += 'ffts_cross_core_sync(PIPE_MTE3, AscendC::GetffstMsg(0x02, AscendC::SYNC_AIC_AIV_FLAG));\n\n'
+                send_nodes.append(CodeGenNode(NodeKind.CROSS_CORE_SYNC, code, sub_op=op))
                 need_sync_self = True
-
-        super_kernel_file += \
-            process_gen_stream_send_code(super_operator, op, arch, need_sync_self or need_sync_event_for_notify, code)
     else:
         code = f'// Rule 1 : sync all {arch} must be insert behind each {arch} sub operator, when has real send info\n'
         code += f'// sync all V->V kernel_name:{op.kernel_name}, send_info:{op.send_info}\n'
         code += 'ffts_cross_core_sync(PIPE_MTE3, AscendC::GetffstMsg(0x0, AscendC::SYNC_AIV_ONLY_ALL));\n'
         code += 'wait_flag_dev(AscendC::SYNC_AIV_ONLY_ALL);\n\n'
+        send_nodes.append(CodeGenNode(NodeKind.BARRIER, code, sub_op=op, scope=BarrierScope.AIV_ALL))
 
         for single in op.send_info:
             info_pairs = op.send_info[single].split(';')
             if 'vec:vec' in info_pairs or "cub:vec" in info_pairs:
                 need_sync_self = True
             if 'vec:cub' in info_pairs:
-                code += f'// Rule 3.1 : sync all v2c must be insert when sendinfo has v2c, \
+                code = f'// Rule 3.1 : sync all v2c must be insert when sendinfo has v2c, \
 kernel_name:{op.kernel_name}, send_info:{op.send_info}\n'
                 code += '// send sync of V->C;\n'
                 code += 'ffts_cross_core_sync(PIPE_MTE3, AscendC::GetffstMsg(0x02, AscendC::SYNC_AIV_FLAG));\n\n'
+                send_nodes.append(CodeGenNode(NodeKind.CROSS_CORE_SYNC, code, sub_op=op))
                 need_sync_self = True
 
-        super_kernel_file += \
-            process_gen_stream_send_code(super_operator, op, arch, need_sync_self or need_sync_event_for_notify, code)
-    return super_kernel_file
+    if need_sync_self or need_sync_event_for_notify:
+        return send_nodes
+    pipe_all_node = CodeGenNode(NodeKind.BARRIER, gen_pipe_all_for_ops_code(super_operator, op, arch), \
+        sub_op=op, scope=BarrierScope.PIPE_ALL)
+    return [] if pipe_all_node.empty else [pipe_all_node]
 
 
-def gen_2_real_stream_recv_code(op, arch):
-    super_kernel_file = ''
+def gen_2_real_stream_send_code(super_operator, op, arch):
+    return gen_code_of_nodes(build_2_real_stream_send_nodes(super_operator, op, arch))
+
+
+def build_2_real_stream_recv_nodes(op, arch):
+    recv_nodes = []
     if arch == 'aic':
         for single in op.recv_info:
             if 'vec:cub' in op.recv_info[single].split(';'):
-                super_kernel_file += f'// Rule 3.2 : sync all v2c must be insert when recvinfo has v2c, \
+                code = f'// Rule 3.2 : sync all v2c must be insert when recvinfo has v2c, \
 kernel_name:{op.kernel_name}, send_info:{op.recv_info}\n'
-                super_kernel_file += '// receive sync of V->C;\n'
-                super_kernel_file += 'wait_flag_dev(AscendC::SYNC_AIV_FLAG);\n'
+                code += '// receive sync of V->C;\n'
+                code += 'wait_flag_dev(AscendC::SYNC_AIV_FLAG);\n'
+                recv_nodes.append(CodeGenNode(NodeKind.CROSS_CORE_SYNC, code, sub_op=op))
     else:
         for single in op.recv_info:
             if 'cub:vec' in op.recv_info[single].split(';'):
-                super_kernel_file += f'// Rule 3.2 : sync all c2v must be insert when recvinfo has c2v, \
+                code = f'// Rule 3.2 : sync all c2v must be insert when recvinfo has c2v, \
 kernel_name:{op.kernel_name}, send_info:{op.recv_info}\n'
-                super_kernel_file += '// receive sync of C->V;\n'
-                super_kernel_file += 'wait_flag_dev(AscendC::SYNC_AIC_AIV_FLAG);\n'
-    return super_kernel_file
+                code += '// receive sync of C->V;\n'
+                code += 'wait_flag_dev(AscendC::SYNC_AIC_AIV_FLAG);\n'
+                recv_nodes.append(CodeGenNode(NodeKind.CROSS_CORE_SYNC, code, sub_op=op))
+    return recv_nodes
 
 
-def gen_2_real_stream_sync_code(super_operator, pre_op, cur_op, arch):
-    super_kernel_file = ''
-    if pre_op is not None:
-        super_kernel_file += gen_2_real_stream_send_code(super_operator, pre_op, arch)
-    if cur_op is not None:
-        super_kernel_file += gen_2_real_stream_recv_code(cur_op, arch)
-
-    return super_kernel_file
+def gen_2_real_stream_recv_code(op, arch):
+    return gen_code_of_nodes(build_2_real_stream_recv_nodes(op, arch))
 
 
-def gen_sync_and_event_code_for_two_stream(super_operator, pre_sub_operator, sub_operator, arch):
-    sync_and_event_code = ""
-    if len(sub_operator.recv_event_list) != 0:
-        # pre op send inter-core sync, cur op recv inter-core sync
-        sync_and_event_code += \
-            indent_code_func(gen_2_real_stream_sync_code(super_operator, pre_sub_operator, sub_operator, arch))
-        # pre op send to outside
-        if pre_sub_operator is not None:
-            if len(pre_sub_operator.send_event_list) != 0:
-                sync_and_event_code += indent_code_func(pre_sub_operator.notify_block[arch])
-        # current op wait for outside
-        if pre_sub_operator is not None:
-            if len(sub_operator.wait_block) != 0:
-                sync_and_event_code += indent_code_func(sub_operator.wait_block)
-
-                # add sync after notify/wait event
-                sync_and_event_code += f'// two stream when has wait event, add sync by current operator kernel type\n'
-                if sub_operator.kernel_type in [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, \
-                        KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]:
-                    # add sync with sub_operator and sub_operator
-                    sync_and_event_code += \
-                        indent_code_func(f"AscendC::SyncAll<false>(); // reason3: for continues notify/wait event \n\n")
-                elif sub_operator.kernel_type in [KernelMetaType.KERNEL_TYPE_AIC_ONLY, \
-                        KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0]:
-                    sync_and_event_code += '// reason3: for continues notify/wait event\n'
-                    sync_and_event_code += \
-                        "ffts_cross_core_sync(PIPE_FIX, AscendC::GetffstMsg(0x0, AscendC::SYNC_AIC_FLAG));\n"
-                    sync_and_event_code += "wait_flag_dev(AscendC::SYNC_AIC_FLAG);\n\n"
-                else:
-                    sync_and_event_code += '// reason3: for continues notify/wait event\n'
-                    sync_and_event_code += \
-                        'ffts_cross_core_sync(PIPE_MTE3, AscendC::GetffstMsg(0x0, AscendC::SYNC_AIV_ONLY_ALL));\n'
-                    sync_and_event_code += 'wait_flag_dev(AscendC::SYNC_AIV_ONLY_ALL);\n\n'
-    else:
-        # pre op send inter-core sync, cur op recv inter-core sync
-        sync_and_event_code += \
-            indent_code_func(gen_2_real_stream_sync_code(super_operator, pre_sub_operator, sub_operator, arch))
+def build_2_real_stream_sync_nodes(super_operator, pre_op, cur_op, arch):
+    sync_nodes = []
+    if pre_op is not None:
+        sync_nodes += build_2_real_stream_send_nodes(super_operator, pre_op, arch)
+    if cur_op is not None:
+        sync_nodes += build_2_real_stream_recv_nodes(cur_op, arch)
+    return sync_nodes
 
-        # pre op send to outside 
-        if pre_sub_operator is not None:
-            if len(pre_sub_operator.send_event_list) != 0:
-                sync_and_event_code += indent_code_func(pre_sub_operator.notify_block[arch])
 
-    return sync_and_event_code
+def gen_2_real_stream_sync_code(super_operator, pre_op, cur_op, arch):
+    return gen_code_of_nodes(build_2_real_stream_sync_nodes(super_operator, pre_op, cur_op, arch))
+
+
+def build_sync_and_event_nodes_for_two_stream(super_operator, pre_sub_operator, sub_operator, arch):
+    # pre op send inter-core sync, cur op recv inter-core sync
+    sync_and_event_nodes = build_2_real_stream_sync_nodes(super_operator, pre_sub_operator, sub_operator, arch)
+    # pre op send to outside
+    if pre_sub_operator is not None and len(pre_sub_operator.send_event_list) != 0:
+        sync_and_event_nodes.append(CodeGenNode(NodeKind.NOTIFY, pre_sub_operator.notify_block[arch], \
+            sub_op=pre_sub_operator))
+    # current op wait for outside
+    if len(sub_operator.recv_event_list) != 0 and pre_sub_operator is not None and \
+            len(sub_operator.wait_block) != 0:
+        sync_and_event_nodes.append(CodeGenNode(NodeKind.WAIT, sub_operator.wait_block, sub_op=sub_operator))
+
+        # add sync after notify/wait event
+        wait_sync = CodeGenNode(NodeKind.BARRIER, \
+            f'// two stream when has wait event, add sync by current operator kernel type\n', indented=False, \
+            sub_op=sub_operator, scope=get_barrier_scope_by_kernel_type(sub_operator.kernel_type))
+        if sub_operator.kernel_type in [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, \
+                KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]:
+            # add sync with sub_operator and sub_operator
+            wait_sync.add_code(f"AscendC::SyncAll<false>(); // reason3: for continues notify/wait event \n\n")
+        elif sub_operator.kernel_type in [KernelMetaType.KERNEL_TYPE_AIC_ONLY, \
+                KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0]:
+            wait_sync.add_code('// reason3: for continues notify/wait event\n', indented=False)
+            wait_sync.add_code("ffts_cross_core_sync(PIPE_FIX, AscendC::GetffstMsg(0x0, AscendC::SYNC_AIC_FLAG));\n", \
+                indented=False)
+            wait_sync.add_code("wait_flag_dev(AscendC::SYNC_AIC_FLAG);\n\n", indented=False)
+        else:
+            wait_sync.add_code('// reason3: for continues notify/wait event\n', indented=False)
+            wait_sync.add_code( \
+                'ffts_cross_core_sync(PIPE_MTE3, AscendC::GetffstMsg(0x0, AscendC::SYNC_AIV_ONLY_ALL));\n', \
+                indented=False)
+            wait_sync.add_code('wait_flag_dev(AscendC::SYNC_AIV_ONLY_ALL);\n\n', indented=False)
+        sync_and_event_nodes.append(wait_sync)
+    return [node for node in sync_and_event_nodes if not node.empty]
 
 
-def gen_2_real_stream_code_by_arch(super_operator, arch, super_kernel_params_str, exits_dynamic_op, sub_ops):
-    super_kernel_file = f"__aicore__ inline void \
-auto_gen_{super_operator.kernel_name}_kernel_{arch}(void) {{\n"
-    super_kernel_file += "    GM_ADDR *param_base = (GM_ADDR *)get_para_base();\n"
-    if exits_dynamic_op is True:
-        super_kernel_file += "    uint64_t aiv_func_addr = 0;\n"
-        super_kernel_file += "    uint64_t aic_func_addr = 0;\n"
-        super_kernel_file += "    uint64_t dy_blockDim = 0;\n"
-        if super_operator.split_mode > 1:
-            for i in range(1, super_operator.split_mode):
-                super_kernel_file += f"    uint64_t aiv_func_addr_split{i} = 0;\n"
-                super_kernel_file += f"    uint64_t aic_func_addr_split{i} = 0;\n"
-
-    if super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadByWhole:
-        super_kernel_file += indent_code_func(f"AscendC::PreLoad(8);\n")
+def gen_sync_and_event_code_for_two_stream(super_operator, pre_sub_operator, sub_operator, arch):
+    return gen_code_of_nodes( \
+        build_sync_and_event_nodes_for_two_stream(super_operator, pre_sub_operator, sub_operator, arch), 1)
 
-    for pre_sub_operator, sub_operator, next_sub_operator in zip([None] + sub_ops[:-1], \
-            sub_ops, sub_ops[1:] + [None]):
-        super_kernel_file += indent_code_func(f"//begin func call of sub operator {sub_operator.kernel_name}\n")
 
-        # generate switch case func of dynamic
-        super_kernel_file += gen_switch_case_call_block_of_dynamic_op(super_operator, next_sub_operator, \
-                                                sub_operator, pre_sub_operator)
-
-        # add preload of current func
-        if super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadStepByStep:
-            super_kernel_file += indent_code_func(sub_operator.preload_call_block)
-
-        # add preload of next func, when n+1 preload instr；
-        if super_operator.preload_mode == SuperKernelPreLoadMode.PreloadByAdanvanceStep:
-            if pre_sub_operator is None:
-                super_kernel_file += indent_code_func(sub_operator.preload_call_block)
-            if next_sub_operator is not None:
-                super_kernel_file += indent_code_func(next_sub_operator.preload_call_block)
-
-        if super_operator.datacache_mode == SuperKernelDataCacheMode.DataCacheLoadAdancanceStep:
-            if pre_sub_operator is None:
-                super_kernel_file += indent_code_func(sub_operator.data_cache_preload_call)
-            if next_sub_operator is not None:
-                super_kernel_file += indent_code_func(next_sub_operator.data_cache_preload_call)
-            super_kernel_file += "\n"
+def emit_2_real_stream_code_by_arch(super_operator, emitter, arch, super_kernel_params_str, exits_dynamic_op, \
+        sub_ops):
+    emitter.write(f"__aicore__ inline void \
+auto_gen_{super_operator.kernel_name}_kernel_{arch}(void) {{\n")
+    with emitter.indent():
+        emitter.emit("GM_ADDR *param_base = (GM_ADDR *)get_para_base();\n")
+        if exits_dynamic_op is True:
+            emitter.emit("uint64_t aiv_func_addr = 0;\n")
+            emitter.emit("uint64_t aic_func_addr = 0;\n")
+            emitter.emit("uint64_t dy_blockDim = 0;\n")
+            if super_operator.split_mode > 1:
+                for i in range(1, super_operator.split_mode):
+                    emitter.emit(f"uint64_t aiv_func_addr_split{i} = 0;\n")
+                    emitter.emit(f"uint64_t aic_func_addr_split{i} = 0;\n")
 
-        if pre_sub_operator is None and len(sub_operator.recv_event_list) != 0 and sub_operator.index == 0:
-            CommonUtility().ascendc_raise_python_err(ERR_CODE, \
-f"first op of super kernel must not have any recv event, op:{sub_operator.kernel_name}, \
-event_list:{sub_operator.recv_event_list}")
+        if super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadByWhole:
+            emitter.emit(f"AscendC::PreLoad(8);\n")
 
-        super_kernel_file += \
-            gen_sync_and_event_code_for_two_stream(super_operator, pre_sub_operator, sub_operator, arch)
-
-        tmp_code, enable_syncall_flag = gen_feed_syncall_var_init_code(super_operator, sub_operator)
-        super_kernel_file += indent_code_func(tmp_code)
-        # 0x0 represents record the time of super kernel op, 0x4 is notify event, 0x8 is sub op, 0xC is wait event
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            super_kernel_file += \
-                indent_code_func(f"RecordProfiling({super_operator.info_base.index(sub_operator) + 1}, 0x8, true);\n")
-        if enable_syncall_flag is False:
-            super_kernel_file += indent_code_func(sub_operator.kernel_call_block)
-        else:
-            super_kernel_file += indent_code_func(sub_operator.kernel_call_block_with_syncall)
-        super_kernel_file += indent_code_func(gen_op_end_debug_dcci_all(super_operator))
-        super_kernel_file += indent_code_func(gen_2_real_stream_op_end_debug_sync_all_by_arch(super_operator, arch))
+        emit_super_kernel_body(super_operator, emitter, build_2_real_stream_body(super_operator, arch, sub_ops))
+    emitter.write(f'}}\n\n')
 
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            super_kernel_file += \
-                indent_code_func(f"RecordProfiling({super_operator.info_base.index(sub_operator) + 1}, 0x8, false);\n")
 
-        if next_sub_operator is None:
-            # last sub operator of que but not last sub operator in op list
-            # allow send // lack : need check not last op dfx
-            # last op send inter-core sync but not last op
-            send_code = gen_2_real_stream_send_code(super_operator, sub_operator, arch)
-            if sub_operator.index == super_operator.info_base[-1].index and send_code != '':
-                CommonUtility().ascendc_raise_python_err(ERR_CODE, \
-f"last op of super kernel must not have any send info, op:{sub_operator.kernel_name}, \
-event_list:{sub_operator.send_info}")
-            super_kernel_file += indent_code_func(send_code)
-            if len(sub_operator.send_event_list) != 0:
-                if sub_operator.index == super_operator.info_base[-1].index:
-                    CommonUtility().ascendc_raise_python_err(ERR_CODE, \
-f"last op of super kernel must not have any send event, op:{sub_operator.kernel_name}, \
-event_list:{sub_operator.send_event_list}")
-                super_kernel_file += indent_code_func(sub_operator.notify_block[arch])
-        pre_sub_operator = sub_operator
-    super_kernel_file += f'}}\n\n'
-    return super_kernel_file
+def gen_2_real_stream_code_by_arch(super_operator, arch, super_kernel_params_str, exits_dynamic_op, sub_ops):
+    emitter = CodeEmitter()
+    emit_2_real_stream_code_by_arch(super_operator, emitter, arch, super_kernel_params_str, exits_dynamic_op, sub_ops)
+    return emitter.getvalue()
 
 
 def gen_profling_func_code(super_operator):
@@ -586,89 +577,102 @@ def gen_profiling_start_and_end_record(super_operator, is_start):
     return code
 
 
-def gen_2_real_stream_super_kernel_file(super_operator):
-    super_kernel_file = ""
-    super_kernel_file += gen_file_header(super_operator.kernel_type, super_operator.split_mode)
-    super_kernel_file += gen_profling_func_code(super_operator)
-    super_kernel_file += gen_notify_wait_func()
+@contextmanager
+def open_super_kernel_file(super_operator):
+    """stream generated code into a temporary file, which is published as kernel_file once generation ends"""
+    try:
+        emitter = FileCodeEmitter(super_operator.kernel_file)
+    except OSError as err:
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, ("gen super kernel func file failed, reason is:", err))
+    with emitter:
+        yield emitter
+        try:
+            if super_operator.content_naming:
+                super_operator.set_content_named_kernel_file(emitter.hexdigest())
+            emitter.commit(super_operator.kernel_file, keep_existing=super_operator.content_naming)
+        except OSError as err:
+            CommonUtility().ascendc_raise_python_err(ERR_CODE, ("gen super kernel func file failed, reason is:", err))
+
+
+def write_super_kernel_file(super_operator, super_kernel_file):
+    with open_super_kernel_file(super_operator) as emitter:
+        emitter.write(super_kernel_file)
+
+
+def emit_super_kernel_declares(super_operator, emitter):
+    """declares of sub kernels, return super kernel params and whether any sub op is dynamic"""
     super_kernel_params = []
-    sub_ops = super_operator.info_base
     exits_dynamic_op = False
-    for _, sub_operator in enumerate(sub_ops):
+    for sub_operator in super_operator.info_base:
         if super_operator.sub_decl_list.get(sub_operator.kernel_name) is None:
-            super_kernel_file += sub_operator.kernel_declare
+            emitter.write(sub_operator.kernel_declare)
         super_kernel_params += sub_operator.kernel_params
         if sub_operator.sub_op_task_type is SubOperatorType.DYNAMIC_OP:
             if super_operator.sub_decl_list.get(sub_operator.kernel_name) is None:
-                super_kernel_file += sub_operator.dynamic_impl_func_block
+                emitter.write(sub_operator.dynamic_impl_func_block)
             super_kernel_params += sub_operator.extra_kernel_params
             exits_dynamic_op = True
         elif sub_operator.sub_op_task_type is SubOperatorType.STATIC_OP:
             super_kernel_params += sub_operator.extra_kernel_params
         super_operator.sub_decl_list[sub_operator.kernel_name] = '1'
+    return super_kernel_params, exits_dynamic_op
+
+
+def emit_2_real_stream_super_kernel_code(super_operator, emitter):
+    emitter.write(gen_file_header(super_operator.kernel_type, super_operator.split_mode))
+    emitter.write(gen_profling_func_code(super_operator))
+    emitter.write(gen_notify_wait_func())
+    super_kernel_params, exits_dynamic_op = emit_super_kernel_declares(super_operator, emitter)
 
     super_kernel_params_str = ', '.join([f"GM_ADDR {param}" for param in super_kernel_params])
     for sub_ops, arch in zip([super_operator.cub_op_list, super_operator.vec_op_list], ['aic', 'aiv']):
         if len(sub_ops) == 0:
             continue
-        super_kernel_file += \
-            gen_2_real_stream_code_by_arch(super_operator, arch, super_kernel_params_str, exits_dynamic_op, sub_ops)
+        emit_2_real_stream_code_by_arch(super_operator, emitter, arch, super_kernel_params_str, exits_dynamic_op, \
+            sub_ops)
     # func align default size is 512
     align_size = super_operator.op_options.get('func-align', 512)
     func_attribute = gen_func_align_attribute(align_size)
 
-    super_kernel_file += f"extern \"C\"  __global__ {func_attribute} __aicore__ void \
-auto_gen_{super_operator.kernel_name}_kernel(void) {{\n"
-    super_kernel_file += "    GM_ADDR *param_base = (GM_ADDR *)get_para_base();\n"
-    if super_operator.timestamp_option or \
-        super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllEnable:
-        ws_offset = len(super_operator.super_kernel_params) + 1
-        super_kernel_file += f"    GM_ADDR workspace = param_base[{ws_offset}];\n"
-    if super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllEnable:
-        super_kernel_file += f"    AscendC::g_superKernelAutoSyncAllConfigGmBaseAddr = workspace;\n"
-    if super_operator.timestamp_option:
-        is_mix = super_operator.kernel_type in \
-            [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]
-        # each core allocates 1 MB for dump, 1048576 = 1 * 1024 *1024
-        super_kernel_file += gen_super_dump_code(is_mix, 1048576, super_operator.workspace_size)
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            profiling_offset = ws_offset + 1
-            super_kernel_file += f"    GM_ADDR profilingPtr = param_base[{profiling_offset}];\n"
-            super_kernel_file += \
-                f"    uint32_t taskId = *((__gm__ uint32_t*)(get_para_base() + 8 * {profiling_offset + 1}));\n"
-            super_kernel_file += "    InitProfiling(taskId, profilingPtr);\n"
-    else:
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            profiling_offset = len(super_operator.super_kernel_params) + 1
-            super_kernel_file += f"    GM_ADDR profilingPtr = param_base[{profiling_offset}];\n"
-            super_kernel_file += \
-                f"    uint32_t taskId = *((__gm__ uint32_t*)(get_para_base() + 8 * {profiling_offset + 1}));\n"
-            super_kernel_file += "    InitProfiling(taskId, profilingPtr);\n"
-
-    super_kernel_file += "    GM_ADDR ffts_addr = param_base[0];\n"
-    super_kernel_file += "    if (ffts_addr != nullptr) {\n"
-    super_kernel_file += "        set_ffts_base_addr((uint64_t)ffts_addr);\n"
-    super_kernel_file += "    }\n\n"
-    super_kernel_file += indent_code_func(gen_profiling_start_and_end_record(super_operator, True))
-    super_kernel_file += indent_code_func(gen_clear_syncall_worskspace(super_operator))
-    for sub_ops, arch in zip([super_operator.cub_op_list, super_operator.vec_op_list], ['aic', 'aiv']):
-        if len(sub_ops) == 0:
-            continue
-        super_kernel_file += indent_code_func(f'if ASCEND_IS_{arch.upper()} {{\n')
-        super_kernel_file += \
-indent_code_func(f'    auto_gen_{super_operator.kernel_name}_kernel_{arch}();\n')
-        super_kernel_file += indent_code_func(f'}}\n')
+    emitter.write(f"extern \"C\"  __global__ {func_attribute} __aicore__ void \
+auto_gen_{super_operator.kernel_name}_kernel(void) {{\n")
+    with emitter.indent():
+        emitter.emit("GM_ADDR *param_base = (GM_ADDR *)get_para_base();\n")
+        if super_operator.timestamp_option or \
+            super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllEnable:
+            ws_offset = len(super_operator.super_kernel_params) + 1
+            emitter.emit(f"GM_ADDR workspace = param_base[{ws_offset}];\n")
+        emitter.emit(gen_sync_all_base_addr_code(super_operator))
+        if super_operator.timestamp_option:
+            is_mix = super_operator.kernel_type in \
+                [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]
+            # each core allocates 1 MB for dump, 1048576 = 1 * 1024 *1024
+            emitter.write(gen_super_dump_code(is_mix, 1048576, super_operator.workspace_size))
+            if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
+                emit_init_profiling(emitter, ws_offset + 1)
+        else:
+            if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
+                emit_init_profiling(emitter, len(super_operator.super_kernel_params) + 1)
 
-    super_kernel_file += gen_clear_wait_sync_addr_code(super_operator)
-    super_kernel_file += indent_code_func(gen_profiling_start_and_end_record(super_operator, False))
-    super_kernel_file += "}\n\n"
+        emit_set_ffts_base_addr(emitter)
+        emitter.emit(gen_profiling_start_and_end_record(super_operator, True))
+        emitter.emit(gen_clear_syncall_worskspace(super_operator))
+        for sub_ops, arch in zip([super_operator.cub_op_list, super_operator.vec_op_list], ['aic', 'aiv']):
+            if len(sub_ops) == 0:
+                continue
+            emitter.emit(f'if ASCEND_IS_{arch.upper()} {{\n')
+            emitter.emit(f'    auto_gen_{super_operator.kernel_name}_kernel_{arch}();\n')
+            emitter.emit(f'}}\n')
 
-    try:
-        with os.fdopen(os.open(super_operator.kernel_file, \
-            os.O_RDWR | os.O_CREAT, stat.S_IWUSR | stat.S_IRUSR), 'w') as ofd:
-            ofd.write(super_kernel_file)
-    except Exception as err:
-        CommonUtility().ascendc_raise_python_err(ERR_CODE, "gen super kernel func file failed, reason is:", err)
+        emitter.write(gen_clear_wait_sync_addr_code(super_operator))
+        emitter.emit(gen_sync_all_epoch_advance_code(super_operator))
+        emitter.emit(gen_profiling_start_and_end_record(super_operator, False))
+    emitter.write("}\n\n")
+
+
+def gen_2_real_stream_super_kernel_file(super_operator):
+    with open_super_kernel_file(super_operator) as emitter:
+        emit_2_real_stream_super_kernel_code(super_operator, emitter)
 
 
 def judge_need_feed_sync_all(super_operator, sub_op):
@@ -717,9 +721,57 @@ AscendC::g_superKernelAutoSyncAllConfigGmBaseAddr + {total_op_num} * 64 + {sub_o
     return code, True
 
 
+def gen_sync_all_base_addr_code(super_operator):
+    if super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllDisable:
+        return ""
+    if not super_operator.sync_all_epoch:
+        return f"AscendC::g_superKernelAutoSyncAllConfigGmBaseAddr = workspace;\n"
+    # each core keeps its own epoch, every core of every launch advances it once,
+    # so all cores of a launch read the same epoch without any sync
+    table_size = super_operator.get_sync_all_table_size()
+    aic_num, _ = get_core_num(super_operator.kernel_type, super_operator.block_dim)
+    return f"""
+uint32_t syncAllCoreIdx = 0;
+if ASCEND_IS_AIC {{
+    syncAllCoreIdx = get_block_idx();
+}}
+if ASCEND_IS_AIV {{
+    syncAllCoreIdx = {aic_num} + AscendC::GetBlockIdx();
+}}
+__gm__ volatile uint64_t* syncAllEpochAddr = \
+(__gm__ volatile uint64_t*)(workspace + {2 * table_size} + syncAllCoreIdx * {SYNC_ALL_SLOT_SIZE});
+dcci(syncAllEpochAddr, 0, 2);
+uint64_t syncAllEpoch = *syncAllEpochAddr;
+AscendC::g_superKernelAutoSyncAllConfigGmBaseAddr = workspace + (syncAllEpoch & 1) * {table_size};
+"""
+
+
+def gen_sync_all_epoch_advance_code(super_operator):
+    if super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllDisable or \
+            not super_operator.sync_all_epoch:
+        return ""
+    # table of next epoch is not used in this launch, cores clear it in turn without any sync,
+    # and the end of this launch orders the clearing before the next launch
+    table_size = super_operator.get_sync_all_table_size()
+    aic_num, aiv_num = get_core_num(super_operator.kernel_type, super_operator.block_dim)
+    slot_len = SYNC_ALL_SLOT_SIZE // 8
+    return f"""
+__gm__ uint64_t* syncAllNextTable = (__gm__ uint64_t*)(workspace + ((syncAllEpoch + 1) & 1) * {table_size});
+for (uint32_t slot = syncAllCoreIdx; slot < {table_size // SYNC_ALL_SLOT_SIZE}; slot += {aic_num + aiv_num}) {{
+    for (uint32_t i = 0; i < {slot_len}; i++) {{
+        syncAllNextTable[slot * {slot_len} + i] = 0;
+    }}
+    dcci(syncAllNextTable + slot * {slot_len}, 0, 2);
+}}
+*syncAllEpochAddr = syncAllEpoch + 1;
+dcci(syncAllEpochAddr, 0, 2);
+"""
+
+
 def gen_clear_syncall_worskspace(super_operator):
     gen_code = ""
-    if super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllDisable:
+    if super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllDisable or \
+            super_operator.sync_all_epoch:
         return gen_code
      # To init workspace data, firstly init 512 Bytes to 0 in l1/ub buffer,
      # and repeatedly copy this data to gm according to the total init data amount
@@ -768,7 +820,7 @@ if ASCEND_IS_AIV {{
             workspace_size = int(super_operator.workspace_size)
         else:
             workspace_size = int(super_operator.workspace_size / 2)
-        if CommonUtility.is_c310():
+        if get_compile_context().is_c310():
             gen_code += \
 f"""
 if ASCEND_IS_AIV {{
@@ -834,129 +886,149 @@ def gen_wait_block_extra_sync(super_operator, pre_sub_operator, sub_operator):
     return extra_sync
 
 
-def gen_sync_and_event_code(super_operator, pre_sub_operator, sub_operator):
-    sync_and_event_code = ""
+def build_sync_and_event_nodes(super_operator, pre_sub_operator, sub_operator):
+    sync_and_event_nodes = []
     if len(sub_operator.recv_event_list) != 0 and len(pre_sub_operator.send_event_list) != 0:
-        sync_and_event_code += indent_code_func(gen_inter_ops_barrier(super_operator,
-                                                                    pre_sub_operator,
-                                                                    sub_operator))
-        sync_and_event_code += indent_code_func(pre_sub_operator.notify_block)
+        sync_and_event_nodes.append(build_inter_ops_barrier_node(super_operator, pre_sub_operator, sub_operator))
+        sync_and_event_nodes.append(CodeGenNode(NodeKind.NOTIFY, pre_sub_operator.notify_block, \
+            sub_op=pre_sub_operator))
         if len(sub_operator.wait_block) != 0:
-            sync_and_event_code += indent_code_func(sub_operator.wait_block)
+            sync_and_event_nodes.append(CodeGenNode(NodeKind.WAIT, sub_operator.wait_block, sub_op=sub_operator))
             # add sync with sub_operator and sub_operator
-            sync_and_event_code += "// reason3: for continues notify/wait event\n"
-            sync_and_event_code += \
-                    indent_code_func(get_sync_code_by_kernel_type(super_operator.kernel_type))
+            wait_sync = CodeGenNode(NodeKind.BARRIER, "// reason3: for continues notify/wait event\n", \
+                indented=False, sub_op=sub_operator, scope=get_barrier_scope_by_kernel_type(super_operator.kernel_type))
+            wait_sync.add_code(get_sync_code_by_kernel_type(super_operator.kernel_type))
+            sync_and_event_nodes.append(wait_sync)
     else:
         if len(sub_operator.recv_event_list) != 0:
-            sync_and_event_code += indent_code_func(sub_operator.wait_block)
-            sync_and_event_code += \
-                indent_code_func(gen_wait_block_extra_sync(super_operator, pre_sub_operator, sub_operator))
-        sync_and_event_code += indent_code_func(gen_inter_ops_barrier(super_operator,
-                                                                    pre_sub_operator,
-                                                                    sub_operator))
+            sync_and_event_nodes.append(CodeGenNode(NodeKind.WAIT, sub_operator.wait_block, sub_op=sub_operator))
+            sync_and_event_nodes.append(CodeGenNode(NodeKind.BARRIER, \
+                gen_wait_block_extra_sync(super_operator, pre_sub_operator, sub_operator), \
+                sub_op=sub_operator, scope=BarrierScope.AIV_ALL))
+        sync_and_event_nodes.append(build_inter_ops_barrier_node(super_operator, pre_sub_operator, sub_operator))
         if len(pre_sub_operator.send_event_list) != 0:
-            sync_and_event_code += indent_code_func(pre_sub_operator.notify_block)
-    return sync_and_event_code
+            sync_and_event_nodes.append(CodeGenNode(NodeKind.NOTIFY, pre_sub_operator.notify_block, \
+                sub_op=pre_sub_operator))
+    return [node for node in sync_and_event_nodes if not node.empty]
 
 
-def gen_super_kernel_file(super_operator):
-    if super_operator.enable_double_stream:
-        gen_2_real_stream_super_kernel_file(super_operator)
-        return
-    super_kernel_file = ""
-    super_kernel_file += gen_file_header(super_operator.kernel_type, super_operator.split_mode)
-    super_kernel_file += gen_profling_func_code(super_operator)
-    super_kernel_file += gen_notify_wait_func()
-    sub_ops = super_operator.info_base
-    exits_dynamic_op = False
-    for _, sub_operator in enumerate(sub_ops):
-        if super_operator.sub_decl_list.get(sub_operator.kernel_name) is None:
-            super_kernel_file += sub_operator.kernel_declare
-        if sub_operator.sub_op_task_type is SubOperatorType.DYNAMIC_OP:
-            if super_operator.sub_decl_list.get(sub_operator.kernel_name) is None:
-                super_kernel_file += sub_operator.dynamic_impl_func_block
-            exits_dynamic_op = True
-        super_operator.sub_decl_list[sub_operator.kernel_name] = '1'
-
-    # func align default size is 512
-    align_size = super_operator.op_options.get('func-align', 512)
-    func_attribute = gen_func_align_attribute(align_size)
-    super_kernel_file += f"extern \"C\"  __global__ {func_attribute} __aicore__ void \
-auto_gen_{super_operator.kernel_name}_kernel(void) {{\n"
-    super_kernel_file += "    GM_ADDR *param_base = (GM_ADDR *)get_para_base();\n"
-    if super_operator.timestamp_option or \
-        super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllEnable:
-        if CommonUtility.is_c310():
-            ws_offset = len(super_operator.super_kernel_params)
-        else:
-            ws_offset = len(super_operator.super_kernel_params) + 1
-        super_kernel_file += f"    GM_ADDR workspace = param_base[{ws_offset}];\n"
-    if super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllEnable:
-        super_kernel_file += f"    AscendC::g_superKernelAutoSyncAllConfigGmBaseAddr = workspace;\n"
-    if super_operator.timestamp_option:
-        is_mix = super_operator.kernel_type in \
-            [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]
-        # each core allocates 1 MB for dump, 1048576 = 1 * 1024 *1024
-        super_kernel_file += gen_super_dump_code(is_mix, 1048576, super_operator.workspace_size)
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            profiling_offset = ws_offset + 1
-            super_kernel_file += f"    GM_ADDR profilingPtr = param_base[{profiling_offset}];\n"
-            super_kernel_file += \
-                f"    uint32_t taskId = *((__gm__ uint32_t*)(get_para_base() + 8 * {profiling_offset + 1}));\n"
-            super_kernel_file += "    InitProfiling(taskId, profilingPtr);\n"
+def gen_sync_and_event_code(super_operator, pre_sub_operator, sub_operator):
+    return gen_code_of_nodes(build_sync_and_event_nodes(super_operator, pre_sub_operator, sub_operator), 1)
+
+
+def get_codegen_passes(super_operator):
+    """passes run in order on each super kernel body before it is printed"""
+    codegen_passes = []
+    if get_extension_option(super_operator.op_options, 'remove-redundant-sync'):
+        codegen_passes.append(RedundantBarrierPass())
+    return codegen_passes
+
+
+def gen_preload_plan(super_operator, sub_ops, archs):
+    """{id of sub op: [(arch, sub op preloaded right before it runs)]}, None when lookahead preload is disabled"""
+    lookahead = get_extension_option(super_operator.op_options, 'preload-lookahead')
+    if lookahead == 0:
+        return None
+    preload_plan = {}
+    for arch in archs:
+        for key, targets in gen_icache_preload_plan(sub_ops, arch, lookahead).items():
+            preload_plan.setdefault(key, []).extend((arch, target) for target in targets)
+    return preload_plan
+
+
+def gen_data_cache_preload_plan_of_body(super_operator, sub_ops):
+    """{id of sub op: [cache lines of param table preloaded right before it runs]}, None when disabled"""
+    lookahead = get_extension_option(super_operator.op_options, 'preload-data-lookahead')
+    if lookahead == 0:
+        return None
+    return gen_data_cache_preload_plan(sub_ops, lookahead)
+
+
+def gen_data_cache_preload_code(sub_operator, lines):
+    data_cache_preload_call = f"// begin add dc preload of sub_operator: {sub_operator.kernel_name}\n"
+    for line in lines:
+        data_cache_preload_call += \
+            f"dc_preload((__gm__ uint64_t *)(param_base + {line * DATA_CACHE_LINE_PARAMS}), 0);\n"
+    return data_cache_preload_call
+
+
+def build_preload_nodes(super_operator, pre_sub_operator, sub_operator, next_sub_operator, preload_plan=None, \
+        data_cache_preload_plan=None):
+    preload_nodes = []
+    # add preload of sub ops planned within icache capacity, instead of preload-code mode
+    if preload_plan is not None:
+        for arch, target in preload_plan[id(sub_operator)]:
+            preload_nodes.append(CodeGenNode(NodeKind.PRELOAD, target.preload_call_blocks[arch], sub_op=target))
+
+    # add preload of current func
+    elif super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadStepByStep:
+        preload_nodes.append(CodeGenNode(NodeKind.PRELOAD, sub_operator.preload_call_block, sub_op=sub_operator))
+
+    # add preload of next func, when n+1 preload instr
+    elif super_operator.preload_mode == SuperKernelPreLoadMode.PreloadByAdanvanceStep:
+        if pre_sub_operator is None:
+            preload_nodes.append(CodeGenNode(NodeKind.PRELOAD, sub_operator.preload_call_block, \
+                sub_op=sub_operator))
+        if next_sub_operator is not None:
+            preload_nodes.append(CodeGenNode(NodeKind.PRELOAD, next_sub_operator.preload_call_block, \
+                sub_op=next_sub_operator))
+
+    # add data cache preload of param table lines planned ahead, instead of preload-data mode
+    if data_cache_preload_plan is not None:
+        lines = data_cache_preload_plan[id(sub_operator)]
+        if len(lines) != 0:
+            preload_nodes.append(CodeGenNode(NodeKind.DATA_CACHE_PRELOAD, \
+                gen_data_cache_preload_code(sub_operator, lines), sub_op=sub_operator))
+            preload_nodes.append(CodeGenNode(NodeKind.CODE, "\n", indented=False))
+    elif super_operator.datacache_mode == SuperKernelDataCacheMode.DataCacheLoadAdancanceStep:
+        if pre_sub_operator is None:
+            preload_nodes.append(CodeGenNode(NodeKind.DATA_CACHE_PRELOAD, sub_operator.data_cache_preload_call, \
+                sub_op=sub_operator))
+        if next_sub_operator is not None:
+            preload_nodes.append(CodeGenNode(NodeKind.DATA_CACHE_PRELOAD, \
+                next_sub_operator.data_cache_preload_call, sub_op=next_sub_operator))
+        preload_nodes.append(CodeGenNode(NodeKind.CODE, "\n", indented=False))
+    return preload_nodes
+
+
+def build_sub_op_call_nodes(super_operator, sub_operator, op_end_debug_sync_all):
+    tmp_code, enable_syncall_flag = gen_feed_syncall_var_init_code(super_operator, sub_operator)
+    call_nodes = [CodeGenNode(NodeKind.CODE, tmp_code, sub_op=sub_operator)]
+    # 0x0 represents record the time of super kernel op, 0x4 is notify event, 0x8 is sub op,
+    # 0xC is wait event
+    profiling_id = super_operator.info_base.index(sub_operator) + 1
+    if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
+        call_nodes.append(CodeGenNode(NodeKind.PROFILING, f"RecordProfiling({profiling_id}, 0x8, true);\n", \
+            sub_op=sub_operator))
+    if enable_syncall_flag is False:
+        call_nodes.append(CodeGenNode(NodeKind.SUB_OP_CALL, sub_operator.kernel_call_block, sub_op=sub_operator))
     else:
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            profiling_offset = len(super_operator.super_kernel_params) + 1
-            super_kernel_file += f"    GM_ADDR profilingPtr = param_base[{profiling_offset}];\n"
-            super_kernel_file += \
-                f"    uint32_t taskId = *((__gm__ uint32_t*)(get_para_base() + 8 * {profiling_offset + 1}));\n"
-            super_kernel_file += "    InitProfiling(taskId, profilingPtr);\n"
-
-    if not CommonUtility.is_c310():
-        super_kernel_file += "    GM_ADDR ffts_addr = param_base[0];\n"
-        super_kernel_file += "    if (ffts_addr != nullptr) {\n"
-        super_kernel_file += "        set_ffts_base_addr((uint64_t)ffts_addr);\n"
-        super_kernel_file += "    }\n\n"
-    super_kernel_file += indent_code_func(gen_clear_syncall_worskspace(super_operator))
-    if exits_dynamic_op is True:
-        super_kernel_file += "    uint64_t aiv_func_addr = 0;\n"
-        super_kernel_file += "    uint64_t aic_func_addr = 0;\n"
-        super_kernel_file += "    uint64_t dy_blockDim = 0;\n"
-        if super_operator.split_mode > 1:
-            for i in range(1, super_operator.split_mode):
-                super_kernel_file += f"    uint64_t aiv_func_addr_split{i} = 0;\n"
-                super_kernel_file += f"    uint64_t aic_func_addr_split{i} = 0;\n"
-
-    if super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadByWhole:
-        super_kernel_file += indent_code_func(f"AscendC::PreLoad(8);\n")
-    super_kernel_file += indent_code_func(gen_profiling_start_and_end_record(super_operator, True))
+        call_nodes.append(CodeGenNode(NodeKind.SUB_OP_CALL, sub_operator.kernel_call_block_with_syncall, \
+            sub_op=sub_operator))
+    call_nodes.append(CodeGenNode(NodeKind.DEBUG, gen_op_end_debug_dcci_all(super_operator), sub_op=sub_operator))
+    call_nodes.append(op_end_debug_sync_all)
+    if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
+        call_nodes.append(CodeGenNode(NodeKind.PROFILING, f"RecordProfiling({profiling_id}, 0x8, false);\n", \
+            sub_op=sub_operator))
+    return call_nodes
+
+
+def build_super_kernel_body(super_operator):
+    body = CodeGenBody()
+    sub_ops = super_operator.info_base
+    preload_plan = gen_preload_plan(super_operator, sub_ops, ['aic', 'aiv'])
+    data_cache_preload_plan = gen_data_cache_preload_plan_of_body(super_operator, sub_ops)
     for pre_sub_operator, sub_operator, next_sub_operator in zip([None] + sub_ops[:-1], \
             sub_ops, sub_ops[1:] + [None]):
-
-        super_kernel_file += indent_code_func(f"//begin func call of sub operator {sub_operator.kernel_name}\n")
+        body.append(CodeGenNode(NodeKind.CODE, f"//begin func call of sub operator {sub_operator.kernel_name}\n", \
+            sub_op=sub_operator))
 
         #generatre switch case func of dynamic
-        super_kernel_file += gen_switch_case_call_block_of_dynamic_op(super_operator, next_sub_operator, \
-                                                sub_operator, pre_sub_operator)
-
-        # add preload of current func
-        if super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadStepByStep:
-            super_kernel_file += indent_code_func(sub_operator.preload_call_block)
-
-        # add preload of next func, when n+1 preload instr
-        if super_operator.preload_mode == SuperKernelPreLoadMode.PreloadByAdanvanceStep:
-            if pre_sub_operator is None:
-                super_kernel_file += indent_code_func(sub_operator.preload_call_block)
-            if next_sub_operator is not None:
-                super_kernel_file += indent_code_func(next_sub_operator.preload_call_block)
-
-        if super_operator.datacache_mode == SuperKernelDataCacheMode.DataCacheLoadAdancanceStep:
-            if pre_sub_operator is None:
-                super_kernel_file += indent_code_func(sub_operator.data_cache_preload_call)
-            if next_sub_operator is not None:
-                super_kernel_file += indent_code_func(next_sub_operator.data_cache_preload_call)
-            super_kernel_file += "\n"
+        body.append(CodeGenNode(NodeKind.CODE, gen_switch_case_call_block_of_dynamic_op(super_operator, \
+            next_sub_operator, sub_operator, pre_sub_operator), indented=False, sub_op=sub_operator))
+
+        body.extend(build_preload_nodes(super_operator, pre_sub_operator, sub_operator, next_sub_operator, \
+            preload_plan, data_cache_preload_plan))
 
         if pre_sub_operator is None and len(sub_operator.recv_event_list) != 0:
             CommonUtility().ascendc_raise_python_err(ERR_CODE, f"first op of super kernel must \
@@ -964,45 +1036,174 @@ not have any recv event, op:{sub_operator.kernel_name}, event_list:{sub_operator
 
         # gen sync/notify/wait between operators
         if pre_sub_operator is not None:
-            super_kernel_file += gen_sync_and_event_code(super_operator, pre_sub_operator, sub_operator)
-
-        tmp_code, enable_syncall_flag = gen_feed_syncall_var_init_code(super_operator, sub_operator)
-        super_kernel_file += indent_code_func(tmp_code)
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            super_kernel_file += \
-                indent_code_func(f"RecordProfiling({super_operator.info_base.index(sub_operator) + 1}, 0x8, true);\n")
-        if enable_syncall_flag is False:
-            super_kernel_file += indent_code_func(sub_operator.kernel_call_block)
-        else:
-            super_kernel_file += indent_code_func(sub_operator.kernel_call_block_with_syncall)
-        super_kernel_file += indent_code_func(gen_op_end_debug_dcci_all(super_operator))
-        super_kernel_file += indent_code_func(gen_op_end_debug_sync_all(super_operator))
+            body.extend(build_sync_and_event_nodes(super_operator, pre_sub_operator, sub_operator))
 
-        if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
-            super_kernel_file += \
-                indent_code_func(f"RecordProfiling({super_operator.info_base.index(sub_operator) + 1}, 0x8, false);\n")
+        body.extend(build_sub_op_call_nodes(super_operator, sub_operator, \
+            CodeGenNode(NodeKind.DEBUG, gen_op_end_debug_sync_all(super_operator), sub_op=sub_operator, \
+                scope=get_barrier_scope_by_kernel_type(super_operator.kernel_type))))
 
         if next_sub_operator is None and len(sub_operator.send_event_list) != 0:
             CommonUtility().ascendc_raise_python_err(ERR_CODE, f"last op of super kernel must \
 not have any send event, op:{sub_operator.kernel_name}, event_list:{sub_operator.send_event_list}")
-        pre_sub_operator = sub_operator
+    return body
 
-    super_kernel_file += gen_clear_wait_sync_addr_code(super_operator)
 
-    super_kernel_file += indent_code_func(gen_profiling_start_and_end_record(super_operator, False))
+def build_2_real_stream_body(super_operator, arch, sub_ops):
+    body = CodeGenBody(arch)
+    preload_plan = gen_preload_plan(super_operator, sub_ops, [arch])
+    data_cache_preload_plan = gen_data_cache_preload_plan_of_body(super_operator, sub_ops)
+    for pre_sub_operator, sub_operator, next_sub_operator in zip([None] + sub_ops[:-1], \
+            sub_ops, sub_ops[1:] + [None]):
+        body.append(CodeGenNode(NodeKind.CODE, f"//begin func call of sub operator {sub_operator.kernel_name}\n", \
+            sub_op=sub_operator))
 
-    super_kernel_file += "}\n\n"
-    try:
-        with os.fdopen(os.open(super_operator.kernel_file, \
-            os.O_RDWR | os.O_CREAT, stat.S_IWUSR | stat.S_IRUSR), 'w') as ofd:
-            ofd.write(super_kernel_file)
-    except Exception as err:
-        CommonUtility().ascendc_raise_python_err(ERR_CODE, ("gen super kernel func file failed, reason is:", err))
+        # generate switch case func of dynamic
+        body.append(CodeGenNode(NodeKind.CODE, gen_switch_case_call_block_of_dynamic_op(super_operator, \
+            next_sub_operator, sub_operator, pre_sub_operator), indented=False, sub_op=sub_operator))
+
+        body.extend(build_preload_nodes(super_operator, pre_sub_operator, sub_operator, next_sub_operator, \
+            preload_plan, data_cache_preload_plan))
+
+        if pre_sub_operator is None and len(sub_operator.recv_event_list) != 0 and sub_operator.index == 0:
+            CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+f"first op of super kernel must not have any recv event, op:{sub_operator.kernel_name}, \
+event_list:{sub_operator.recv_event_list}")
+
+        body.extend(build_sync_and_event_nodes_for_two_stream(super_operator, pre_sub_operator, sub_operator, arch))
+
+        body.extend(build_sub_op_call_nodes(super_operator, sub_operator, \
+            CodeGenNode(NodeKind.DEBUG, gen_2_real_stream_op_end_debug_sync_all_by_arch(super_operator, arch), \
+                sub_op=sub_operator, scope=BarrierScope.AIC_ALL if arch == 'aic' else BarrierScope.AIV_ALL)))
+
+        if next_sub_operator is None:
+            # last sub operator of que but not last sub operator in op list
+            # allow send // lack : need check not last op dfx
+            # last op send inter-core sync but not last op
+            send_nodes = build_2_real_stream_send_nodes(super_operator, sub_operator, arch)
+            if sub_operator.index == super_operator.info_base[-1].index and len(send_nodes) != 0:
+                CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+f"last op of super kernel must not have any send info, op:{sub_operator.kernel_name}, \
+event_list:{sub_operator.send_info}")
+            body.extend(send_nodes)
+            if len(sub_operator.send_event_list) != 0:
+                if sub_operator.index == super_operator.info_base[-1].index:
+                    CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+f"last op of super kernel must not have any send event, op:{sub_operator.kernel_name}, \
+event_list:{sub_operator.send_event_list}")
+                body.append(CodeGenNode(NodeKind.NOTIFY, sub_operator.notify_block[arch], sub_op=sub_operator))
+    return body
+
+
+def emit_super_kernel_body(super_operator, emitter, body):
+    run_codegen_passes(super_operator, body, get_codegen_passes(super_operator))
+    print_codegen_nodes(emitter, body.nodes)
 
 
-def compile(kernel_infos, called_kernel_name="ascendc_super_kernel_plus", impl_mode=""):
+def emit_init_profiling(emitter, profiling_offset):
+    emitter.emit(f"GM_ADDR profilingPtr = param_base[{profiling_offset}];\n")
+    emitter.emit(f"uint32_t taskId = *((__gm__ uint32_t*)(get_para_base() + 8 * {profiling_offset + 1}));\n")
+    emitter.emit("InitProfiling(taskId, profilingPtr);\n")
+
+
+def emit_set_ffts_base_addr(emitter):
+    emitter.emit("GM_ADDR ffts_addr = param_base[0];\n")
+    emitter.emit("if (ffts_addr != nullptr) {\n")
+    emitter.emit("    set_ffts_base_addr((uint64_t)ffts_addr);\n")
+    emitter.emit("}\n\n")
+
+
+def emit_super_kernel_code(super_operator, emitter):
+    emitter.write(gen_file_header(super_operator.kernel_type, super_operator.split_mode))
+    emitter.write(gen_profling_func_code(super_operator))
+    emitter.write(gen_notify_wait_func())
+    sub_ops = super_operator.info_base
+    _, exits_dynamic_op = emit_super_kernel_declares(super_operator, emitter)
+
+    # func align default size is 512
+    align_size = super_operator.op_options.get('func-align', 512)
+    func_attribute = gen_func_align_attribute(align_size)
+    emitter.write(f"extern \"C\"  __global__ {func_attribute} __aicore__ void \
+auto_gen_{super_operator.kernel_name}_kernel(void) {{\n")
+    with emitter.indent():
+        emitter.emit("GM_ADDR *param_base = (GM_ADDR *)get_para_base();\n")
+        if super_operator.timestamp_option or \
+            super_operator.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllEnable:
+            if get_compile_context().is_c310():
+                ws_offset = len(super_operator.super_kernel_params)
+            else:
+                ws_offset = len(super_operator.super_kernel_params) + 1
+            emitter.emit(f"GM_ADDR workspace = param_base[{ws_offset}];\n")
+        emitter.emit(gen_sync_all_base_addr_code(super_operator))
+        if super_operator.timestamp_option:
+            is_mix = super_operator.kernel_type in \
+                [KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]
+            # each core allocates 1 MB for dump, 1048576 = 1 * 1024 *1024
+            emitter.write(gen_super_dump_code(is_mix, 1048576, super_operator.workspace_size))
+            if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
+                emit_init_profiling(emitter, ws_offset + 1)
+        else:
+            if super_operator.profiling_mode is SuperKernelProfilingMode.ProfilingEnable:
+                emit_init_profiling(emitter, len(super_operator.super_kernel_params) + 1)
+
+        if not get_compile_context().is_c310():
+            emit_set_ffts_base_addr(emitter)
+        emitter.emit(gen_clear_syncall_worskspace(super_operator))
+        if exits_dynamic_op is True:
+            emitter.emit("uint64_t aiv_func_addr = 0;\n")
+            emitter.emit("uint64_t aic_func_addr = 0;\n")
+            emitter.emit("uint64_t dy_blockDim = 0;\n")
+            if super_operator.split_mode > 1:
+                for i in range(1, super_operator.split_mode):
+                    emitter.emit(f"uint64_t aiv_func_addr_split{i} = 0;\n")
+                    emitter.emit(f"uint64_t aic_func_addr_split{i} = 0;\n")
+
+        if super_operator.preload_mode == SuperKernelPreLoadMode.PreLoadByWhole:
+            emitter.emit(f"AscendC::PreLoad(8);\n")
+        emitter.emit(gen_profiling_start_and_end_record(super_operator, True))
+        emit_super_kernel_body(super_operator, emitter, build_super_kernel_body(super_operator))
+
+        emitter.write(gen_clear_wait_sync_addr_code(super_operator))
+        emitter.emit(gen_sync_all_epoch_advance_code(super_operator))
+
+        emitter.emit(gen_profiling_start_and_end_record(super_operator, False))
+
+    emitter.write("}\n\n")
+
+
+def gen_super_kernel_file(super_operator):
+    with open_super_kernel_file(super_operator) as emitter:
+        if super_operator.enable_double_stream:
+            emit_2_real_stream_super_kernel_code(super_operator, emitter)
+        else:
+            emit_super_kernel_code(super_operator, emitter)
+
+
+def check_super_kernel_infos(kernel_infos):
+    compile_context = get_compile_context()
+    if not compile_context.is_support_super_kernel():
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+        f'current soc: {compile_context.get_soc_spec("SHORT_SOC_VERSION")} series do not support super kernel feature')
+
+    if kernel_infos.get("op_list", "") == "":
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, ("super kernel compile must provide op lists"))
+
+
+def get_compile_cache(kernel_meta_dir, cache_dir, enable_cache):
+    if not enable_cache:
+        return None
+    if cache_dir is None:
+        cache_dir = SuperKernelCompileCache.get_default_cache_dir(kernel_meta_dir)
+    return SuperKernelCompileCache(cache_dir)
+
+
+def compile(kernel_infos, called_kernel_name="ascendc_super_kernel_plus", impl_mode="", cache_dir=None, \
+        enable_cache=True, incremental=False, jobs=1, compile_context=None, content_naming=False):
     """ entry of super kernel compile
 
+        besides <called_kernel_name>.o and .json, <called_kernel_name>_workspace_plan.json is written to
+        kernel_meta, host places workspaces of sub ops in one arena by load_workspace_plan and
+        patch_workspace_args of super_kernel_workspace_plan
+
         Args:
             kernel_infos: infos of sub kernel
                 {
@@ -1010,21 +1211,241 @@ def compile(kernel_infos, called_kernel_name="ascendc_super_kernel_plus", impl_m
                         [{"op1": {"bin_path": "", "json_path": ""}, "op2": {xxx}}],
                     "super_kernel_options": compile_option
                 }
+                a dynamic op may give "tiling_key_profile": {tiling_key: call count} from a profiling run,
+                its tiling keys are then dispatched hottest first
+                an op may give "estimated_duration" in us, used by cost model when super kernel option
+                cost-model=1 chooses kernel type and block dim
             called_kernel_name: super kernel name
+            cache_dir: dir of compile cache, default is $ASCEND_SUPER_KERNEL_CACHE_DIR or
+                <kernel_meta>/super_kernel_cache
+            enable_cache: reuse linked super kernel when sub ops, options, soc and toolchain are unchanged
+            incremental: keep extracted, split and generated artifacts of every sub op under
+                <kernel_meta>/super_kernel_sub_op_artifacts, only changed sub ops are prepared again
+            jobs: max worker threads preparing sub ops (json load, unpack, .text size, split clones),
+                0 means cpu count, generated code keeps op_list order for any value
+            compile_context: SuperKernelCompileContext of this compile, default is a snapshot of global
+                build config taken after global_var_storage reset, see running_compile
+            content_naming: name generated source, split objects and rename files by their content instead
+                of pid tag and fixed names, identical compiles in different processes share these files
     """
-    # global_var_storage must be reset before every entry of compile
-    global_var_storage.global_storage_reset()
-    if not CommonUtility.is_support_super_kernel():
-        CommonUtility().ascendc_raise_python_err(ERR_CODE, \
-        f'current soc: {get_soc_spec("SHORT_SOC_VERSION")} series do not support super kernel feature')
+    with running_compile(compile_context) as compile_context:
+        super_operator, compile_cache, cache_key = prepare_super_kernel(kernel_infos, called_kernel_name, \
+            impl_mode, cache_dir, enable_cache, incremental, jobs, compile_context=compile_context, \
+            content_naming=content_naming)
+        if super_operator is None:
+            return
+        compile_super_kernel(super_operator, compile_cache, cache_key)
+    return
 
-    kernel_meta_dir = CommonUtility.get_kernel_meta_dir()
-    if os.path.exists(os.path.join(kernel_meta_dir, called_kernel_name + ".o")):
-        return
 
-    if kernel_infos.get("op_list", "") == "":
-        CommonUtility().ascendc_raise_python_err(ERR_CODE, ("super kernel compile must provide op lists"))
-    super_operator = SuperOperatorInfos(kernel_infos, called_kernel_name)
-    gen_super_kernel_file(super_operator)
-    super_kernel_compile(super_operator.compile_info, super_operator.compile_log_path)
-    return
+def check_compile_cancelled(cancel_event, called_kernel_name):
+    if cancel_event is not None and cancel_event.is_set():
+        raise CompileCancelledError(f"compile of super kernel {called_kernel_name} is cancelled")
+
+
+@contextmanager
+def running_compile(compile_context=None, reset=True):
+    """compile context of a compile, the compile is counted as running until the block exits.
+    global_var_storage is reset before the first of overlapping compiles starts, never while another compile
+    still reads global state, so overlapping compiles share one reset. stages in workers enter with reset
+    False to stay counted after their caller gave up on them"""
+    global _running_compile_num
+    with _global_config_lock:
+        if reset and _running_compile_num == 0:
+            global_var_storage.global_storage_reset()
+        if compile_context is None:
+            compile_context = SuperKernelCompileContext.capture()
+        _running_compile_num += 1
+    try:
+        yield compile_context
+    finally:
+        with _global_config_lock:
+            _running_compile_num -= 1
+
+
+def run_compile_stage(compile_context, func, *args):
+    with running_compile(compile_context, reset=False):
+        return func(*args)
+
+
+def prepare_super_kernel(kernel_infos, called_kernel_name, impl_mode="", cache_dir=None, enable_cache=True, \
+        incremental=False, jobs=1, cancel_event=None, compile_context=None, content_naming=False):
+    """everything before bisheng: cache lookup, sub op preparation and code generation.
+    compile_context is taken from running_compile of the caller, default is the context in use.
+    return (super_operator, compile_cache, cache_key), super_operator is None on cache hit.
+    cancel_event is checked between stages, CompileCancelledError is raised once it is set"""
+    if compile_context is None:
+        compile_context = get_compile_context()
+
+    with use_compile_context(compile_context):
+        check_super_kernel_infos(kernel_infos)
+        kernel_meta_dir = compile_context.get_kernel_meta_dir()
+        compile_cache = get_compile_cache(kernel_meta_dir, cache_dir, enable_cache)
+        cache_key = None
+        if compile_cache is not None:
+            cache_key = gen_compile_cache_key(kernel_infos, impl_mode)
+            if cache_key is not None and compile_cache.load(cache_key, kernel_meta_dir, called_kernel_name):
+                return None, compile_cache, cache_key
+
+        check_compile_cancelled(cancel_event, called_kernel_name)
+        artifact_store = None
+        if incremental:
+            artifact_store = SubOpArtifactStore(os.path.join(kernel_meta_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        super_operator = SuperOperatorInfos(kernel_infos, called_kernel_name, artifact_store, jobs, compile_context, \
+            content_naming)
+        check_compile_cancelled(cancel_event, called_kernel_name)
+        gen_super_kernel_file(super_operator)
+        write_workspace_plan(super_operator)
+    return super_operator, compile_cache, cache_key
+
+
+def compile_super_kernel(super_operator, compile_cache=None, cache_key=None, cancel_event=None):
+    check_compile_cancelled(cancel_event, super_operator.kernel_name)
+    with use_compile_context(super_operator.compile_context):
+        super_kernel_compile(super_operator.compile_info, super_operator.compile_log_path)
+        if cache_key is not None:
+            compile_cache.store(cache_key, os.path.dirname(super_operator.kernel_file), super_operator.kernel_name)
+
+
+async def compile_async(kernel_infos, called_kernel_name="ascendc_super_kernel_plus", impl_mode="", \
+        cache_dir=None, enable_cache=True, incremental=False, jobs=1, compile_context=None, content_naming=False, \
+        timeout=None, executor=None):
+    """ asyncio entry of super kernel compile, arguments are the same as compile
+
+        every call captures its own compile context when none is given, so preparation, code generation
+        and bisheng compiles of concurrent calls overlap in executor.
+
+        Args:
+            timeout: seconds before asyncio.TimeoutError is raised, None means no limit
+            executor: concurrent.futures executor running the blocking stages, default executor of the loop
+
+        cancellation and timeout stop the compile at the next stage boundary, a running bisheng is
+        waited for in its worker thread but its result is dropped.
+    """
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+
+    with running_compile(compile_context) as compile_context:
+        def run_in_executor(func, *args):
+            # a stage keeps the compile running until it returns, also after timeout or cancellation
+            return loop.run_in_executor(executor, functools.partial(contextvars.copy_context().run, \
+                run_compile_stage, compile_context, func, *args))
+
+        async def run_stages():
+            super_operator, compile_cache, cache_key = await run_in_executor(prepare_super_kernel, kernel_infos, \
+                called_kernel_name, impl_mode, cache_dir, enable_cache, incremental, jobs, cancel_event, \
+                compile_context, content_naming)
+            if super_operator is not None:
+                await run_in_executor(compile_super_kernel, super_operator, compile_cache, cache_key, cancel_event)
+
+        try:
+            await asyncio.wait_for(run_stages(), timeout)
+        except BaseException:
+            # timeout, cancellation or failure, stop stages not started yet in executor
+            cancel_event.set()
+            raise
+
+
+def compile_many(kernel_infos_list, called_kernel_names=None, impl_mode="", cache_dir=None, enable_cache=True, \
+        jobs=1, compile_context=None, content_naming=False):
+    """ entry of compiling many super kernel scopes at once
+
+        identical scopes are compiled once and restored under the names of the others, sub op artifacts
+        are shared by all scopes, and bisheng compiles of distinct scopes run in parallel.
+
+        Args:
+            kernel_infos_list: kernel_infos of every scope, see compile
+            called_kernel_names: super kernel name of every scope, default is ascendc_super_kernel_plus_<index>
+            cache_dir, enable_cache, compile_context, content_naming: see compile
+            jobs: max worker threads of sub op preparation and of bisheng compiles, 0 means cpu count
+
+        Returns:
+            one result per scope in order of kernel_infos_list:
+                {"kernel_name": str, "status": "compiled" | "cached" | "deduplicated" | "failed",
+                 "error": None or str, "timings": {stage: seconds}}
+    """
+    if called_kernel_names is None:
+        called_kernel_names = [f"ascendc_super_kernel_plus_{index}" for index in range(len(kernel_infos_list))]
+    if len(called_kernel_names) != len(kernel_infos_list):
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+            (f"super kernel compile_many got {len(kernel_infos_list)} scopes but {len(called_kernel_names)} names"))
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    # one reset for the whole batch of scopes
+    with running_compile(compile_context) as compile_context, use_compile_context(compile_context):
+        return compile_scopes(kernel_infos_list, called_kernel_names, impl_mode, cache_dir, enable_cache, jobs, \
+            compile_context, content_naming)
+
+
+def compile_scopes(kernel_infos_list, called_kernel_names, impl_mode, cache_dir, enable_cache, jobs, \
+        compile_context, content_naming=False):
+    kernel_meta_dir = compile_context.get_kernel_meta_dir()
+    compile_cache = get_compile_cache(kernel_meta_dir, cache_dir, enable_cache)
+    # extracted and split sub op objects are shared by scopes using the same sub op binaries
+    artifact_store = SubOpArtifactStore(os.path.join(kernel_meta_dir, SUB_OP_ARTIFACT_DIR_NAME))
+    results = [{"kernel_name": kernel_name, "status": None, "error": None, "timings": {}} \
+        for kernel_name in called_kernel_names]
+
+    # code generation of scopes is cheap next to bisheng, scopes are prepared one by one
+    scopes = []
+    duplicates = []
+    scope_index_of_key = {}
+    for index, (kernel_infos, kernel_name) in enumerate(zip(kernel_infos_list, called_kernel_names)):
+        start_time = time.perf_counter()
+        try:
+            check_super_kernel_infos(kernel_infos)
+            cache_key = gen_compile_cache_key(kernel_infos, impl_mode)
+            if cache_key is not None and cache_key in scope_index_of_key:
+                duplicates.append((index, scope_index_of_key[cache_key]))
+                continue
+            if cache_key is not None:
+                scope_index_of_key[cache_key] = index
+            if compile_cache is not None and cache_key is not None and \
+                    compile_cache.load(cache_key, kernel_meta_dir, kernel_name):
+                results[index]["status"] = "cached"
+                continue
+            super_operator = SuperOperatorInfos(kernel_infos, kernel_name, artifact_store, jobs, compile_context, \
+                content_naming)
+            gen_super_kernel_file(super_operator)
+            write_workspace_plan(super_operator)
+            scopes.append((index, super_operator, cache_key))
+        except Exception as err:
+            results[index]["status"] = "failed"
+            results[index]["error"] = str(err)
+        finally:
+            results[index]["timings"]["prepare"] = time.perf_counter() - start_time
+
+    def compile_scope(super_operator):
+        start_time = time.perf_counter()
+        super_kernel_compile(super_operator.compile_info, super_operator.compile_log_path)
+        return time.perf_counter() - start_time
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(scopes)))) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, compile_scope, super_operator) \
+            for _, super_operator, _ in scopes]
+        for (index, _, cache_key), future in zip(scopes, futures):
+            try:
+                results[index]["timings"]["compile"] = future.result()
+                results[index]["status"] = "compiled"
+            except Exception as err:
+                results[index]["status"] = "failed"
+                results[index]["error"] = str(err)
+                continue
+            if compile_cache is not None and cache_key is not None:
+                compile_cache.store(cache_key, kernel_meta_dir, called_kernel_names[index])
+
+    for index, scope_index in duplicates:
+        start_time = time.perf_counter()
+        if results[scope_index]["status"] == "failed":
+            results[index]["status"] = "failed"
+            results[index]["error"] = results[scope_index]["error"]
+            continue
+        try:
+            if called_kernel_names[index] != called_kernel_names[scope_index]:
+                restore_super_kernel(kernel_meta_dir, called_kernel_names[scope_index], \
+                    kernel_meta_dir, called_kernel_names[index])
+            results[index]["status"] = "deduplicated"
+        except Exception as err:
+            results[index]["status"] = "failed"
+            results[index]["error"] = str(err)
+        results[index]["timings"]["restore"] = time.perf_counter() - start_time
+    return results
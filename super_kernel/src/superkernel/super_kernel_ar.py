@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel ar archive reader
+"""
+import os
+import mmap
+from contextlib import contextmanager
+
+from .super_kernel_file_utils import atomic_write
+
+AR_MAGIC = b"!<arch>\n"
+AR_HEADER_SIZE = 60
+AR_HEADER_END = b"`\n"
+GNU_SYMBOL_TABLE_NAMES = ["/", "/SYM64/"]
+GNU_LONG_NAME_TABLE_NAME = "//"
+BSD_LONG_NAME_PREFIX = "#1/"
+BSD_SYMBOL_TABLE_PREFIX = "__.SYMDEF"
+
+
+class ArFormatError(ValueError):
+    pass
+
+
+class ArArchive:
+    """read only view of a GNU or BSD ar archive through mmap,
+    members are located once and can be accessed as zero-copy memoryview"""
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._fd = open(file_path, 'rb')
+        try:
+            self.data = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as err:
+            self._fd.close()
+            raise ArFormatError(f"{file_path} is not an ar archive: {err}") from err
+        try:
+            # member name -> (offset, size) of its content, later member wins like `ar x`
+            self.members = self._parse_members()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.data.close()
+        self._fd.close()
+
+    def _parse_members(self):
+        if self.data[:len(AR_MAGIC)] != AR_MAGIC:
+            raise ArFormatError(f"{self.file_path} is not an ar archive")
+        members = {}
+        long_names = b""
+        offset = len(AR_MAGIC)
+        file_size = len(self.data)
+        while offset + AR_HEADER_SIZE <= file_size:
+            header = self.data[offset:offset + AR_HEADER_SIZE]
+            if header[58:60] != AR_HEADER_END:
+                raise ArFormatError(f"bad member header at {offset} of {self.file_path}")
+            raw_name = header[0:16].decode("utf-8", errors="replace").rstrip(" ")
+            try:
+                size = int(header[48:58].decode().strip())
+            except ValueError as err:
+                raise ArFormatError(f"bad member size at {offset} of {self.file_path}") from err
+            data_offset = offset + AR_HEADER_SIZE
+            if data_offset + size > file_size:
+                raise ArFormatError(f"member at {offset} of {self.file_path} is out of file")
+            # member contents are aligned to 2 bytes
+            offset = data_offset + size + (size & 1)
+
+            if raw_name == GNU_LONG_NAME_TABLE_NAME:
+                long_names = self.data[data_offset:data_offset + size]
+                continue
+            if raw_name in GNU_SYMBOL_TABLE_NAMES:
+                continue
+            if raw_name.startswith(BSD_LONG_NAME_PREFIX):
+                name_len = int(raw_name[len(BSD_LONG_NAME_PREFIX):])
+                if name_len > size:
+                    raise ArFormatError(f"bad member name length at {data_offset} of {self.file_path}")
+                name = self.data[data_offset:data_offset + name_len].rstrip(b"\x00").decode("utf-8")
+                data_offset += name_len
+                size -= name_len
+            elif raw_name.startswith("/"):
+                name_offset = int(raw_name[1:])
+                name_end = long_names.find(b"/\n", name_offset)
+                if name_offset >= len(long_names) or name_end < 0:
+                    raise ArFormatError(f"bad long member name {raw_name} of {self.file_path}")
+                name = long_names[name_offset:name_end].decode("utf-8")
+            else:
+                name = raw_name[:-1] if raw_name.endswith("/") else raw_name
+            if name.startswith(BSD_SYMBOL_TABLE_PREFIX):
+                continue
+            members[name] = (data_offset, size)
+        return members
+
+    @contextmanager
+    def member_view(self, name):
+        """zero-copy view of member content, only valid inside the with block"""
+        offset, size = self.members[name]
+        with memoryview(self.data) as view:
+            member = view[offset:offset + size]
+            try:
+                yield member
+            finally:
+                member.release()
+
+    def extract(self, name, dst_path):
+        with self.member_view(name) as member:
+            atomic_write(dst_path, member)
+
+
+def extract_ar_members(archive_path, dst_dir, member_names):
+    """write members in member_names found in archive into dst_dir, never changes current directory.
+    return names of extracted members"""
+    extracted = []
+    with ArArchive(archive_path) as archive:
+        for name in member_names:
+            if name not in archive.members:
+                continue
+            if os.path.basename(name) != name:
+                raise ArFormatError(f"member name {name} of {archive_path} is not a plain file name")
+            archive.extract(name, os.path.join(dst_dir, name))
+            extracted.append(name)
+    return extracted
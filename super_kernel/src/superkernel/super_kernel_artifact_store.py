@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel sub op artifact store
+"""
+import os
+import json
+import hashlib
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility, CompileStage
+from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SubOperatorType
+from .super_kernel_file_utils import calc_file_sha256, atomic_write
+
+SUB_OP_ARTIFACT_DIR_NAME = "super_kernel_sub_op_artifacts"
+PREPARE_INFO_FILE_NAME = "prepare_info.json"
+# bump it when the content of keys or the layout of artifact entry changes
+ARTIFACT_FORMAT_VERSION = 1
+
+# attributes of SubOperatorInfos filled by code_gen, sub_op_task_type is saved separately by name
+CODE_GEN_ATTRS = [
+    "dynamic_bin",
+    "aiv_bin",
+    "aic_bin",
+    "aiv_text_len",
+    "aic_text_len",
+    "block_dim",
+    "sub_kernel_names",
+    "kernel_declare",
+    "kernel_call_block",
+    "kernel_call_block_with_syncall",
+    "preload_call_block",
+    "preload_call_blocks",
+    "data_cache_preload_call",
+    "early_start_complement_set_flag_block",
+    "early_start_complement_wait_flag_block",
+    "call_dynamic_switch_func",
+    "dynamic_impl_func_block",
+    "extra_kernel_params",
+    "notify_param_offset",
+    "wait_param_offset",
+    "notify_block",
+    "tmp_notify_block",
+    "wait_block",
+]
+
+
+def load_json_quietly(json_path):
+    try:
+        with open(json_path, 'r') as fd:
+            return json.load(fd)
+    except (OSError, ValueError):
+        return None
+
+
+class SubOpArtifactEntry:
+    """prepared artifacts of one sub op: extracted binaries, split clones, text sizes and generated code.
+    the entry dir is addressed by the content of sub op binary and json, so anything found inside
+    a committed entry is valid for every super kernel using the same sub op."""
+    def __init__(self, entry_dir, prepare_key, compile_log_path=None):
+        self.entry_dir = entry_dir
+        self.prepare_key = prepare_key
+        self.compile_log_path = compile_log_path
+        self.prepare_infos = load_json_quietly(os.path.join(entry_dir, PREPARE_INFO_FILE_NAME))
+
+    @property
+    def prepared(self):
+        return self.prepare_infos is not None
+
+    def get_text_len(self, binary_file):
+        if self.prepare_infos is None:
+            return None
+        return self.prepare_infos["text_len"].get(os.path.basename(binary_file))
+
+    def gen_code_gen_key(self, sub_op, inner_event_id_set, enable_double_stream, op_options):
+        event_list = sub_op.send_event_list + sub_op.recv_event_list
+        compile_context = sub_op.compile_context
+        key_items = [
+            self.prepare_key,
+            sub_op.bin_path,
+            sub_op.json_path,
+            sub_op.index,
+            sub_op.stream_index,
+            sub_op.param_offset,
+            sub_op.sub_op_task_type.name,
+            sub_op.send_event_list,
+            sub_op.recv_event_list,
+            sorted(sub_op.tiling_key_profile.items()),
+            sorted(str(event_id) for event_id in inner_event_id_set if event_id in event_list),
+            enable_double_stream,
+            sorted((str(key), str(value)) for key, value in op_options.items()),
+            compile_context.is_c310(),
+            compile_context.get_soc_spec("ai_core_cnt"),
+            compile_context.get_soc_spec("vector_core_cnt"),
+        ]
+        return hashlib.sha256(repr(key_items).encode()).hexdigest()
+
+    def get_code_gen_path(self, code_gen_key):
+        return os.path.join(self.entry_dir, f"code_gen_{code_gen_key}.json")
+
+    def restore_code_gen(self, sub_op, code_gen_key):
+        code_gen_infos = load_json_quietly(self.get_code_gen_path(code_gen_key))
+        # entries saved before an attribute was added are generated again
+        if code_gen_infos is None or any(attr not in code_gen_infos for attr in CODE_GEN_ATTRS):
+            return False
+        for attr in CODE_GEN_ATTRS:
+            setattr(sub_op, attr, code_gen_infos[attr])
+        sub_op.sub_op_task_type = SubOperatorType[code_gen_infos["sub_op_task_type"]]
+        CommonUtility.dump_compile_log([f'###Reuse code gen of {sub_op.kernel_name}:', self.entry_dir], \
+            CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
+        return True
+
+    def save_code_gen(self, sub_op, code_gen_key):
+        code_gen_infos = {attr: getattr(sub_op, attr) for attr in CODE_GEN_ATTRS}
+        code_gen_infos["sub_op_task_type"] = sub_op.sub_op_task_type.name
+        atomic_write(self.get_code_gen_path(code_gen_key), json.dumps(code_gen_infos))
+
+    def commit(self, sub_op):
+        """mark extraction and split cloning of this entry as finished"""
+        text_len = {}
+        if sub_op.aiv_bin is not None:
+            text_len[os.path.basename(sub_op.aiv_bin)] = sub_op.aiv_text_len
+        if sub_op.aic_bin is not None:
+            text_len[os.path.basename(sub_op.aic_bin)] = sub_op.aic_text_len
+        self.prepare_infos = {"text_len": text_len}
+        atomic_write(os.path.join(self.entry_dir, PREPARE_INFO_FILE_NAME), json.dumps(self.prepare_infos))
+
+
+class SubOpArtifactStore:
+    """persistent store of per sub op artifacts used by incremental rebuild,
+    only sub ops whose binary, json or position in super kernel changed are prepared again."""
+    def __init__(self, store_dir):
+        self.store_dir = os.path.realpath(store_dir)
+
+    def gen_prepare_key(self, sub_op):
+        sha256 = hashlib.sha256()
+        for item in [ARTIFACT_FORMAT_VERSION, sub_op.compile_context.get_chip_version(), sub_op.split_mode, \
+                calc_file_sha256(sub_op.bin_path), calc_file_sha256(sub_op.json_path)]:
+            sha256.update(f"{item}\n".encode())
+        return sha256.hexdigest()
+
+    def open_entry(self, sub_op, compile_log_path=None):
+        try:
+            prepare_key = self.gen_prepare_key(sub_op)
+            entry_dir = os.path.join(self.store_dir, prepare_key[:2], prepare_key)
+            os.makedirs(entry_dir, exist_ok=True)
+        except OSError as err:
+            CommonUtility.dump_compile_log([f'###Incremental rebuild disabled for {sub_op.kernel_name}:', str(err)], \
+                CompileStage.SPLIT_SUB_OBJS, compile_log_path)
+            return None
+        return SubOpArtifactEntry(entry_dir, prepare_key, compile_log_path)
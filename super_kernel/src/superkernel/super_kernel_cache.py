@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel compile cache
+"""
+import os
+import re
+import json
+import shutil
+import hashlib
+import subprocess
+from functools import lru_cache
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility, AscendCLogLevel
+from .super_kernel_options import parse_options
+from . import __version__
+from .super_kernel_context import get_compile_context
+from .super_kernel_file_utils import calc_file_sha256, gen_tmp_path, remove_file_quietly, atomic_copy, \
+    atomic_write
+from .super_kernel_workspace_plan import get_workspace_plan_path
+from .super_kernel_op_infos import get_asc_path
+
+SUPER_KERNEL_CACHE_DIR_ENV = "ASCEND_SUPER_KERNEL_CACHE_DIR"
+SUPER_KERNEL_CACHE_DIR_NAME = "super_kernel_cache"
+CACHE_META_FILE_NAME = "meta.json"
+# bump it when the content of cache key or the layout of cache entry changes
+# 2: entries hold the workspace plan of the super kernel
+CACHE_FORMAT_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def get_toolchain_version():
+    bisheng_path = shutil.which("bisheng")
+    if bisheng_path is None:
+        return "unknown"
+    try:
+        result = subprocess.run([bisheng_path, '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, \
+            text=True)
+    except OSError:
+        return "unknown"
+    return f"{os.path.realpath(bisheng_path)}:{result.stdout.strip()}"
+
+
+@lru_cache(maxsize=None)
+def get_generator_digest():
+    """hash of sources of this package, any change of code generation gives new cache keys"""
+    package_dir = os.path.dirname(os.path.realpath(__file__))
+    sha256 = hashlib.sha256()
+    for file_name in sorted(os.listdir(package_dir)):
+        if file_name.endswith(".py"):
+            sha256.update(f"{file_name}:{calc_file_sha256(os.path.join(package_dir, file_name))}\n".encode())
+    return sha256.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_header_tree_digest(header_dir):
+    """hash of path, size and mtime of every file under header_dir, headers are too many to read
+    their content in every compile"""
+    sha256 = hashlib.sha256()
+    for root, dirs, files in os.walk(header_dir):
+        dirs.sort()
+        for file_name in sorted(files):
+            file_path = os.path.join(root, file_name)
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            sha256.update(f"{os.path.relpath(file_path, header_dir)}:{file_stat.st_size}:\
+{file_stat.st_mtime_ns}\n".encode())
+    return sha256.hexdigest()
+
+
+def get_build_env_fingerprint():
+    """everything outside of kernel_infos that changes the linked super kernel"""
+    compile_context = get_compile_context()
+    return {
+        "soc_version": compile_context.get_soc_spec("SOC_VERSION"),
+        "short_soc_version": compile_context.get_soc_spec("SHORT_SOC_VERSION"),
+        "ai_core_cnt": compile_context.get_soc_spec("ai_core_cnt"),
+        "vector_core_cnt": compile_context.get_soc_spec("vector_core_cnt"),
+        "op_debug_config": compile_context.get_op_debug_config(),
+        "ascend_home_path": os.environ.get("ASCEND_HOME_PATH", ""),
+        "toolchain_version": get_toolchain_version(),
+        "super_kernel_version": __version__,
+        "generator_digest": get_generator_digest(),
+        "asc_header_digest": get_header_tree_digest(get_asc_path()),
+    }
+
+
+def gen_compile_cache_key(kernel_infos, impl_mode=""):
+    """hash of sub op binaries and jsons, parsed options, soc and toolchain.
+    return None when any sub op file can not be read, such super kernel is never cached."""
+    op_list = kernel_infos.get("op_list")
+    if not op_list:
+        return None
+    op_digests = []
+    for index, op_info in enumerate(op_list):
+        for path_key in ["bin_path", "json_path"]:
+            file_path = op_info.get(path_key)
+            if file_path is None:
+                continue
+            if not os.path.isfile(file_path):
+                return None
+            op_digests.append((f"op{index}.{path_key}", calc_file_sha256(file_path)))
+        other_infos = {key: value for key, value in op_info.items() if key not in ["bin_path", "json_path"]}
+        op_digests.append((f"op{index}.infos", json.dumps(other_infos, sort_keys=True, default=str)))
+
+    sha256 = hashlib.sha256()
+
+    def update(tag, value):
+        sha256.update(f"{tag}={value}\n".encode())
+
+    update("format_version", CACHE_FORMAT_VERSION)
+    update("impl_mode", impl_mode)
+    for key, value in sorted(get_build_env_fingerprint().items()):
+        update(f"env.{key}", value)
+    op_options = parse_options(kernel_infos.get("super_kernel_options", ""))
+    for key in sorted(op_options, key=str):
+        update(f"option.{key}", op_options[key])
+    for tag, value in op_digests:
+        update(tag, value)
+    return sha256.hexdigest()
+
+
+def replace_kernel_name(text, old_name, new_name):
+    """replace old_name when it is a whole token, '_' is taken as token delimiter,
+    so `te_sk_1_mix_aic` is renamed but `te_sk_12` is not"""
+    return re.sub(rf'(?<![0-9A-Za-z]){re.escape(old_name)}(?![0-9A-Za-z])', new_name, text)
+
+
+def rename_kernel_object(src_path, dst_path, old_name, new_name):
+    result = subprocess.run(['llvm-nm', src_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE, \
+        text=True, check=True)
+    rename_lines = []
+    for symbol in sorted({line.split()[-1] for line in result.stdout.splitlines() if line.strip()}):
+        new_symbol = replace_kernel_name(symbol, old_name, new_name)
+        if new_symbol != symbol:
+            rename_lines.append(f"{symbol} {new_symbol}\n")
+    tmp_path = gen_tmp_path(dst_path)
+    rename_file_path = tmp_path + ".rename"
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        if rename_lines:
+            atomic_write(rename_file_path, "".join(rename_lines))
+            subprocess.run(['llvm-objcopy', f'--redefine-syms={rename_file_path}', tmp_path], \
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        os.replace(tmp_path, dst_path)
+    finally:
+        remove_file_quietly(tmp_path)
+        remove_file_quietly(rename_file_path)
+
+
+def rename_kernel_json(json_infos, old_name, new_name, old_sha256, new_sha256):
+    if isinstance(json_infos, dict):
+        return {key: rename_kernel_json(value, old_name, new_name, old_sha256, new_sha256) \
+            for key, value in json_infos.items()}
+    if isinstance(json_infos, list):
+        return [rename_kernel_json(value, old_name, new_name, old_sha256, new_sha256) for value in json_infos]
+    if isinstance(json_infos, str):
+        if json_infos == old_sha256:
+            return new_sha256
+        return replace_kernel_name(json_infos, old_name, new_name)
+    return json_infos
+
+
+def restore_workspace_plan(src_dir, src_name, dst_dir, dst_name):
+    """workspace plan is optional in entries, a plan left by an earlier compile of dst_name is removed"""
+    src_plan_path = get_workspace_plan_path(src_dir, src_name)
+    plan_path = get_workspace_plan_path(dst_dir, dst_name)
+    if not os.path.isfile(src_plan_path):
+        remove_file_quietly(plan_path)
+        return
+    if src_name == dst_name:
+        atomic_copy(src_plan_path, plan_path)
+        return
+    with open(src_plan_path, 'r') as fd:
+        workspace_plan = json.load(fd)
+    workspace_plan["kernel_name"] = dst_name
+    atomic_write(plan_path, json.dumps(workspace_plan, indent=2))
+
+
+def restore_super_kernel(src_dir, src_name, dst_dir, dst_name):
+    """copy <src_name>.o and <src_name>.json of src_dir to dst_dir as <dst_name>.o and <dst_name>.json,
+    and the workspace plan when the entry has one"""
+    src_obj_path = os.path.join(src_dir, src_name + ".o")
+    src_json_path = os.path.join(src_dir, src_name + ".json")
+    obj_path = os.path.join(dst_dir, dst_name + ".o")
+    json_path = os.path.join(dst_dir, dst_name + ".json")
+    restore_workspace_plan(src_dir, src_name, dst_dir, dst_name)
+    if src_name == dst_name:
+        atomic_copy(src_obj_path, obj_path)
+        atomic_copy(src_json_path, json_path)
+        return
+    # same fusion compiled under another name, only symbols and json fields need renaming
+    rename_kernel_object(src_obj_path, obj_path, src_name, dst_name)
+    with open(src_json_path, 'r') as fd:
+        json_infos = json.load(fd)
+    json_infos = rename_kernel_json(json_infos, src_name, dst_name, \
+        calc_file_sha256(src_obj_path), calc_file_sha256(obj_path))
+    atomic_write(json_path, json.dumps(json_infos, indent=2))
+
+
+class SuperKernelCompileCache:
+    """persistent cache of linked super kernels, one entry per cache key:
+        <cache_dir>/<key[:2]>/<key>/{<kernel_name>.o, <kernel_name>.json, meta.json,
+            <kernel_name>_workspace_plan.json}
+    entries are published by renaming a fully written temporary directory."""
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.realpath(cache_dir)
+
+    @staticmethod
+    def get_default_cache_dir(kernel_meta_dir):
+        cache_dir = os.environ.get(SUPER_KERNEL_CACHE_DIR_ENV, "")
+        if cache_dir != "":
+            return cache_dir
+        return os.path.join(kernel_meta_dir, SUPER_KERNEL_CACHE_DIR_NAME)
+
+    def get_entry_dir(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def load(self, key, kernel_meta_dir, kernel_name):
+        """restore <kernel_name>.o and <kernel_name>.json into kernel_meta_dir, return True on cache hit"""
+        entry_dir = self.get_entry_dir(key)
+        meta_path = os.path.join(entry_dir, CACHE_META_FILE_NAME)
+        if not os.path.isfile(meta_path):
+            return False
+        try:
+            with open(meta_path, 'r') as fd:
+                cached_name = json.load(fd)["kernel_name"]
+            restore_super_kernel(entry_dir, cached_name, kernel_meta_dir, kernel_name)
+        except (OSError, ValueError, KeyError, subprocess.SubprocessError) as err:
+            CommonUtility.print_compile_log(kernel_name, \
+                f"load super kernel compile cache {entry_dir} failed, recompile it, reason is: {err}", \
+                AscendCLogLevel.LOG_WARNING)
+            return False
+        CommonUtility.print_compile_log(kernel_name, \
+            f"super kernel compile cache hit: {entry_dir}", AscendCLogLevel.LOG_DEBUG)
+        return True
+
+    def store(self, key, kernel_meta_dir, kernel_name):
+        obj_path = os.path.join(kernel_meta_dir, kernel_name + ".o")
+        json_path = os.path.join(kernel_meta_dir, kernel_name + ".json")
+        if not os.path.isfile(obj_path) or not os.path.isfile(json_path):
+            return False
+        entry_dir = self.get_entry_dir(key)
+        if os.path.isdir(entry_dir):
+            return True
+        tmp_dir = gen_tmp_path(entry_dir)
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            shutil.copyfile(obj_path, os.path.join(tmp_dir, kernel_name + ".o"))
+            shutil.copyfile(json_path, os.path.join(tmp_dir, kernel_name + ".json"))
+            plan_path = get_workspace_plan_path(kernel_meta_dir, kernel_name)
+            if os.path.isfile(plan_path):
+                shutil.copyfile(plan_path, get_workspace_plan_path(tmp_dir, kernel_name))
+            atomic_write(os.path.join(tmp_dir, CACHE_META_FILE_NAME), json.dumps({"kernel_name": kernel_name}))
+            os.rename(tmp_dir, entry_dir)
+        except OSError as err:
+            # another compile may publish the same entry at the same time
+            if os.path.isdir(entry_dir):
+                return True
+            CommonUtility.print_compile_log(kernel_name, \
+                f"store super kernel compile cache {entry_dir} failed, reason is: {err}", \
+                AscendCLogLevel.LOG_WARNING)
+            return False
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return True
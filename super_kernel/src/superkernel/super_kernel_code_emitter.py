@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel code emitter
+"""
+import os
+import re
+import stat
+import hashlib
+from contextlib import contextmanager
+
+from .super_kernel_file_utils import gen_tmp_path, remove_file_quietly
+
+INDENT_UNIT = '    '
+# pending chunks are written out once they reach this size
+FLUSH_SIZE = 1024 * 1024
+# same as indent_code_func: indent every non-empty line
+NON_EMPTY_LINE_PATTERN = re.compile(r'^(?=.+)', flags=re.MULTILINE)
+
+
+class CodeEmitter:
+    """buffered writer of generated code.
+    every piece of code is indented once, by the indent level current when it is emitted, and then
+    kept as a chunk; chunks are joined only on flush, so generation cost is linear in code size.
+    with ofd set, chunks are streamed into it, otherwise they are kept for getvalue."""
+    def __init__(self, ofd=None, flush_size=FLUSH_SIZE):
+        self.ofd = ofd
+        self.flush_size = flush_size
+        self.indent_level = 0
+        self.chunks = []
+        self.pending_size = 0
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    @contextmanager
+    def indent(self, levels=1):
+        self.indent_level += levels
+        try:
+            yield self
+        finally:
+            self.indent_level -= levels
+
+    def write(self, code):
+        """append code as it is"""
+        if not code:
+            return
+        self.chunks.append(code)
+        self.pending_size += len(code)
+        self.size += len(code)
+        if self.ofd is not None and self.pending_size >= self.flush_size:
+            self.flush()
+
+    def emit(self, code):
+        """append code with non-empty lines indented by current indent level"""
+        if self.indent_level > 0 and code:
+            code = NON_EMPTY_LINE_PATTERN.sub(INDENT_UNIT * self.indent_level, code)
+        self.write(code)
+
+    def flush(self):
+        if self.ofd is None or not self.chunks:
+            return
+        content = "".join(self.chunks)
+        self.sha256.update(content.encode())
+        self.ofd.write(content)
+        self.chunks = []
+        self.pending_size = 0
+
+    def getvalue(self):
+        """whole code emitted so far, only for emitter without ofd"""
+        content = "".join(self.chunks)
+        self.chunks = [content]
+        return content
+
+    def hexdigest(self):
+        """sha256 of whole code emitted so far"""
+        if self.ofd is None:
+            return hashlib.sha256(self.getvalue().encode()).hexdigest()
+        self.flush()
+        return self.sha256.hexdigest()
+
+
+class FileCodeEmitter(CodeEmitter):
+    """CodeEmitter streaming into a temporary file beside dst_path, the file is published as dst_path
+    by rename in commit, and removed when the emitter is left without commit"""
+    def __init__(self, dst_path, flush_size=FLUSH_SIZE):
+        self.tmp_path = gen_tmp_path(dst_path)
+        ofd = os.fdopen(os.open(self.tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, \
+            stat.S_IWUSR | stat.S_IRUSR), 'w')
+        super().__init__(ofd, flush_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        remove_file_quietly(self.tmp_path)
+
+    def close(self):
+        if self.ofd is not None and not self.ofd.closed:
+            self.flush()
+            self.ofd.close()
+
+    def commit(self, dst_path, keep_existing=False):
+        """publish emitted code as dst_path, an existing dst_path is kept as it is when keep_existing"""
+        self.close()
+        if keep_existing and os.path.exists(dst_path):
+            return
+        os.replace(self.tmp_path, dst_path)
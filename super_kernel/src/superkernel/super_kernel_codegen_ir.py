@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel codegen ir
+"""
+from abc import ABC, abstractmethod
+from enum import Enum
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility, AscendCLogLevel
+from .super_kernel_code_emitter import CodeEmitter
+
+
+class NodeKind(Enum):
+    CODE = "code"
+    SUB_OP_CALL = "sub_op_call"
+    BARRIER = "barrier"
+    CROSS_CORE_SYNC = "cross_core_sync"
+    PRELOAD = "preload"
+    DATA_CACHE_PRELOAD = "data_cache_preload"
+    NOTIFY = "notify"
+    WAIT = "wait"
+    PROFILING = "profiling"
+    DEBUG = "debug"
+
+
+class BarrierScope(Enum):
+    # all aic and aiv cores
+    SYNC_ALL = "sync_all"
+    AIC_ALL = "aic_all"
+    AIV_ALL = "aiv_all"
+    # pipes of current core only
+    PIPE_ALL = "pipe_all"
+    # set flag of previous op and wait flag of current op
+    EARLY_START = "early_start"
+
+
+class CodeGenNode:
+    """one piece of super kernel body.
+    code is kept as segments of (code, indented), indented segments follow the indent level of the body
+    and the others are printed as they are. placeholders are replaced when printing, so sub op blocks
+    shared by several super kernels are never patched in place."""
+    def __init__(self, kind, code="", indented=True, sub_op=None, scope=None, placeholders=None):
+        self.kind = kind
+        self.sub_op = sub_op
+        self.scope = scope
+        self.segments = []
+        self.placeholders = {} if placeholders is None else placeholders
+        self.add_code(code, indented)
+
+    def __repr__(self):
+        sub_op_name = None if self.sub_op is None else self.sub_op.kernel_name
+        return f"CodeGenNode({self.kind.name}, scope={self.scope}, sub_op={sub_op_name})"
+
+    def add_code(self, code, indented=True):
+        if not code:
+            return self
+        # code of same indentation is joined, as it is indented as a whole
+        if self.segments and self.segments[-1][1] == indented:
+            self.segments[-1] = (self.segments[-1][0] + code, indented)
+        else:
+            self.segments.append((code, indented))
+        return self
+
+    def resolve(self, code):
+        for placeholder, value in self.placeholders.items():
+            code = code.replace(placeholder, value)
+        return code
+
+    @property
+    def code(self):
+        return "".join(self.resolve(code) for code, _ in self.segments)
+
+    @property
+    def empty(self):
+        return len(self.segments) == 0
+
+
+class CodeGenBody:
+    """ordered nodes of the sub op loop of one super kernel function,
+    arch is 'aic' or 'aiv' for functions of two real stream and None otherwise"""
+    def __init__(self, arch=None):
+        self.arch = arch
+        self.nodes = []
+
+    def append(self, node):
+        if not node.empty:
+            self.nodes.append(node)
+        return node
+
+    def extend(self, nodes):
+        for node in nodes:
+            self.append(node)
+
+    def nodes_of(self, kind):
+        return [node for node in self.nodes if node.kind is kind]
+
+
+class CodeGenPass(ABC):
+    """transform of CodeGenBody, run returns how many nodes it changed"""
+    name = "codegen_pass"
+
+    @abstractmethod
+    def run(self, super_operator, body):
+        pass
+
+
+def run_codegen_passes(super_operator, body, codegen_passes):
+    """run codegen_passes on body in order, return {pass name: number of nodes it changed}"""
+    pass_stats = {}
+    for codegen_pass in codegen_passes:
+        changed = codegen_pass.run(super_operator, body)
+        pass_stats[codegen_pass.name] = pass_stats.get(codegen_pass.name, 0) + changed
+        body_name = super_operator.kernel_name if body.arch is None else f"{super_operator.kernel_name}_{body.arch}"
+        CommonUtility.print_compile_log(super_operator.kernel_name, \
+            f"codegen pass {codegen_pass.name} changed {changed} nodes of {body_name}", AscendCLogLevel.LOG_INFO)
+    return pass_stats
+
+
+def print_codegen_nodes(emitter, nodes):
+    for node in nodes:
+        for code, indented in node.segments:
+            if indented:
+                emitter.emit(node.resolve(code))
+            else:
+                emitter.write(node.resolve(code))
+
+
+def gen_code_of_nodes(nodes, indent_level=0):
+    emitter = CodeEmitter()
+    with emitter.indent(indent_level):
+        print_codegen_nodes(emitter, nodes)
+    return emitter.getvalue()
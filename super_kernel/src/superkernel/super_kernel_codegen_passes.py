@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel codegen passes
+"""
+from .super_kernel_codegen_ir import NodeKind, BarrierScope, CodeGenPass
+
+# scopes of barriers each barrier scope also synchronizes.
+# early start barriers are set/wait flag pairs of two sub ops and are never removed
+BARRIER_SUBSUMED_SCOPES = {
+    BarrierScope.SYNC_ALL: {BarrierScope.SYNC_ALL, BarrierScope.AIC_ALL, BarrierScope.AIV_ALL},
+    BarrierScope.AIC_ALL: {BarrierScope.AIC_ALL},
+    BarrierScope.AIV_ALL: {BarrierScope.AIV_ALL},
+    BarrierScope.PIPE_ALL: {BarrierScope.PIPE_ALL},
+}
+
+
+def is_removable_barrier(node):
+    """inter op barriers, barriers after wait blocks and debug sync all"""
+    return node.kind in [NodeKind.BARRIER, NodeKind.DEBUG] and node.scope in BARRIER_SUBSUMED_SCOPES
+
+
+def is_transparent_to_barrier(node):
+    """nodes neither touching memory nor syncing with other cores, so barriers around them are adjacent"""
+    if node.kind is NodeKind.PRELOAD:
+        return True
+    if node.kind is not NodeKind.CODE:
+        return False
+    return all(line.strip() == "" or line.strip().startswith("//") for line in node.code.splitlines())
+
+
+class RedundantBarrierPass(CodeGenPass):
+    """remove barriers duplicated or subsumed by an adjacent barrier.
+    nodes of a body run in order on each core of its arch, so two barriers with nothing but comments and
+    instruction preloads between them synchronize the same work, and the weaker one of them can go.
+    when both are of the same scope, the later one is removed."""
+    name = "remove_redundant_barrier"
+
+    def run(self, super_operator, body):
+        kept_nodes = []
+        last_barrier = None
+        last_barrier_index = 0
+        removed = 0
+        for node in body.nodes:
+            if is_removable_barrier(node):
+                if last_barrier is not None:
+                    if node.scope in BARRIER_SUBSUMED_SCOPES[last_barrier.scope]:
+                        removed += 1
+                        continue
+                    if last_barrier.scope in BARRIER_SUBSUMED_SCOPES[node.scope]:
+                        del kept_nodes[last_barrier_index]
+                        removed += 1
+                last_barrier = node
+                last_barrier_index = len(kept_nodes)
+            elif not is_transparent_to_barrier(node):
+                last_barrier = None
+            kept_nodes.append(node)
+        body.nodes = kept_nodes
+        return removed
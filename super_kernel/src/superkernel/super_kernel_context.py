@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel compile context
+"""
+import contextvars
+from contextlib import contextmanager
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import get_soc_spec, CommonUtility, \
+    get_op_debug_config
+
+# soc spec items read by super kernel code generation
+SOC_SPEC_KEYS = ["SOC_VERSION", "SHORT_SOC_VERSION", "ai_core_cnt", "vector_core_cnt"]
+
+
+class SuperKernelCompileContext:
+    """build config of one super kernel compile: kernel_meta dir, soc spec, debug config and log path.
+    items left None are read from process global config on every access, so a default context behaves
+    exactly like the global config; a captured context is a snapshot that later global changes,
+    e.g. a compile starting in another thread, do not affect."""
+    def __init__(self, kernel_meta_dir=None, soc_spec=None, op_debug_config=None, chip_version=None, \
+            c310=None, has_ffts_mode=None, distinct_filename_tag=None, compile_log_path=None, \
+            support_super_kernel=None):
+        self.kernel_meta_dir = kernel_meta_dir
+        self.soc_spec = dict(soc_spec) if soc_spec is not None else {}
+        self.op_debug_config = op_debug_config
+        self.chip_version = chip_version
+        self.c310 = c310
+        self.has_ffts_mode = has_ffts_mode
+        self.distinct_filename_tag = distinct_filename_tag
+        self.compile_log_path = compile_log_path
+        self.support_super_kernel = support_super_kernel
+
+    @classmethod
+    def capture(cls, **overrides):
+        """snapshot of current global config, items in overrides replace captured ones"""
+        items = {
+            "kernel_meta_dir": CommonUtility.get_kernel_meta_dir(),
+            "soc_spec": {key: get_soc_spec(key) for key in SOC_SPEC_KEYS},
+            "op_debug_config": get_op_debug_config(),
+            "chip_version": CommonUtility.get_chip_version(),
+            "c310": CommonUtility.is_c310(),
+            "has_ffts_mode": CommonUtility.is_has_ffts_mode(),
+            "distinct_filename_tag": CommonUtility.get_distinct_filename_tag(),
+            "support_super_kernel": CommonUtility.is_support_super_kernel(),
+        }
+        items.update(overrides)
+        return cls(**items)
+
+    def get_kernel_meta_dir(self):
+        if self.kernel_meta_dir is None:
+            return CommonUtility.get_kernel_meta_dir()
+        return self.kernel_meta_dir
+
+    def get_soc_spec(self, key):
+        if key not in self.soc_spec:
+            return get_soc_spec(key)
+        return self.soc_spec[key]
+
+    def get_op_debug_config(self):
+        if self.op_debug_config is None:
+            return get_op_debug_config()
+        return self.op_debug_config
+
+    def get_chip_version(self):
+        if self.chip_version is None:
+            return CommonUtility.get_chip_version()
+        return self.chip_version
+
+    def is_c310(self):
+        if self.c310 is None:
+            return CommonUtility.is_c310()
+        return self.c310
+
+    def is_has_ffts_mode(self):
+        if self.has_ffts_mode is None:
+            return CommonUtility.is_has_ffts_mode()
+        return self.has_ffts_mode
+
+    def get_distinct_filename_tag(self):
+        if self.distinct_filename_tag is None:
+            return CommonUtility.get_distinct_filename_tag()
+        return self.distinct_filename_tag
+
+    def is_support_super_kernel(self):
+        if self.support_super_kernel is None:
+            return CommonUtility.is_support_super_kernel()
+        return self.support_super_kernel
+
+
+_global_compile_context = SuperKernelCompileContext()
+_current_compile_context = contextvars.ContextVar("super_kernel_compile_context", default=None)
+
+
+def get_compile_context():
+    """context of the running compile, the global config when no compile context is used"""
+    compile_context = _current_compile_context.get()
+    if compile_context is None:
+        return _global_compile_context
+    return compile_context
+
+
+@contextmanager
+def use_compile_context(compile_context):
+    token = _current_compile_context.set(compile_context)
+    try:
+        yield compile_context
+    finally:
+        _current_compile_context.reset(token)
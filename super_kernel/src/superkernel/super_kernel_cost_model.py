@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel cost model of kernel type and block dim
+"""
+import math
+from abc import ABC, abstractmethod
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import KernelMetaType
+from .super_kernel_options import get_extension_option
+
+
+def get_core_num(kernel_type, block_dim):
+    """(aic num, aiv num) launched by a kernel of kernel_type and block_dim"""
+    if kernel_type in [KernelMetaType.KERNEL_TYPE_AIV_ONLY, KernelMetaType.KERNEL_TYPE_MIX_AIV_1_0]:
+        return 0, block_dim
+    if kernel_type in [KernelMetaType.KERNEL_TYPE_AIC_ONLY, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0]:
+        return block_dim, 0
+    if kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2:
+        return block_dim, block_dim * 2
+    return block_dim, block_dim
+
+
+def gen_mix_kernel_type_candidates(max_aic_num, max_aiv_num):
+    """kernel types and least block dims of a super kernel having both aic and aiv sub ops,
+    block dim can not be less than block dim of any sub op on each core type"""
+    return [
+        (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, max(max_aic_num, max_aiv_num)),
+        (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, max(max_aic_num, math.ceil(max_aiv_num / 2))),
+    ]
+
+
+class CostModel(ABC):
+    """predicted end to end time in us of super kernel launched as kernel_type with block_dim"""
+    name = "cost_model"
+
+    @abstractmethod
+    def estimate(self, kernel_type, block_dim, sub_ops):
+        pass
+
+
+class CoreOverheadCostModel(CostModel):
+    """sum of estimated duration of sub ops and overheads growing with launched cores:
+    starting each core, and for every sub op the inter op sync all, surplus cores of its core type skipping it,
+    and cores of the other core type running the complement branch for its whole duration.
+    sub ops keep their own block dim, so only overheads differ between candidates, a long aiv only op favors
+    less aic cores and a long aic only op less aiv cores."""
+    name = "core_overhead"
+    # us of starting one core
+    LAUNCH_COST_PER_CORE = 0.01
+    # us of one core joining sync all between two sub ops
+    SYNC_COST_PER_CORE = 0.005
+    # us of one surplus core of the core type of a sub op skipping it
+    IDLE_COST_PER_CORE = 0.002
+    # slowdown of a sub op per core of the other core type polling in complement branch while it runs
+    COMPLEMENT_COST_RATE = 0.001
+
+    def estimate(self, kernel_type, block_dim, sub_ops):
+        aic_num, aiv_num = get_core_num(kernel_type, block_dim)
+        cost = (aic_num + aiv_num) * self.LAUNCH_COST_PER_CORE
+        for sub_op in sub_ops:
+            sub_aic_num, sub_aiv_num = get_core_num(sub_op.kernel_type, sub_op.block_dim)
+            idle_num = 0
+            complement_num = 0
+            for core_num, sub_core_num in [(aic_num, sub_aic_num), (aiv_num, sub_aiv_num)]:
+                if sub_core_num == 0:
+                    complement_num += core_num
+                else:
+                    idle_num += max(core_num - sub_core_num, 0)
+            cost += sub_op.estimated_duration * (1 + complement_num * self.COMPLEMENT_COST_RATE) + \
+                (aic_num + aiv_num) * self.SYNC_COST_PER_CORE + idle_num * self.IDLE_COST_PER_CORE
+        return cost
+
+
+def select_kernel_type_and_block_dim(cost_model, candidates, sub_ops, max_aic_core_num, max_aiv_core_num):
+    """candidate of least predicted time among those fitting cores of soc, first one wins a tie.
+    return (kernel type, block dim, lines explaining the decision)"""
+    fitting_candidates = [(kernel_type, block_dim) for kernel_type, block_dim in candidates \
+        if get_core_num(kernel_type, block_dim)[0] <= max_aic_core_num \
+            and get_core_num(kernel_type, block_dim)[1] <= max_aiv_core_num]
+    if len(fitting_candidates) == 0:
+        fitting_candidates = candidates
+    lines = []
+    best = None
+    for kernel_type, block_dim in candidates:
+        aic_num, aiv_num = get_core_num(kernel_type, block_dim)
+        if (kernel_type, block_dim) not in fitting_candidates:
+            lines.append(f"{kernel_type}, block_dim: {block_dim}, aic: {aic_num}, aiv: {aiv_num}, \
+exceeds cores of soc")
+            continue
+        cost = cost_model.estimate(kernel_type, block_dim, sub_ops)
+        lines.append(f"{kernel_type}, block_dim: {block_dim}, aic: {aic_num}, aiv: {aiv_num}, \
+predicted: {cost:.3f} us")
+        if best is None or cost < best[2]:
+            best = (kernel_type, block_dim, cost)
+    lines.append(f"choose {best[0]}, block_dim: {best[1]} by {cost_model.name}")
+    return best[0], best[1], lines
+
+
+def get_cost_model(op_options):
+    """cost model choosing kernel type and block dim, None keeps the fixed rule"""
+    if get_extension_option(op_options, 'cost-model'):
+        return CoreOverheadCostModel()
+    return None
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel elf reader
+"""
+import mmap
+import struct
+from collections import namedtuple
+
+from .super_kernel_file_utils import atomic_write
+
+ELF_MAGIC = b"\x7fELF"
+ELF_CLASS_64 = 2
+ELF_DATA_LSB = 1
+ELF_DATA_MSB = 2
+ELF64_EHDR_SIZE = 64
+ELF64_SHDR_SIZE = 64
+SHN_UNDEF = 0
+SHN_XINDEX = 0xffff
+SHT_SYMTAB = 2
+SHT_STRTAB = 3
+ELF64_SYM_SIZE = 24
+# offset of sh_offset and sh_size in ELF64 section header
+SHDR_OFFSET_FIELD = 24
+SHDR_SIZE_FIELD = 32
+ELF_ALIGN = 8
+
+ElfSection = namedtuple("ElfSection", ["index", "name", "type", "flags", "addr", "offset", "size", "link", \
+    "info", "addralign", "entsize", "header_offset"])
+
+
+class ElfFormatError(ValueError):
+    pass
+
+
+class ElfFile:
+    """read only view of an ELF64 relocatable object through mmap, no section data is copied"""
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._fd = open(file_path, 'rb')
+        try:
+            self.data = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as err:
+            # empty file can not be mapped
+            self._fd.close()
+            raise ElfFormatError(f"{file_path} is not an ELF file: {err}") from err
+        try:
+            self._parse_header()
+            self.sections = self._parse_section_headers()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.data.close()
+        self._fd.close()
+
+    def _parse_header(self):
+        if len(self.data) < ELF64_EHDR_SIZE or self.data[:4] != ELF_MAGIC:
+            raise ElfFormatError(f"{self.file_path} is not an ELF file")
+        if self.data[4] != ELF_CLASS_64:
+            raise ElfFormatError(f"{self.file_path} is not an ELF64 file")
+        if self.data[5] == ELF_DATA_LSB:
+            self.endian = "<"
+        elif self.data[5] == ELF_DATA_MSB:
+            self.endian = ">"
+        else:
+            raise ElfFormatError(f"{self.file_path} has unknown ELF data encoding {self.data[5]}")
+        (self.shoff,) = struct.unpack_from(self.endian + "Q", self.data, 0x28)
+        self.shentsize, self.shnum, self.shstrndx = struct.unpack_from(self.endian + "HHH", self.data, 0x3a)
+        if self.shoff != 0 and self.shentsize != ELF64_SHDR_SIZE:
+            raise ElfFormatError(f"{self.file_path} has unexpected section header size {self.shentsize}")
+
+    def _read_section_header(self, index):
+        header_offset = self.shoff + index * ELF64_SHDR_SIZE
+        if header_offset + ELF64_SHDR_SIZE > len(self.data):
+            raise ElfFormatError(f"section header {index} of {self.file_path} is out of file")
+        return header_offset, struct.unpack_from(self.endian + "IIQQQQIIQQ", self.data, header_offset)
+
+    def _parse_section_headers(self):
+        if self.shoff == 0:
+            return []
+        shnum = self.shnum
+        shstrndx = self.shstrndx
+        if shnum == 0 or shstrndx == SHN_XINDEX:
+            # real values are kept in section header 0 when they overflow 16 bits
+            _, first_header = self._read_section_header(0)
+            shnum = first_header[5] if shnum == 0 else shnum
+            shstrndx = first_header[6] if shstrndx == SHN_XINDEX else shstrndx
+        headers = [self._read_section_header(index) for index in range(shnum)]
+        if shstrndx == SHN_UNDEF or shstrndx >= shnum:
+            raise ElfFormatError(f"{self.file_path} has no section name string table")
+        strtab_header = headers[shstrndx][1]
+        strtab_offset, strtab_size = strtab_header[4], strtab_header[5]
+        if strtab_offset + strtab_size > len(self.data):
+            raise ElfFormatError(f"section name string table of {self.file_path} is out of file")
+        sections = []
+        for index, (header_offset, header) in enumerate(headers):
+            name_offset, sh_type, flags, addr, offset, size, link, info, addralign, entsize = header
+            if name_offset >= strtab_size:
+                raise ElfFormatError(f"name of section {index} of {self.file_path} is out of string table")
+            sections.append(ElfSection(index, self.read_string(strtab_offset + name_offset), sh_type, flags, addr, \
+                offset, size, link, info, addralign, entsize, header_offset))
+        return sections
+
+    def read_string(self, offset):
+        end = self.data.find(b"\x00", offset)
+        if end < 0:
+            raise ElfFormatError(f"string at {offset} of {self.file_path} is not terminated")
+        return self.data[offset:end].decode("utf-8", errors="replace")
+
+    def get_section_sizes(self):
+        return {section.name: section.size for section in self.sections if section.name}
+
+
+def get_section_sizes(file_path):
+    """{section name: section size} of an ELF64 object, in section header order"""
+    with ElfFile(file_path) as elf_file:
+        return elf_file.get_section_sizes()
+
+
+def get_text_section_size(file_path):
+    """size of the first section whose name contains .text, the same one `llvm-objdump -h` lists first,
+    return None when there is no such section"""
+    with ElfFile(file_path) as elf_file:
+        for section in elf_file.sections:
+            if ".text" in section.name:
+                return section.size
+    return None
+
+
+def _collect_symbol_names(elf_file):
+    """{strtab section index: [(offset of symbol entry, symbol name)]} of all symbol tables"""
+    symbols = {}
+    for symtab in elf_file.sections:
+        if symtab.type != SHT_SYMTAB:
+            continue
+        if symtab.link >= len(elf_file.sections) or elf_file.sections[symtab.link].type != SHT_STRTAB:
+            raise ElfFormatError(f"symbol table {symtab.name} of {elf_file.file_path} has no string table")
+        strtab = elf_file.sections[symtab.link]
+        entsize = symtab.entsize if symtab.entsize != 0 else ELF64_SYM_SIZE
+        if entsize < ELF64_SYM_SIZE or symtab.offset + symtab.size > len(elf_file.data):
+            raise ElfFormatError(f"symbol table {symtab.name} of {elf_file.file_path} is broken")
+        names = symbols.setdefault(strtab.index, [])
+        for sym_offset in range(symtab.offset, symtab.offset + symtab.size - entsize + 1, entsize):
+            (name_offset,) = struct.unpack_from(elf_file.endian + "I", elf_file.data, sym_offset)
+            if name_offset == 0:
+                continue
+            if name_offset >= strtab.size:
+                raise ElfFormatError(f"symbol name at {sym_offset} of {elf_file.file_path} is out of string table")
+            names.append((sym_offset, elf_file.read_string(strtab.offset + name_offset)))
+    return symbols
+
+
+def _gen_renamed_content(elf_file, symbols, renames):
+    content = bytearray(elf_file.data)
+    for strtab_index, names in symbols.items():
+        renamed = [(sym_offset, renames[name]) for sym_offset, name in names if name in renames]
+        if not renamed:
+            continue
+        strtab = elf_file.sections[strtab_index]
+        # the old string table is kept as prefix of the new one at the end of file,
+        # so section names and names of other symbols keep their offsets
+        content += b"\x00" * (-len(content) % ELF_ALIGN)
+        new_strtab_offset = len(content)
+        content += elf_file.data[strtab.offset:strtab.offset + strtab.size]
+        new_name_offsets = {}
+        for sym_offset, new_name in renamed:
+            if new_name not in new_name_offsets:
+                new_name_offsets[new_name] = len(content) - new_strtab_offset
+                content += new_name.encode("utf-8") + b"\x00"
+            struct.pack_into(elf_file.endian + "I", content, sym_offset, new_name_offsets[new_name])
+        struct.pack_into(elf_file.endian + "Q", content, strtab.header_offset + SHDR_OFFSET_FIELD, new_strtab_offset)
+        struct.pack_into(elf_file.endian + "Q", content, strtab.header_offset + SHDR_SIZE_FIELD, \
+            len(content) - new_strtab_offset)
+    return content
+
+
+def get_symbol_names(file_path):
+    """names of all named symbols of an ELF64 object, in symbol table order"""
+    with ElfFile(file_path) as elf_file:
+        return [name for names in _collect_symbol_names(elf_file).values() for _, name in names]
+
+
+def clone_with_renamed_symbols(src_path, clones):
+    """write every clone of src_path in one pass over a single mmap of it, the same as
+    `cp src dst; llvm-objcopy --redefine-sym old=new dst` for each clone.
+    clones: [(dst_path, {old symbol name: new symbol name})]"""
+    with ElfFile(src_path) as elf_file:
+        symbols = _collect_symbol_names(elf_file)
+        for dst_path, renames in clones:
+            atomic_write(dst_path, _gen_renamed_content(elf_file, symbols, renames))
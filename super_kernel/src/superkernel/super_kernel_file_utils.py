@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel file utils
+"""
+import os
+import stat
+import shutil
+import hashlib
+import threading
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def calc_file_sha256(file_path):
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(READ_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def gen_content_tag(*items):
+    """short digest of items used in content named files, e.g. `add_<tag>_split1.o`"""
+    sha256 = hashlib.sha256()
+    for item in items:
+        sha256.update(f"{item}\n".encode())
+    return "_" + sha256.hexdigest()[:16]
+
+
+def gen_tmp_path(dst_path):
+    # pid and thread id keep temporary files of concurrent writers apart
+    return f"{dst_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def remove_file_quietly(file_path):
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+def atomic_write(dst_path, content):
+    """write content into a temporary file, then rename it to dst_path,
+    readers never see a partially written file"""
+    tmp_path = gen_tmp_path(dst_path)
+    mode = 'wb' if isinstance(content, (bytes, bytearray, memoryview)) else 'w'
+    try:
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, \
+            stat.S_IWUSR | stat.S_IRUSR), mode) as ofd:
+            ofd.write(content)
+        os.replace(tmp_path, dst_path)
+    finally:
+        remove_file_quietly(tmp_path)
+
+
+def atomic_copy(src_path, dst_path):
+    tmp_path = gen_tmp_path(dst_path)
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    finally:
+        remove_file_quietly(tmp_path)
@@ -14,63 +14,122 @@ super kernel op infos
 """
 import os
 import json
+import struct
 import subprocess
 import math
+import heapq
 import shutil
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 
 from asc_op_compile_base.asc_op_compiler.super_kernel_utility import AscendCLogLevel, CompileStage, CommonUtility, \
-    get_op_debug_config, KernelMetaType
-from asc_op_compile_base.asc_op_compiler.super_kernel_option_parse import parse_super_kernel_options
+    KernelMetaType
+from .super_kernel_options import parse_options, get_extension_option
 from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SuperKernelLinkMode, SuperKernelPreLoadMode, \
     SuperKernelDataCacheMode, SuperKernelEarlyStartMode, SubOperatorType, SuperKernelStreamFusionMode, \
     SuperKernelDebugDcciAllMode, SuperKernelDebugSyncAllMode, SuperKernelFeedSyncAllMode, SuperKernelProfilingMode, \
     AI_CORE_STR, ERR_CODE
 from .super_kernel_sub_op_infos import SubOperatorInfos
-
-
-def gen_symbol_rename_file(dynamic_func_names, rename_file_path_list, split_mode):
-    lines_list = []
-    new_kernel_names_list = []
-    chip_version = CommonUtility.get_chip_version()
-    for _ in range(1, split_mode):
-        lines_list.append([])
-        new_kernel_names_list.append([])
-
+from .super_kernel_elf import clone_with_renamed_symbols
+from .super_kernel_context import get_compile_context
+from .super_kernel_file_utils import calc_file_sha256, gen_tmp_path, gen_content_tag, atomic_write, \
+    remove_file_quietly
+from .super_kernel_sync_graph import SyncGraph
+from .super_kernel_cost_model import get_cost_model, gen_mix_kernel_type_candidates, select_kernel_type_and_block_dim, \
+    get_core_num
+
+# bytes of sync all config of one sub op on one core type
+SYNC_ALL_SLOT_SIZE = 64
+
+
+def gen_symbol_rename_pairs(dynamic_func_names, split_mode):
+    """[[(kernel_name, kernel_name_split{i})] for split index i in 1 ~ split_mode - 1]"""
+    rename_pairs_list = [[] for _ in range(1, split_mode)]
+    chip_version = get_compile_context().get_chip_version()
     for tiling_key in dynamic_func_names:
         kernel_info_of_tiling_key = dynamic_func_names[tiling_key]
         for arch_name in [AI_CORE_STR, f"dav-{chip_version}-cube", f"dav-{chip_version}-vec"]:
             if arch_name in kernel_info_of_tiling_key:
                 kernel_name = kernel_info_of_tiling_key[arch_name]
                 for i in range(1, split_mode):
-                    new_kernel_name = f'{kernel_name}_split{i}'
-                    lines_list[i - 1].append(f'{kernel_name} {new_kernel_name}')
-                    new_kernel_names_list[i - 1].append(new_kernel_name)
+                    rename_pairs_list[i - 1].append((kernel_name, f'{kernel_name}_split{i}'))
+    return rename_pairs_list
+
+
+def gen_symbol_rename_file(dynamic_func_names, rename_file_path_list, split_mode):
+    rename_pairs_list = gen_symbol_rename_pairs(dynamic_func_names, split_mode)
     for i in range(1, split_mode):
-        with open(rename_file_path_list[i - 1], 'w', encoding='utf-8') as file:
-            for line in lines_list[i - 1]:
-                file.write(line + '\n')
-    return new_kernel_names_list
+        atomic_write(rename_file_path_list[i - 1], "".join(f'{kernel_name} {new_kernel_name}\n' \
+            for kernel_name, new_kernel_name in rename_pairs_list[i - 1]))
+    return [[new_kernel_name for _, new_kernel_name in rename_pairs] for rename_pairs in rename_pairs_list]
 
 
-def split_dynamic_o_in_super_kernel(orign_bin_path, rename_file_path, i, compile_log_path):
+def clone_split_objs(orign_bin_path, split_renames, compile_log_path):
+    """write all split clones of orign_bin_path with renamed symbols in process,
+    split_renames: [(split .o path, {old symbol name: new symbol name})].
+    return False when the clones have to be made by cp and llvm-objcopy"""
+    try:
+        clone_with_renamed_symbols(orign_bin_path, split_renames)
+    except (OSError, ValueError, struct.error) as err:
+        CommonUtility.print_compile_log("", \
+            f"clone {orign_bin_path} in process failed, fall back to llvm-objcopy, reason is: {err}", \
+            AscendCLogLevel.LOG_DEBUG)
+        return False
+    CommonUtility.dump_compile_log([f'clone {orign_bin_path} to'] + \
+        [f'{split_o_path} {renames}' for split_o_path, renames in split_renames], \
+        CompileStage.SPLIT_SUB_OBJS, compile_log_path)
+    return True
+
+
+def is_split_objs_reusable(split_o_paths, artifact_entry, content_tag=""):
+    """split clones are reusable in a committed artifact entry, or when they are named by content_tag,
+    since content named files are only published by rename once fully written"""
+    if content_tag == "" and (artifact_entry is None or not artifact_entry.prepared):
+        return False
+    return all(os.path.exists(split_o_path) for split_o_path in split_o_paths)
+
+
+def publish_split_o(work_bin_path, new_bin_path, compile_log_path):
+    cmds = ['rename', f'{work_bin_path}', f'{new_bin_path}']
+    try:
+        CommonUtility.dump_compile_log(cmds, CompileStage.SPLIT_SUB_OBJS, compile_log_path)
+        os.replace(work_bin_path, new_bin_path)
+    except Exception as err:
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, (f"{' '.join(cmds)} failed", err))
+
+
+def split_dynamic_o_in_super_kernel(orign_bin_path, rename_file_path, i, compile_log_path, artifact_entry=None, \
+        content_tag=""):
     filename = os.path.basename(orign_bin_path)
-    kernel_meta_dir = CommonUtility.get_kernel_meta_dir()
-    new_bin_path = os.path.join(kernel_meta_dir, filename[:-2] + f"_split{i}.o")
+    if artifact_entry is None:
+        kernel_meta_dir = get_compile_context().get_kernel_meta_dir()
+    else:
+        kernel_meta_dir = artifact_entry.entry_dir
+    new_bin_path = os.path.join(kernel_meta_dir, filename[:-2] + f"{content_tag}_split{i}.o")
+    if is_split_objs_reusable([new_bin_path], artifact_entry, content_tag):
+        CommonUtility.dump_compile_log([f'reuse split .o path: {new_bin_path}'], \
+            CompileStage.SPLIT_SUB_OBJS, compile_log_path)
+        return new_bin_path
     if os.path.exists(new_bin_path):
         str_lst = f'WARNING: ALLREADY EXISTS split .o path: {new_bin_path}'
         CommonUtility.dump_compile_log([str_lst], CompileStage.SPLIT_SUB_OBJS, compile_log_path)
-    cmds = ['cp'] + ['-rfL'] + [f'{orign_bin_path}'] + [f'{new_bin_path}']
+    # clones are made aside and renamed, sub ops of one binary split by concurrent workers
+    # never see a partial object
+    work_bin_path = gen_tmp_path(new_bin_path)
+    cmds = ['cp'] + ['-rfL'] + [f'{orign_bin_path}'] + [f'{work_bin_path}']
     try:
         CommonUtility.dump_compile_log(cmds, CompileStage.SPLIT_SUB_OBJS, compile_log_path)
         subprocess.run(cmds)
     except Exception as err:
         CommonUtility().ascendc_raise_python_err(ERR_CODE, (f"{' '.join(cmds)} failed", err))
-    cmds = ['llvm-objcopy', f'--redefine-syms={rename_file_path}', f'{new_bin_path}']
+    cmds = ['llvm-objcopy', f'--redefine-syms={rename_file_path}', f'{work_bin_path}']
     try:
         CommonUtility.dump_compile_log(cmds, CompileStage.SPLIT_SUB_OBJS, compile_log_path)
         subprocess.run(cmds)
     except Exception as err:
         CommonUtility().ascendc_raise_python_err(ERR_CODE, (f"{' '.join(cmds)} failed", err))
+    publish_split_o(work_bin_path, new_bin_path, compile_log_path)
     return new_bin_path
 
 
@@ -81,9 +140,57 @@ def get_sub_op_streamid(op_info):
     return -1
 
 
+def get_asc_path():
+    """asc dir of cann toolkit, headers of AscendC included by super kernel are under it"""
+    ascend_home_path = os.environ.get('ASCEND_HOME_PATH')
+    import platform
+    archlinux = platform.machine()
+    if ascend_home_path is None or ascend_home_path == '':
+        asc_opc_path = shutil.which("asc_opc")
+        if asc_opc_path is not None:
+            asc_opc_path_link = os.path.dirname(asc_opc_path)
+            asc_opc_real_path = os.path.realpath(asc_opc_path_link)
+            ascend_home_path = os.path.realpath(
+                    os.path.join(asc_opc_real_path, "..", ".."))
+        else:
+            ascend_home_path = "/usr/local/Ascend/latest"
+
+    if 'x86' in archlinux:
+        asc_path = os.path.realpath(os.path.join(ascend_home_path, "x86_64-linux", "asc"))
+    else:
+        asc_path = os.path.realpath(os.path.join(ascend_home_path, "aarch64-linux", "asc"))
+    if asc_path is None:
+        asc_path = os.path.realpath(os.path.join(ascend_home_path, "compiler", "asc"))
+    return asc_path
+
+
+class SubOpEventIndex:
+    """positions in info_base of the senders and receivers of each event id, built in one pass over sub ops"""
+    def __init__(self, info_base):
+        self.senders = {}
+        self.receivers = {}
+        for pos, sub_op in enumerate(info_base):
+            for event_id in sub_op.send_event_list:
+                self.senders.setdefault(event_id, []).append(pos)
+            for event_id in sub_op.recv_event_list:
+                self.receivers.setdefault(event_id, []).append(pos)
+
+    def connect_set(self, send_pos, recv_op):
+        """same as sub_op_connect_set of op at send_pos and recv_op"""
+        return {event_id for event_id in recv_op.recv_event_list if send_pos in self.senders.get(event_id, [])}
+
+
 class SuperOperatorInfos:
-    def __init__(self, kernel_infos, super_kernel_name):
+    def __init__(self, kernel_infos, super_kernel_name, artifact_store=None, jobs=1, compile_context=None, \
+            content_naming=False):
         self.sub_decl_list = {}
+        self.compile_context = compile_context if compile_context is not None else get_compile_context()
+        # name generated source, split clones and rename files by content instead of pid tag and fixed names
+        self.content_naming = content_naming
+        # store of prepared sub op artifacts, only set in incremental rebuild
+        self.artifact_store = artifact_store
+        # max worker threads of sub op preparation, 0 means cpu count
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
         self.op_list = kernel_infos["op_list"]
         self.kernel_name: str = super_kernel_name
         self.compile_log_path = None
@@ -91,18 +198,21 @@ class SuperOperatorInfos:
         self.info_base = []
         self.super_kernel_params = []
         self.enable_double_stream: bool = False
-        self.op_options = parse_super_kernel_options(kernel_infos.get("super_kernel_options", ""))
+        self.op_options = parse_options(kernel_infos.get("super_kernel_options", ""))
         self.split_mode = self.op_options.get('split-mode', 4)
         self.profiling_mode = self.op_options.get('profiling', SuperKernelProfilingMode.ProfilingDisable)
         self.stream_fusin_mode = self.op_options.get('stream-fusion', SuperKernelStreamFusionMode.StreamFusionDisable)
         self.feed_sync_all_mode = self.op_options.get('feed-sync-all',
             SuperKernelFeedSyncAllMode.FeedSyncAllDisable)
         self.inner_event_id_set = set()
+        # event index of info_base, built when checking real streams
+        self.event_index = None
         for index, op_info in enumerate(self.op_list):
             if "json_path" not in op_info:
                 continue
             stream_id = get_sub_op_streamid(op_info)
-            self.info_base.append(SubOperatorInfos(index, op_info, stream_id, self.op_options, self.compile_log_path))
+            self.info_base.append(SubOperatorInfos(index, op_info, stream_id, self.op_options, self.compile_log_path, \
+                self.compile_context))
         self.init_sub_operators()
         self.kernel_type: KernelMetaType = KernelMetaType.KERNEL_TYPE_MAX
         self.timestamp_option: bool = False
@@ -114,8 +224,8 @@ class SuperOperatorInfos:
         self.get_summary_type_and_options()
         self.adjust_dynamic_op_block_dim()
         self.compile_info: json = None
-        kernel_meta_dir = CommonUtility.get_kernel_meta_dir()
-        file_name_tag = CommonUtility.get_distinct_filename_tag() + "_kernel.cpp"
+        kernel_meta_dir = self.compile_context.get_kernel_meta_dir()
+        file_name_tag = self.compile_context.get_distinct_filename_tag() + "_kernel.cpp"
         self.kernel_file = os.path.realpath(os.path.join(kernel_meta_dir, self.kernel_name + file_name_tag))
         self.gen_op_options()
         self.gen_super_kernel_params()
@@ -123,10 +233,10 @@ class SuperOperatorInfos:
         self.vec_op_list: list = []
         self.gen_compile_info()
         if self.enable_double_stream is True:
-            self.split_op_by_kernel_type()
+            self.split_op_by_kernel_type(self.event_index)
             self.insert_sync_by_stream_idx()
             self.print_send_recv_info("[Sync by stream idx]")
-            self.insert_sync_by_event()
+            self.insert_sync_by_event(self.event_index)
             self.print_send_recv_info("[Sync by evnet]")
             self.insert_sync_for_notify()
             self.print_send_recv_info("[Sync by notify]")
@@ -149,6 +259,8 @@ class SuperOperatorInfos:
             self.op_options.get('debug-dcci-all', SuperKernelDebugDcciAllMode.DebugDcciAllDisable)
         self.debug_sync_all_mode: SuperKernelDebugSyncAllMode = \
             self.op_options.get('debug-sync-all', SuperKernelDebugSyncAllMode.DebugSyncAllDisable)
+        # feed sync all configs are selected by epoch of launch instead of cleared in every launch
+        self.sync_all_epoch: bool = get_extension_option(self.op_options, 'sync-all-epoch')
 
 
     def print_send_recv_info(self, stage):
@@ -158,12 +270,55 @@ class SuperOperatorInfos:
                 [f'op_name: {sub_op.kernel_name_for_multi_stream}, send_info: {sub_op.send_info}, \
                 recv_info: {sub_op.recv_info}'], CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
 
-    def split_op_by_kernel_type(self):
+    def gen_schedule_order(self, event_index=None):
+        """
+        order of sub ops on aic and aiv queue for any number of real streams: op list order as far as stream
+        order and events allow, an op is scheduled once all former ops of its stream and all senders of its
+        events are scheduled
+        """
+        op_num = len(self.info_base)
+        next_ops = [set() for _ in range(op_num)]
+        stream_last_pos = {}
+        for pos, sub_op in enumerate(self.info_base):
+            former_pos = stream_last_pos.get(sub_op.stream_index)
+            if former_pos is not None:
+                next_ops[former_pos].add(pos)
+            stream_last_pos[sub_op.stream_index] = pos
+        if event_index is None:
+            event_index = SubOpEventIndex(self.info_base)
+        for event_id, recv_pos_list in event_index.receivers.items():
+            for sender_pos in event_index.senders.get(event_id, []):
+                for pos in recv_pos_list:
+                    if sender_pos != pos:
+                        next_ops[sender_pos].add(pos)
+
+        pre_num = [0] * op_num
+        for pos in range(op_num):
+            for next_pos in next_ops[pos]:
+                pre_num[next_pos] += 1
+        ready = [pos for pos in range(op_num) if pre_num[pos] == 0]
+        heapq.heapify(ready)
+        schedule_order = []
+        while ready:
+            pos = heapq.heappop(ready)
+            schedule_order.append(self.info_base[pos])
+            for next_pos in next_ops[pos]:
+                pre_num[next_pos] -= 1
+                if pre_num[next_pos] == 0:
+                    heapq.heappush(ready, next_pos)
+        if len(schedule_order) != op_num:
+            pending = [sub_op.kernel_name for pos, sub_op in enumerate(self.info_base) if pre_num[pos] > 0]
+            CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+                (f"ERROR: stream order and events of sub ops form a cycle: {pending}"))
+        return schedule_order
+
+    def split_op_by_kernel_type(self, event_index=None):
         """
         cub_op_list save all cube ops and mix ops
         vec_op_list save all vec ops and mix ops
+        both lists follow gen_schedule_order
         """
-        for sub_op in self.info_base:
+        for sub_op in self.gen_schedule_order(event_index):
             if sub_op.kernel_type in [KernelMetaType.KERNEL_TYPE_AIC_ONLY, \
                 KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, \
                 KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2]:
@@ -241,30 +396,28 @@ class SuperOperatorInfos:
                 pre_op = current_op
 
 
-    def insert_sync_by_event(self):
+    def insert_sync_by_event(self, event_index=None):
         '''
         insert sync event according to send_event_list and recv_event_list
         e.g.
         op1: send_event_list [100, 101]
         op2: recv_event_list [100, 101]
         then insert sync: op1->op2
+        the last sender and last receiver of an event are synced
         '''
-        event_send = {}
-        event_recv = {}
-
-        for sub_op in self.info_base:
-            for event_id in sub_op.send_event_list:
-                event_send[event_id] = sub_op
-            for event_id in sub_op.recv_event_list:
-                event_recv[event_id] = sub_op
-
-        for send_id in event_send.keys():
-            if event_recv.get(send_id) is not None:
-                if event_send[send_id] == event_recv[send_id]:
-                    CommonUtility().ascendc_raise_python_err(ERR_CODE, \
-(f"send op {event_send[send_id].kernel_name_for_multi_stream} can not same with recv op \
-{event_recv[send_id].kernel_name_for_multi_stream}"))
-                self.insert_sync_event(event_send[send_id], event_recv[send_id])
+        if event_index is None:
+            event_index = SubOpEventIndex(self.info_base)
+        for send_id, send_pos_list in event_index.senders.items():
+            recv_pos_list = event_index.receivers.get(send_id)
+            if recv_pos_list is None:
+                continue
+            send_op = self.info_base[send_pos_list[-1]]
+            recv_op = self.info_base[recv_pos_list[-1]]
+            if send_op == recv_op:
+                CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+(f"send op {send_op.kernel_name_for_multi_stream} can not same with recv op \
+{recv_op.kernel_name_for_multi_stream}"))
+            self.insert_sync_event(send_op, recv_op)
 
     def insert_sync_for_notify(self):
         for sub_op in self.info_base[:-1]:
@@ -286,208 +439,38 @@ class SuperOperatorInfos:
                         self.insert_sync_event(sub_op, next_op)
 
 
-    def remove_info_by_name(self, send_op_name, recv_op_name, is_delete_recv_info, update_content=""):
-        """delete sync event
-        Args:
-            send_op_name (str): sent op name
-            recv_op_name (str): recv op name
-            is_delete_recv_info (bool): process recv_info or send_info
-            update_content (res): delete directly if update_content is "" else replace dict by update_content
-        """
-        for sub_op in self.info_base:
-            if sub_op.kernel_name_for_multi_stream == send_op_name:
-                if update_content == "":
-                    if is_delete_recv_info is True:
-                        sub_op.recv_info.pop(recv_op_name, "unknown")
-                    else:
-                        sub_op.send_info.pop(recv_op_name, 'unknown')
-                else:
-                    if is_delete_recv_info is True:
-                        sub_op.recv_info[recv_op_name] = update_content
-                    else:
-                        sub_op.send_info[recv_op_name] = update_content
-
+    def gen_sync_graph(self):
+        return SyncGraph(self.info_base, self.cub_op_list, self.vec_op_list)
 
-    def get_remain_events(self, origin_events, delete_event):
-        split_events = origin_events.split(";")
-        remain_events = []
+    def remove_crossed_line_sync(self, sync_graph=None):
+        (sync_graph or self.gen_sync_graph()).remove_crossed_line_sync()
 
-        for sub_event in split_events:
-            if sub_event != delete_event:
-                remain_events.append(sub_event)
+    def remove_multi_send_info(self, sync_graph=None):
+        (sync_graph or self.gen_sync_graph()).remove_multi_send_info()
 
-        return ";".join(remain_events)
-
-
-    def get_idx(self, op_name, is_vec_list):
-        """
-        get idx in vec_op_list or cub_op_list
-        op_name: op kernel name
-        is_vec_list: get idx in vec_op_list if True else get idx in cub_op_list
-        """
-        if is_vec_list:
-            for sub_op in self.vec_op_list:
-                if sub_op.kernel_name_for_multi_stream == op_name:
-                    return self.vec_op_list.index(sub_op)
-        else:
-            for sub_op in self.cub_op_list:
-                if sub_op.kernel_name_for_multi_stream == op_name:
-                    return self.cub_op_list.index(sub_op)
-        return 0
-
-    def judge_remove(self, send_name, recv_name, is_cub_to_vec):
-        if is_cub_to_vec:
-            send_idx = self.get_idx(send_name, False)
-            recv_idx = self.get_idx(recv_name, True)
-            for sub_op in self.vec_op_list[0:recv_idx][::-1]:
-                for key, value in sub_op.recv_info.items():
-                    if "cub:vec" in value:
-                        send_idx1 = self.get_idx(key, False)
-                        recv_idx1 = self.get_idx(sub_op.kernel_name_for_multi_stream, True)
-                        if recv_idx1 < recv_idx and send_idx1 > send_idx:
-                            return True
-            return False
-        else:
-            send_idx = self.get_idx(send_name, True)
-            recv_idx = self.get_idx(recv_name, False)
-            for sub_op in self.cub_op_list[0:recv_idx][::-1]:
-                for key, value in sub_op.recv_info.items():
-                    if "vec:cub" in value:
-                        send_idx1 = self.get_idx(key, True)
-                        recv_idx1 = self.get_idx(sub_op.kernel_name_for_multi_stream, False)
-                        if recv_idx1 < recv_idx and send_idx1 > send_idx:
-                            return True
-            return False
-
-
-    def remove_crossed_line_sync(self):
-        delete_event = []
-        for sub_op in self.cub_op_list:
-            for key, value in sub_op.send_info.items():
-                value_list = value.split(";")
-                for sub_value in value_list:
-                    if sub_value in "cub:vec":
-                        flag = self.judge_remove(sub_op.kernel_name_for_multi_stream, key, True)
-                        if flag is True:
-                            delete_event.append(\
-                                [sub_op.kernel_name_for_multi_stream, key, False, \
-                                self.get_remain_events(value, "cub:vec")])
-                            delete_event.append(\
-                                [key, sub_op.kernel_name_for_multi_stream, True, \
-                                self.get_remain_events(value, "cub:vec")])
-
-        for sub_op in self.vec_op_list:
-            for key, value in sub_op.send_info.items():
-                value_list = value.split(";")
-                for sub_value in value_list:
-                    if sub_value in "vec:cub":
-                        flag = self.judge_remove(sub_op.kernel_name_for_multi_stream, key, False)
-                        if flag is True:
-                            delete_event.append(\
-                                [sub_op.kernel_name_for_multi_stream, key, False, \
-                                self.get_remain_events(value, "vec:cub")])
-                            delete_event.append(\
-                                [key, sub_op.kernel_name_for_multi_stream, True, \
-                                self.get_remain_events(value, "vec:cub")])
-
-        for item in delete_event:
-            self.remove_info_by_name(item[0], item[1], item[2], item[3])
-
-
-    def remove_multi_send_info(self):
-        delete_event = []
-        for op in self.vec_op_list:
-            if len(op.send_info) > 1:
-                send_info_list = []
-                for key, value in op.send_info.items():
-                    if "vec:cub" in value:
-                        send_info_list.append([key, value, self.get_idx(key, False)])
-                if len(send_info_list) > 1:
-                    send_info_list.sort(key=lambda x: x[2])
-                    for sub_info in send_info_list[1:]:
-                        delete_event.append(\
-                            [op.kernel_name_for_multi_stream, sub_info[0], False, \
-                            self.get_remain_events(sub_info[1], "vec:cub")])
-                        delete_event.append(\
-                            [sub_info[0], op.kernel_name_for_multi_stream, True, \
-                            self.get_remain_events(sub_info[1], "vec:cub")])
-
-        for item in delete_event:
-            self.remove_info_by_name(item[0], item[1], item[2], item[3])
-
-        delete_event = []
-        for op in self.cub_op_list:
-            if len(op.send_info) > 1:
-                send_info_list = []
-                for key, value in op.send_info.items():
-                    if "cub:vec" in value:
-                        send_info_list.append([key, value, self.get_idx(key, True)])
-                if len(send_info_list) > 1:
-                    send_info_list.sort(key=lambda x: x[2])
-                    for sub_info in send_info_list[1:]:
-                        delete_event.append(\
-                            [op.kernel_name_for_multi_stream, sub_info[0], False, \
-                            self.get_remain_events(sub_info[1], "cub:vec")])
-                        delete_event.append(\
-                            [sub_info[0], op.kernel_name_for_multi_stream, True, \
-                            self.get_remain_events(sub_info[1], "cub:vec")])
-
-        for item in delete_event:
-            self.remove_info_by_name(item[0], item[1], item[2], item[3])
-
-
-    def remove_multi_recv_info(self):
-        delete_event = []
-        for op in self.vec_op_list:
-            if len(op.recv_info) > 1:
-                recv_info_list = []
-                for key, value in op.recv_info.items():
-                    if "cub:vec" in value:
-                        recv_info_list.append([key, value, self.get_idx(key, False)])
-                if len(recv_info_list) > 1:
-                    recv_info_list.sort(key=lambda x: x[2], reverse=True)
-                    for sub_info in recv_info_list[1:]:
-                        delete_event.append(\
-                            [op.kernel_name_for_multi_stream, sub_info[0], True, \
-                            self.get_remain_events(sub_info[1], "cub:vec")])
-                        delete_event.append(\
-                            [sub_info[0], op.kernel_name_for_multi_stream, False, \
-                            self.get_remain_events(sub_info[1], "cub:vec")])
-
-        for item in delete_event:
-            self.remove_info_by_name(item[0], item[1], item[2], item[3])
-
-        delete_event = []
-        for op in self.cub_op_list:
-            if len(op.recv_info) > 1:
-                recv_info_list = []
-                for key, value in op.recv_info.items():
-                    if "vec:cub" in value:
-                        recv_info_list.append([key, value, self.get_idx(key, True)])
-                if len(recv_info_list) > 1:
-                    recv_info_list.sort(key=lambda x: x[2], reverse=True)
-                    for sub_info in recv_info_list[1:]:
-                        delete_event.append(\
-                            [op.kernel_name_for_multi_stream, sub_info[0], True, \
-                            self.get_remain_events(sub_info[1], "vec:cub")])
-                        delete_event.append(\
-                            [sub_info[0], op.kernel_name_for_multi_stream, False, \
-                            self.get_remain_events(sub_info[1], "vec:cub")])
-
-        for item in delete_event:
-            self.remove_info_by_name(item[0], item[1], item[2], item[3])
+    def remove_multi_recv_info(self, sync_graph=None):
+        (sync_graph or self.gen_sync_graph()).remove_multi_recv_info()
 
+    def remove_transitive_sync(self, sync_graph=None):
+        """remove syncs implied by other syncs, must run after the crossed line and multi event passes which
+        leave cub:vec and vec:cub syncs in matching order of send and wait"""
+        return (sync_graph or self.gen_sync_graph()).remove_transitive_sync()
 
     def optimize_sync_pass(self):
         CommonUtility.print_compile_log("", "[INIT STATE]:", AscendCLogLevel.LOG_DEBUG)
         self.print_vec_cub_list_info()
-        self.remove_crossed_line_sync()
+        sync_graph = self.gen_sync_graph()
+        self.remove_crossed_line_sync(sync_graph)
         CommonUtility.print_compile_log("", "[AFTER REMOVE CORESS LINE SYNC]:", AscendCLogLevel.LOG_DEBUG)
         self.print_vec_cub_list_info()
-        self.remove_multi_send_info()
-        self.remove_multi_recv_info()
+        self.remove_multi_send_info(sync_graph)
+        self.remove_multi_recv_info(sync_graph)
         CommonUtility.print_compile_log("", "[AFTER REMOVE MULTI EVENT SYNC]:", AscendCLogLevel.LOG_DEBUG)
         self.print_vec_cub_list_info()
+        removed_num = self.remove_transitive_sync(sync_graph)
+        CommonUtility.print_compile_log("", f"[AFTER REMOVE TRANSITIVE SYNC]: removed {removed_num} sync", \
+            AscendCLogLevel.LOG_DEBUG)
+        self.print_vec_cub_list_info()
 
     def print_vec_cub_list_info(self):
         CommonUtility.print_compile_log("", "[VEC LIST OP]:", AscendCLogLevel.LOG_DEBUG)
@@ -501,9 +484,19 @@ class SuperOperatorInfos:
                 stream_idx: {sub_op.stream_index}, send_info: {sub_op.send_info}, \
                 recv_info: {sub_op.recv_info}", AscendCLogLevel.LOG_DEBUG)
 
+    def set_content_named_kernel_file(self, content_sha256):
+        """name generated source by sha256 of its content, identical compiles of any process share one file"""
+        kernel_meta_dir = os.path.dirname(self.kernel_file)
+        file_name_tag = f"_{content_sha256[:16]}_kernel.cpp"
+        self.kernel_file = os.path.join(kernel_meta_dir, self.kernel_name + file_name_tag)
+        self.compile_info["kernel_file"] = self.kernel_file
+
     def creat_compile_log(self):
-        kernel_meta_dir = CommonUtility.get_kernel_meta_dir()
-        distinct_tag = CommonUtility.get_distinct_filename_tag()
+        if self.compile_context.compile_log_path is not None:
+            self.compile_log_path = self.compile_context.compile_log_path
+            return
+        kernel_meta_dir = self.compile_context.get_kernel_meta_dir()
+        distinct_tag = self.compile_context.get_distinct_filename_tag()
         self.compile_log_path = os.path.join(kernel_meta_dir, self.kernel_name + distinct_tag + '.log')
 
 
@@ -516,66 +509,112 @@ class SuperOperatorInfos:
         return union_set
 
 
-    def find_all_inner_event_id_set(self):
+    def find_all_inner_event_id_set(self, event_index=None):
+        """events sent by an op and received by an op of another stream, whatever their order in op list,
+        receivers may be listed before senders since the schedule order follows events"""
         sub_num = len(self.info_base)
         if sub_num <= 1:
             return
-        for i in range(0, sub_num - 1):
-            for j in range(i + 1, sub_num):
-                connect_set = self.sub_op_connect_set(self.info_base[i], self.info_base[j])
-                if self.info_base[i].stream_index == self.info_base[j].stream_index and connect_set:
-                    CommonUtility().ascendc_raise_python_err(ERR_CODE, (\
+        if event_index is None:
+            event_index = SubOpEventIndex(self.info_base)
+        for event_id, recv_pos_list in event_index.receivers.items():
+            for send_pos in event_index.senders.get(event_id, []):
+                for recv_pos in recv_pos_list:
+                    if send_pos == recv_pos:
+                        continue
+                    if self.info_base[send_pos].stream_index == self.info_base[recv_pos].stream_index:
+                        CommonUtility().ascendc_raise_python_err(ERR_CODE, (\
 f"ERROR: super kernel do not support self send/receive pair within 1 real stream: oplist: {self.op_list} "))
-                elif connect_set:
-                    self.inner_event_id_set.update(connect_set)
-
+                    else:
+                        self.inner_event_id_set.add(event_id)
 
 
     def check_sp_has_two_real_stream(self):
-        former_op = None
-        for _, op in enumerate(self.info_base):
-            if former_op is not None:
-                self_connet_set = self.sub_op_connect_set(op, op)
-                if self.sub_op_connect_set(op, op):
+        """
+        enter into multi real stream mode when neighbour ops of different streams are not connected by events,
+        any number of real streams is fused onto the aic and aiv queue, only with stream-fusion enabled
+        """
+        self.event_index = SubOpEventIndex(self.info_base)
+        former_pos = None
+        for pos, op in enumerate(self.info_base):
+            if former_pos is not None:
+                self_connet_set = self.event_index.connect_set(pos, op)
+                if self_connet_set:
                     CommonUtility().ascendc_raise_python_err(ERR_CODE, (\
                         f"ERROR: exists send-recv event pair within 1 op:"\
                         f" {op.kernel_name}, event id: {self_connet_set}, oplist:{self.op_list}"))
-                connect_set = self.sub_op_connect_set(former_op, op)
+                former_op = self.info_base[former_pos]
+                connect_set = self.event_index.connect_set(former_pos, op)
                 if former_op.stream_index == op.stream_index and connect_set:
                     CommonUtility().ascendc_raise_python_err(ERR_CODE, (\
 f"ERROR: super kernel do not support self send/receive pair within 1 real stream: oplist: {self.op_list} "))
                 elif former_op.stream_index != op.stream_index and not connect_set:
                     if self.stream_fusin_mode == SuperKernelStreamFusionMode.StreamFusionEnable:
+                        stream_num = len(set(sub_op.stream_index for sub_op in self.info_base))
                         CommonUtility.print_compile_log("", \
-                            f"enter into 2 real stream mode, oplist: {self.op_list} ", AscendCLogLevel.LOG_DEBUG)
+                            f"enter into {stream_num} real stream mode, oplist: {self.op_list} ", \
+                            AscendCLogLevel.LOG_DEBUG)
                         self.enable_double_stream = True
                         break
                     else:
                         CommonUtility().ascendc_raise_python_err(ERR_CODE, (\
-                        f"ERROR: super kernel do not support more than 2 real stream: oplist: {self.op_list} "))
-                if connect_set:
-                    self.inner_event_id_set.update(connect_set)
-            former_op = op
-        self.find_all_inner_event_id_set()
+                        f"ERROR: super kernel do not support more than 1 real stream without stream-fusion: "\
+                        f"oplist: {self.op_list} "))
+            former_pos = pos
+        self.find_all_inner_event_id_set(self.event_index)
+
+
+    def map_sub_operators(self, func, sub_ops):
+        """run func on every sub op in a bounded thread pool, results are in the order of sub_ops
+        and the first failure is raised in the calling thread, workers run in the compile context of caller"""
+        if self.jobs <= 1 or len(sub_ops) <= 1:
+            return [func(sub_op) for sub_op in sub_ops]
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(sub_ops))) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, func, sub_op) for sub_op in sub_ops]
+            return [future.result() for future in futures]
+
+
+    def load_sub_operator(self, sub_op):
+        sub_op.init_of_sub_operator_info()
+        if self.artifact_store is not None:
+            sub_op.artifact_entry = self.artifact_store.open_entry(sub_op, self.compile_log_path)
 
 
     def init_sub_operators(self):
-        for sub_op in self.info_base:
-            sub_op.init_of_sub_operator_info()
+        self.map_sub_operators(self.load_sub_operator, self.info_base)
+        if self.jobs > 1:
+            # binaries of all sub ops are extracted in parallel, into the dir of the compiling thread
+            extract_dir = os.path.join(self.compile_context.get_kernel_meta_dir(), str(threading.get_ident()))
+            for sub_op in self.info_base:
+                sub_op.extract_dir = extract_dir
+            self.map_sub_operators(lambda sub_op: sub_op.prepare_bin_files(), self.info_base)
         self.check_sp_has_two_real_stream()
         CommonUtility.dump_compile_log(['###INNER_ID:'] + list(self.inner_event_id_set), \
             CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
 
         param_offset = 0
         # c310 do not have ffts_addr
-        if CommonUtility.is_has_ffts_mode():
+        if self.compile_context.is_has_ffts_mode():
             param_offset += 1
         for sub_op in self.info_base:
             sub_op.param_offset = param_offset
-            sub_op.code_gen(self.inner_event_id_set, self.enable_double_stream)
+            self.code_gen_of_sub_operator(sub_op)
             param_offset += len(sub_op.kernel_params) + len(sub_op.extra_kernel_params)
 
 
+    def code_gen_of_sub_operator(self, sub_op):
+        artifact_entry = sub_op.artifact_entry
+        if artifact_entry is None:
+            sub_op.code_gen(self.inner_event_id_set, self.enable_double_stream)
+            return
+        code_gen_key = artifact_entry.gen_code_gen_key(sub_op, self.inner_event_id_set, \
+            self.enable_double_stream, self.op_options)
+        if artifact_entry.restore_code_gen(sub_op, code_gen_key):
+            return
+        sub_op.code_gen(self.inner_event_id_set, self.enable_double_stream)
+        artifact_entry.save_code_gen(sub_op, code_gen_key)
+
+
     def update_superkernel_blockdim_by_debug_options(self):
         debug_aic_num = self.op_options.get('debug-aic-num', 0)
         debug_aiv_num = self.op_options.get('debug-aiv-num', 0)
@@ -599,6 +638,16 @@ f"ERROR: super kernel do not support self send/receive pair within 1 real stream
 f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {debug_aiv_num} is invalid."))
 
 
+    def select_mix_type_and_block_dim(self, max_aic_num, max_aiv_num):
+        cost_model = get_cost_model(self.op_options)
+        kernel_type, block_dim, lines = select_kernel_type_and_block_dim(cost_model, \
+            gen_mix_kernel_type_candidates(max_aic_num, max_aiv_num), self.info_base, \
+            int(self.compile_context.get_soc_spec("ai_core_cnt")), \
+            int(self.compile_context.get_soc_spec("vector_core_cnt")))
+        CommonUtility.dump_compile_log(['[COST MODEL]'] + lines, CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
+        return kernel_type, block_dim
+
+
     def get_finale_type_and_block_dim(self, final_kernel_type, max_aic_num, max_aiv_num):
         # get kernel type of super kernel
         if final_kernel_type == 0b1:
@@ -616,6 +665,8 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
         elif final_kernel_type == 0b10000:
             self.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
             self.block_dim = max_aic_num
+        elif get_cost_model(self.op_options) is not None:
+            self.kernel_type, self.block_dim = self.select_mix_type_and_block_dim(max_aic_num, max_aiv_num)
         else:
             if max_aiv_num <= max_aic_num:
                 self.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
@@ -695,29 +746,132 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
             sub_op.adjust_dynamic_op(self.block_dim)
 
 
-    def split_o_in_super_kernel(self, orign_bin_path, origin_kernel_name, i):
+    def gen_split_content_tag(self, orign_bin_path, renames, artifact_entry=None):
+        """tag of split clones named by content, empty when content naming is off or the clones live in
+        an artifact entry, which is addressed by content already"""
+        if not self.content_naming or artifact_entry is not None:
+            return ""
+        return gen_content_tag(calc_file_sha256(orign_bin_path), renames)
+
+
+    def split_o_in_super_kernel(self, orign_bin_path, origin_kernel_name, i, artifact_entry=None, content_tag=""):
         filename = os.path.basename(orign_bin_path)
-        kernel_meta_dir = CommonUtility.get_kernel_meta_dir()
-        new_bin_path = os.path.join(kernel_meta_dir, filename[:-2] + f"_split{i}.o")
+        if artifact_entry is None:
+            kernel_meta_dir = self.compile_context.get_kernel_meta_dir()
+        else:
+            kernel_meta_dir = artifact_entry.entry_dir
+        new_bin_path = os.path.join(kernel_meta_dir, filename[:-2] + f"{content_tag}_split{i}.o")
+        new_kernel_name = f"{origin_kernel_name}_split{i}"
+        if is_split_objs_reusable([new_bin_path], artifact_entry, content_tag):
+            CommonUtility.dump_compile_log([f'reuse split .o path: {new_bin_path}'], \
+                CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
+            return new_bin_path, new_kernel_name
         if os.path.exists(new_bin_path):
             str_lst = f'WARNING: ALLREADY EXISTS split .o path: {new_bin_path}'
             CommonUtility.dump_compile_log([str_lst], CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
-        cmds = ['cp'] + ['-rfL'] + [f'{orign_bin_path}'] + [f'{new_bin_path}']
+        work_bin_path = gen_tmp_path(new_bin_path)
+        cmds = ['cp'] + ['-rfL'] + [f'{orign_bin_path}'] + [f'{work_bin_path}']
         try:
             CommonUtility.dump_compile_log(cmds, CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
             subprocess.run(cmds)
         except Exception as err:
             CommonUtility().ascendc_raise_python_err(ERR_CODE, (f"{' '.join(cmds)} failed", err))
-        new_kernel_name = f"{origin_kernel_name}_split{i}"
-        cmds = ['llvm-objcopy', f'--redefine-sym={origin_kernel_name}={new_kernel_name}', f'{new_bin_path}']
+        cmds = ['llvm-objcopy', f'--redefine-sym={origin_kernel_name}={new_kernel_name}', f'{work_bin_path}']
         try:
             CommonUtility.dump_compile_log(cmds, CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
             subprocess.run(cmds)
         except Exception as err:
             CommonUtility().ascendc_raise_python_err(ERR_CODE, (f"{' '.join(cmds)} failed", err))
+        publish_split_o(work_bin_path, new_bin_path, self.compile_log_path)
         return new_bin_path, new_kernel_name
 
 
+    def split_o_clones_in_super_kernel(self, orign_bin_path, origin_kernel_name, split_mode, artifact_entry=None):
+        """[(split .o path, new kernel name)] of split index 1 ~ split_mode - 1, made from one read of orign_bin_path"""
+        filename = os.path.basename(orign_bin_path)
+        if artifact_entry is None:
+            kernel_meta_dir = self.compile_context.get_kernel_meta_dir()
+        else:
+            kernel_meta_dir = artifact_entry.entry_dir
+        content_tag = self.gen_split_content_tag(orign_bin_path, origin_kernel_name, artifact_entry)
+        split_objs = [(os.path.join(kernel_meta_dir, filename[:-2] + f"{content_tag}_split{i}.o"), \
+            f"{origin_kernel_name}_split{i}") for i in range(1, split_mode)]
+        split_o_paths = [split_o_path for split_o_path, _ in split_objs]
+        if is_split_objs_reusable(split_o_paths, artifact_entry, content_tag):
+            CommonUtility.dump_compile_log(['reuse split .o path:'] + split_o_paths, \
+                CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
+            return split_objs
+        if clone_split_objs(orign_bin_path, [(split_o_path, {origin_kernel_name: new_kernel_name}) \
+                for split_o_path, new_kernel_name in split_objs], self.compile_log_path):
+            return split_objs
+        return [self.split_o_in_super_kernel(orign_bin_path, origin_kernel_name, i, artifact_entry, content_tag) \
+            for i in range(1, split_mode)]
+
+
+    def split_dynamic_o_clones_in_super_kernel(self, sub_operator, orign_bin_path):
+        """[(split .o path, new kernel names)] of split index 1 ~ split_mode - 1 of dynamic sub op"""
+        dynamic_func_names = sub_operator.called_kernel_name["dynamic_func_names"]
+        if sub_operator.artifact_entry is None:
+            kernel_meta_dir = self.compile_context.get_kernel_meta_dir()
+        else:
+            kernel_meta_dir = sub_operator.artifact_entry.entry_dir
+        rename_pairs_list = gen_symbol_rename_pairs(dynamic_func_names, sub_operator.split_mode)
+        content_tag = self.gen_split_content_tag(orign_bin_path, rename_pairs_list, sub_operator.artifact_entry)
+        filename = os.path.basename(orign_bin_path)
+        split_o_paths = [os.path.join(kernel_meta_dir, filename[:-2] + f"{content_tag}_split{i}.o") \
+            for i in range(1, sub_operator.split_mode)]
+        new_kernel_names_list = [[new_kernel_name for _, new_kernel_name in rename_pairs] \
+            for rename_pairs in rename_pairs_list]
+        if is_split_objs_reusable(split_o_paths, sub_operator.artifact_entry, content_tag):
+            CommonUtility.dump_compile_log(['reuse split .o path:'] + split_o_paths, \
+                CompileStage.SPLIT_SUB_OBJS, self.compile_log_path)
+            return list(zip(split_o_paths, new_kernel_names_list))
+        if clone_split_objs(orign_bin_path, [(split_o_path, dict(rename_pairs)) \
+                for split_o_path, rename_pairs in zip(split_o_paths, rename_pairs_list)], self.compile_log_path):
+            return list(zip(split_o_paths, new_kernel_names_list))
+
+        rename_file_path_list = []
+        for i in range(1, sub_operator.split_mode):
+            rename_file_name = f'{sub_operator.kernel_name}{content_tag}_rename_file_{i}.txt'
+            rename_file_path_list.append(os.path.join(kernel_meta_dir, rename_file_name))
+        # every call reads its own rename files, sub ops of one binary may be split by concurrent workers
+        work_rename_file_path_list = [gen_tmp_path(rename_file) for rename_file in rename_file_path_list]
+        new_kernel_names_list = \
+gen_symbol_rename_file(dynamic_func_names, work_rename_file_path_list, sub_operator.split_mode)
+        split_objs = []
+        for i in range(1, sub_operator.split_mode):
+            split_o_path = \
+split_dynamic_o_in_super_kernel(orign_bin_path, work_rename_file_path_list[i - 1], i, self.compile_log_path, \
+    sub_operator.artifact_entry, content_tag)
+            split_objs.append((split_o_path, new_kernel_names_list[i - 1]))
+        for work_rename_file, rename_file in zip(work_rename_file_path_list, rename_file_path_list):
+            if "dump_cce" in self.compile_context.get_op_debug_config():
+                remove_file_quietly(work_rename_file)
+            else:
+                os.replace(work_rename_file, rename_file)
+        return split_objs
+
+
+    def split_objs_of_sub_operator(self, sub_operator):
+        """split clones of one sub op, {"aiv": [...], "aic": [...]} of static op or {"dynamic": [...]} of dynamic op"""
+        split_objs = {}
+        if sub_operator.split_mode <= 1:
+            return split_objs
+        if sub_operator.dynamic_bin is not None:
+            split_objs["dynamic"] = self.split_dynamic_o_clones_in_super_kernel(sub_operator, sub_operator.dynamic_bin)
+            return split_objs
+        if sub_operator.split_mode_in_json is not None:
+            return split_objs
+        origin_aiv_kernel_name, origin_aic_kernel_name = self.find_sub_kernel_name(sub_operator.sub_kernel_names)
+        if sub_operator.aiv_bin is not None:
+            split_objs["aiv"] = self.split_o_clones_in_super_kernel(sub_operator.aiv_bin, \
+                origin_aiv_kernel_name, sub_operator.split_mode, sub_operator.artifact_entry)
+        if sub_operator.aic_bin is not None:
+            split_objs["aic"] = self.split_o_clones_in_super_kernel(sub_operator.aic_bin, \
+                origin_aic_kernel_name, sub_operator.split_mode, sub_operator.artifact_entry)
+        return split_objs
+
+
     def gen_super_kernel_params(self):
         for sub_operator in self.info_base:
             self.super_kernel_params += sub_operator.kernel_params
@@ -737,10 +891,24 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
         self.workspace_size = block_dim * base_size
 
 
+    def get_sync_all_table_size(self):
+        """bytes of sync all configs of all sub ops, aic configs of each op followed by aiv configs"""
+        return len(self.info_base) * 2 * SYNC_ALL_SLOT_SIZE
+
+
+    def get_epoch_ws_size(self):
+        """two sync all tables used by launches of even and odd epoch, then epoch of each core"""
+        aic_num, aiv_num = get_core_num(self.kernel_type, self.block_dim)
+        return 2 * self.get_sync_all_table_size() + (aic_num + aiv_num) * SYNC_ALL_SLOT_SIZE
+
+
     def calc_workspace_size(self):
         if self.feed_sync_all_mode == SuperKernelFeedSyncAllMode.FeedSyncAllDisable:
             self.workspace_size = 0
             return
+        if self.sync_all_epoch:
+            self.workspace_size = self.get_epoch_ws_size()
+            return
         if self.kernel_type in [KernelMetaType.KERNEL_TYPE_MIX_AIV_1_0, \
             KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0, KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, \
             KernelMetaType.KERNEL_TYPE_AIC_ONLY, KernelMetaType.KERNEL_TYPE_AIV_ONLY]:
@@ -777,25 +945,7 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
 
     def gen_compile_info(self):
         options = ["-x", "cce"]
-        ascend_home_path = os.environ.get('ASCEND_HOME_PATH')
-        import platform
-        archlinux = platform.machine()
-        if ascend_home_path is None or ascend_home_path == '':
-            asc_opc_path = shutil.which("asc_opc")
-            if asc_opc_path is not None:
-                asc_opc_path_link = os.path.dirname(asc_opc_path)
-                asc_opc_real_path = os.path.realpath(asc_opc_path_link)
-                ascend_home_path = os.path.realpath(
-                        os.path.join(asc_opc_real_path, "..", ".."))
-            else:
-                ascend_home_path = "/usr/local/Ascend/latest"
-
-        if 'x86' in archlinux:
-            asc_path = os.path.realpath(os.path.join(ascend_home_path, "x86_64-linux", "asc"))
-        else:
-            asc_path = os.path.realpath(os.path.join(ascend_home_path, "aarch64-linux", "asc"))
-        if asc_path is None:
-            asc_path = os.path.realpath(os.path.join(ascend_home_path, "compiler", "asc"))
+        asc_path = get_asc_path()
 
         options.append("-I" + os.path.join(asc_path, "impl", "adv_api"))
         options.append("-I" + os.path.join(asc_path, "impl", "basic_api"))
@@ -842,7 +992,8 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
             send_event_list.append(sub_operator.send_event_list)
 
         sub_operator_info = []
-        for sub_operator in self.info_base:
+        split_objs_list = self.map_sub_operators(self.split_objs_of_sub_operator, self.info_base)
+        for sub_operator, split_objs in zip(self.info_base, split_objs_list):
             operator_info = {}
             if sub_operator.aiv_bin is not None:
                 operator_info["aiv_bin"] = sub_operator.aiv_bin
@@ -860,8 +1011,7 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
                     new_sub_op_sub_kernel_names = []
                     if sub_operator.aiv_bin is not None:
                         if sub_operator.split_mode_in_json is None:
-                            split_o_path, new_kernel_name = \
-                                self.split_o_in_super_kernel(sub_operator.aiv_bin, origin_aiv_kernel_name, i)
+                            split_o_path, new_kernel_name = split_objs["aiv"][i - 1]
                         else:
                             split_o_path = sub_operator.aiv_bin[:-2] + f"_split{i}.o"
                             new_kernel_name = f"{origin_aiv_kernel_name}_split{i}"
@@ -869,8 +1019,7 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
                         new_sub_op_sub_kernel_names.append(f"{new_kernel_name}")
                     if sub_operator.aic_bin is not None:
                         if sub_operator.split_mode_in_json is None:
-                            split_o_path, new_kernel_name = \
-                                self.split_o_in_super_kernel(sub_operator.aic_bin, origin_aic_kernel_name, i)
+                            split_o_path, new_kernel_name = split_objs["aic"][i - 1]
                         else:
                             split_o_path = sub_operator.aic_bin[:-2] + f"_split{i}.o"
                             new_kernel_name = f"{origin_aic_kernel_name}_split{i}"
@@ -879,25 +1028,15 @@ f"ERROR: ratio of super kernel debug-aic-num {debug_aic_num} to debug-aiv-num {d
                     cur_operator_info["sub_kernel_names"] = new_sub_op_sub_kernel_names
                     sub_operator_info.append(cur_operator_info)
             elif sub_operator.split_mode > 1:
-                dynamic_func_names = sub_operator.called_kernel_name["dynamic_func_names"]
-                kernel_meta_dir = CommonUtility.get_kernel_meta_dir()
-                rename_file_path_list = []
-                for i in range(1, sub_operator.split_mode):
-                    rename_file_name = f'{sub_operator.kernel_name}_rename_file_{i}.txt'
-                    rename_file_path_list.append(os.path.join(kernel_meta_dir, rename_file_name))
-                new_kernel_names_list = \
-gen_symbol_rename_file(dynamic_func_names, rename_file_path_list, sub_operator.split_mode)
-                orign_bin_path = operator_info["dynamic_bin"]
-                for i in range(1, sub_operator.split_mode):
+                for split_o_path, new_kernel_names in split_objs["dynamic"]:
                     cur_operator_info = {}
-                    split_o_path = \
-split_dynamic_o_in_super_kernel(orign_bin_path, rename_file_path_list[i - 1], i, self.compile_log_path)
                     cur_operator_info["dynamic_bin"] = split_o_path
-                    cur_operator_info["sub_kernel_names"] = new_kernel_names_list[i - 1]
+                    cur_operator_info["sub_kernel_names"] = new_kernel_names
                     sub_operator_info.append(cur_operator_info)
-                if "dump_cce" in get_op_debug_config():
-                    for rename_file in rename_file_path_list:
-                        os.remove(rename_file)
+
+        for sub_operator in self.info_base:
+            if sub_operator.artifact_entry is not None:
+                sub_operator.artifact_entry.commit(sub_operator)
 
         self.add_define_options(exist_dynamic_sub_ops, options)
         self.calc_workspace_size()
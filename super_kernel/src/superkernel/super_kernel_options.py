@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel options
+"""
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility
+from asc_op_compile_base.asc_op_compiler.super_kernel_option_parse import parse_super_kernel_options
+from asc_op_compile_base.asc_op_compiler.super_kernel_constants import ERR_CODE
+
+OPTION_SEPARATOR = ':'
+
+
+def parse_switch_option(key, value):
+    if value not in ['0', '1']:
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+            f"value of super kernel option {key} must be 0 or 1, but got {value}")
+    return value == '1'
+
+
+def parse_int_option(key, value):
+    if not value.isdigit():
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+            f"value of super kernel option {key} must be a non-negative integer, but got {value}")
+    return int(value)
+
+
+# options of codegen passes in this package, unknown to parse_super_kernel_options
+# key: (parser of value, default value)
+EXTENSION_OPTIONS = {
+    'remove-redundant-sync': (parse_switch_option, False),
+    'tiling-key-table': (parse_switch_option, False),
+    # max number of sub ops whose code is preloaded ahead of the running one, 0 keeps preload-code mode
+    'preload-lookahead': (parse_int_option, 0),
+    # number of sub ops whose params are preloaded to data cache ahead of the running one, 0 keeps preload-data mode
+    'preload-data-lookahead': (parse_int_option, 0),
+    # choose kernel type and block dim of mixed super kernel by predicted time instead of max aiv to aic rule
+    'cost-model': (parse_switch_option, False),
+    # feed sync all workspace is kept between launches instead of cleared by every launch,
+    # it must be zeroed once when allocated and used by this super kernel only
+    'sync-all-epoch': (parse_switch_option, False),
+}
+
+
+def get_extension_option(op_options, key):
+    return op_options.get(key, EXTENSION_OPTIONS[key][1])
+
+
+def parse_options(option_str):
+    """parse_super_kernel_options with EXTENSION_OPTIONS, only extension options set in option_str are returned"""
+    extension_options = {}
+    other_options = []
+    for option in option_str.split(OPTION_SEPARATOR):
+        key, _, value = option.partition('=')
+        key = key.strip()
+        if key in EXTENSION_OPTIONS:
+            extension_options[key] = EXTENSION_OPTIONS[key][0](key, value.strip())
+        else:
+            other_options.append(option)
+    op_options = parse_super_kernel_options(OPTION_SEPARATOR.join(other_options))
+    op_options.update(extension_options)
+    return op_options
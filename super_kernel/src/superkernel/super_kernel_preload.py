@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel lookahead preload planner of icache and data cache
+"""
+import math
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SubOperatorType
+
+# preload(ptr, N) preloads N units of 2k
+ICACHE_UNIT_SIZE = 2048
+# icache of aic has 16 * 2k, icache of aiv has 8 * 2k
+ICACHE_CAPACITY = {'aic': 16, 'aiv': 8}
+# a cache line of 64 bytes holds 8 params of param table
+DATA_CACHE_LINE_PARAMS = 8
+
+
+def get_icache_units(text_len):
+    return math.ceil(text_len / ICACHE_UNIT_SIZE)
+
+
+def plan_icache_preload(units, lookahead, capacity):
+    """
+    positions of ops preloaded right before each op of a queue runs, every op is preloaded once
+    units: icache units of each op of the queue, 0 for ops without code on this core,
+        None for dynamic ops which preload themselves over the whole icache
+    lookahead: max number of ops preloaded ahead of the running op
+    capacity: icache units, the running op and all ops preloaded ahead of it must fit,
+        so no preload evicts code that is about to run
+    """
+    sizes = [capacity if op_units is None else op_units for op_units in units]
+    plan = [[] for _ in units]
+    next_pos = 0
+    window_units = 0
+    for pos, op_units in enumerate(units):
+        if next_pos <= pos:
+            # nothing ahead fitted, preload the op itself like step by step preload
+            if op_units:
+                plan[pos].append(pos)
+            next_pos = pos + 1
+            window_units = sizes[pos]
+        while next_pos < len(units) and next_pos - pos <= lookahead and \
+                window_units + sizes[next_pos] <= capacity:
+            if units[next_pos]:
+                plan[pos].append(next_pos)
+            window_units += sizes[next_pos]
+            next_pos += 1
+        # op of pos is finished before the op of next pos runs
+        window_units -= sizes[pos]
+    return plan
+
+
+def get_queue_units(sub_op, arch):
+    if sub_op.sub_op_task_type is SubOperatorType.DYNAMIC_OP:
+        return None
+    if arch not in sub_op.preload_call_blocks:
+        return 0
+    return get_icache_units(sub_op.aic_text_len if arch == 'aic' else sub_op.aiv_text_len)
+
+
+def gen_icache_preload_plan(sub_ops, arch, lookahead):
+    """{id of sub op: [sub ops whose code of arch is preloaded right before it runs]}"""
+    units = [get_queue_units(sub_op, arch) for sub_op in sub_ops]
+    plan = plan_icache_preload(units, lookahead, ICACHE_CAPACITY[arch])
+    return {id(sub_op): [sub_ops[target_pos] for target_pos in plan[pos]] for pos, sub_op in enumerate(sub_ops)}
+
+
+def get_param_cache_lines(param_offset, param_num):
+    """cache lines of param table holding params [param_offset, param_offset + param_num)"""
+    if param_num == 0:
+        return []
+    return list(range(param_offset // DATA_CACHE_LINE_PARAMS, \
+        (param_offset + param_num - 1) // DATA_CACHE_LINE_PARAMS + 1))
+
+
+def plan_data_cache_preload(op_lines, lookahead):
+    """
+    cache lines of param table preloaded right before each op of a queue runs
+    op_lines: cache lines of params of each op of the queue
+    lookahead: lines of an op are preloaded when the op lookahead positions before it runs
+    lines preloaded for an op not finished yet are still resident and not preloaded again,
+    such as the line shared by the last params of an op and the first params of the next one
+    """
+    plan = [[] for _ in op_lines]
+    # cache line: position of the last op it is preloaded for
+    resident_until = {}
+    for pos in range(len(op_lines)):
+        first_target = 0 if pos == 0 else pos + lookahead
+        for target in range(first_target, min(pos + lookahead, len(op_lines) - 1) + 1):
+            for line in op_lines[target]:
+                if resident_until.get(line, -1) < pos:
+                    plan[pos].append(line)
+                resident_until[line] = target
+    return plan
+
+
+def gen_data_cache_preload_plan(sub_ops, lookahead):
+    """{id of sub op: [cache lines of param table preloaded right before it runs]}"""
+    op_lines = [get_param_cache_lines(sub_op.param_offset, \
+        len(sub_op.kernel_params) + len(sub_op.extra_kernel_params)) for sub_op in sub_ops]
+    plan = plan_data_cache_preload(op_lines, lookahead)
+    return {id(sub_op): plan[pos] for pos, sub_op in enumerate(sub_ops)}
@@ -17,12 +17,21 @@ import json
 import re
 import subprocess
 import math
+import struct
 import threading
-from contextlib import contextmanager
-from asc_op_compile_base.asc_op_compiler.super_kernel_utility import get_soc_spec, KernelMetaType, \
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import KernelMetaType, \
     CommonUtility, AscendCLogLevel, CompileStage, STR_TO_KERNEL_TYPE_V220
 from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SuperKernelEarlyStartMode, SubOperatorType, \
     STR_TO_SUPER_TASK_TYPE, SuperKernelFeedSyncAllMode, SuperKernelProfilingMode, ERR_CODE
+from .super_kernel_elf import get_text_section_size as get_elf_text_section_size
+from .super_kernel_ar import extract_ar_members
+from .super_kernel_context import get_compile_context
+from .super_kernel_options import get_extension_option
+
+# tiling key table is used from this number of tiling keys, fewer keys are dispatched by binary search
+TILING_KEY_TABLE_MIN_NUM = 4
+# max size of tiling key table as multiple of number of tiling keys, keeps switch dense enough for a jump table
+TILING_KEY_TABLE_MAX_RATIO = 4
 
 
 def indent_code_func(code: str, indent: str = '    '):
@@ -31,22 +40,30 @@ def indent_code_func(code: str, indent: str = '    '):
     return re.sub(r'^(?=.+)', indent, code, flags=re.MULTILINE)
 
 
-@contextmanager
-def change_dir(path):
-    original_dir = os.getcwd()
-    try:
-        os.chdir(path)
-        yield
-    finally:
-        os.chdir(original_dir)
+def gen_tiling_key_index(tiling_keys):
+    """
+    map tiling keys to distinct indices of a dense table
+    return (index expression of tilingKey, {tiling key: index}), None when keys are neither dense
+    nor compactable by modulo
+    """
+    key_num = len(tiling_keys)
+    max_table_size = key_num * TILING_KEY_TABLE_MAX_RATIO
+    min_key = min(tiling_keys)
+    if max(tiling_keys) - min_key < max_table_size:
+        return f"tilingKey - {min_key}", {key: key - min_key for key in tiling_keys}
+    for modulus in range(key_num, max_table_size + 1):
+        if len(set(key % modulus for key in tiling_keys)) == key_num:
+            return f"tilingKey % {modulus}", {key: key % modulus for key in tiling_keys}
+    return None
 
 
 class SubOperatorInfos:
-    def __init__(self, index, info_dict, stream_index: int, op_options, compile_log_path=None):
+    def __init__(self, index, info_dict, stream_index: int, op_options, compile_log_path=None, compile_context=None):
         keys_list = list(info_dict.keys())
         self.json_path: str = info_dict["json_path"]
         self.bin_path: list = info_dict["bin_path"]
         self.compile_log_path: str = compile_log_path
+        self.compile_context = compile_context if compile_context is not None else get_compile_context()
         self.start_block_idx = 0
         self.stream_index = stream_index # true stream id
         self.sub_op_task_type: SubOperatorType = STR_TO_SUPER_TASK_TYPE[info_dict.get("task_type", "normal")]
@@ -57,6 +74,11 @@ class SubOperatorInfos:
         self.kernel_name_for_multi_stream: str = ""
         self.send_event_list = info_dict.get('send_event_list', [])
         self.recv_event_list = info_dict.get('recv_event_list', [])
+        # call count of each tiling key of dynamic op from a profiling run, hot keys are dispatched first
+        self.tiling_key_profile = \
+            {int(tiling_key): count for tiling_key, count in info_dict.get('tiling_key_profile', {}).items()}
+        # estimated duration in us of this op, used by cost model choosing kernel type and block dim
+        self.estimated_duration = float(info_dict.get('estimated_duration', 0))
         self.send_info: dict = {}
         self.recv_info: dict = {}
         self.called_kernel_name: dict = None
@@ -67,10 +89,16 @@ class SubOperatorInfos:
         self.debug_size: int = 0
         self.debug_option: str = ""
         self.kernel_params: list = None
+        # bytes of each workspace param of this op, negative when only known after tiling
+        self.workspace_sizes: list = []
+        # type of each workspace param of this op, non zero ones have to be cleared before the op runs
+        self.workspace_types: list = []
         self.kernel_declare: str = ""
         self.kernel_call_block: str = ""
         self.kernel_call_block_with_syncall: str = ""
         self.preload_call_block: str = ""
+        # preload call block of each arch, used by lookahead preload
+        self.preload_call_blocks: dict = {}
         self.early_start_complement_set_flag_block: str = ""
         self.early_start_complement_wait_flag_block: str = ""
         self.early_start_mode: SuperKernelEarlyStartMode = op_options.get('early-start', \
@@ -90,8 +118,14 @@ class SubOperatorInfos:
         self.data_cache_preload_call: str = ""
         self.sub_kernel_names: list = []
         self.split_mode = op_options.get('split-mode', 4)
+        self.tiling_key_table = get_extension_option(op_options, 'tiling-key-table')
         self.call_dcci_before_kernel_start: bool = False
         self.call_dcci_after_kernel_end: bool = False
+        # prepared artifacts reused by incremental rebuild, None when incremental rebuild is disabled
+        self.artifact_entry = None
+        # set by the preparation stage, which extracts binaries before code_gen and may run in worker threads
+        self.extract_dir = None
+        self.bin_files_prepared: bool = False
         # code_gen of dynamic op
         self._gen_code_for_dynamic_op()
 
@@ -259,7 +293,8 @@ param_offset={self.wait_param_offset + index}\n"
         if self.sub_op_task_type is SubOperatorType.DYNAMIC_OP:
             self.process_of_dynamic_op(enable_double_stream)
         else:
-            self.extract_sub_op_bin_files()
+            if not self.bin_files_prepared:
+                self.extract_sub_op_bin_files()
             self.gen_sub_kernel_declare_and_call_func()
         self.gen_notify_wait_from_outside(inner_event_id_set, enable_double_stream)
 
@@ -291,6 +326,8 @@ param_offset={self.wait_param_offset + index}\n"
                     self.debug_size: int = sub_operater_infos["debugBufSize"]
                 self.kernel_params: list = \
                     [param + f"_{self.index}" for param in sub_operater_infos["sub_operator_params"]]
+                self.workspace_sizes: list = sub_operater_infos.get("workspace", {}).get("size", [])
+                self.workspace_types: list = sub_operater_infos.get("workspace", {}).get("type", [])
                 self.early_start_set_flag = sub_operater_infos['sub_operator_early_start_set_flag']
                 self.early_start_wait_flag = sub_operater_infos['sub_operator_early_start_wait_flag']
                 self.call_dcci_before_kernel_start = \
@@ -320,7 +357,7 @@ operator inherits super kernel opton."))
         return result
 
     def gen_switch_case_block_of_dynamic_op(self, kernel_info_of_tiling_key, tiling_key, kernel_type):
-        chip_version = CommonUtility.get_chip_version()
+        chip_version = self.compile_context.get_chip_version()
         params_with_type = ', '.join([f"GM_ADDR {param}" for param in self.kernel_params])
         if kernel_type is KernelMetaType.KERNEL_TYPE_AIV_ONLY:
             aicore_kernel_name = kernel_info_of_tiling_key["AiCore"]
@@ -406,6 +443,81 @@ f"""if (*tilingKeyAddr < {input_blocks[total_length//2][1]}) {{
             return block_str
 
 
+    def gen_weighted_search_block(self, input_blocks, weights):
+        """
+        search tree weighted by call count of tiling keys: a key called at least as often as all other keys
+        of the subtree together is tested first, other subtrees are split where call counts are balanced
+        """
+        total_weight = sum(weights)
+        if len(input_blocks) == 1 or total_weight == 0:
+            return self.gen_binary_search_block(input_blocks)
+        hot_idx = max(range(len(weights)), key=lambda idx: weights[idx])
+        if len(input_blocks) == 2:
+            return self.gen_binary_search_block([input_blocks[hot_idx], input_blocks[1 - hot_idx]])
+        if weights[hot_idx] * 2 >= total_weight:
+            other_block_str = self.gen_weighted_search_block(input_blocks[:hot_idx] + input_blocks[hot_idx + 1:], \
+                weights[:hot_idx] + weights[hot_idx + 1:])
+            block_str = \
+f"""if (*tilingKeyAddr == {input_blocks[hot_idx][1]}) {{
+{indent_code_func(input_blocks[hot_idx][0])}
+}} else {{
+{indent_code_func(other_block_str)}
+}}"""
+            return block_str
+        split_idx = 1
+        left_weight = weights[0]
+        min_diff = abs(total_weight - 2 * left_weight)
+        for idx in range(2, len(input_blocks)):
+            left_weight += weights[idx - 1]
+            if abs(total_weight - 2 * left_weight) < min_diff:
+                split_idx = idx
+                min_diff = abs(total_weight - 2 * left_weight)
+        left_block_str = self.gen_weighted_search_block(input_blocks[:split_idx], weights[:split_idx])
+        right_block_str = self.gen_weighted_search_block(input_blocks[split_idx:], weights[split_idx:])
+        block_str = \
+f"""if (*tilingKeyAddr < {input_blocks[split_idx][1]}) {{
+{indent_code_func(left_block_str)}
+}} else {{
+{indent_code_func(right_block_str)}
+}}"""
+        return block_str
+
+
+    def gen_tiling_key_table_block(self, input_blocks):
+        """
+        switch on index of tiling key, compiled to a jump table. keys out of table fall back to the last leaf of
+        binary search, which is what binary search runs for keys above all tiling keys, so case blocks are not
+        emitted twice. return None when tiling keys can not be put in a table
+        """
+        if len(input_blocks) < TILING_KEY_TABLE_MIN_NUM:
+            return None
+        key_index = gen_tiling_key_index([int(block[1]) for block in input_blocks])
+        if key_index is None:
+            return None
+        index_code, index_of_key = key_index
+        case_code = ""
+        for case_block, tiling_key in sorted(input_blocks, key=lambda x: index_of_key[int(x[1])]):
+            case_code += \
+f"""case {index_of_key[int(tiling_key)]}:
+    if (tilingKey == {tiling_key}) {{
+{indent_code_func(case_block, '        ')}
+        return;
+    }}
+    break;
+"""
+        fallback_blocks = input_blocks
+        while len(fallback_blocks) > 2:
+            fallback_blocks = fallback_blocks[len(fallback_blocks) // 2:]
+        block_str = \
+f"""uint64_t tilingKey = *tilingKeyAddr;
+switch ({index_code}) {{
+{case_code}default:
+    break;
+}}
+{self.gen_binary_search_block(fallback_blocks)}"""
+        return block_str
+
+
     def gen_switch_code_of_dynamic_op(self):
         dynamic_func_names = self.called_kernel_name["dynamic_func_names"]
         param_types = ', '.join([f"GM_ADDR " for param in self.kernel_params])
@@ -416,7 +528,12 @@ f"""if (*tilingKeyAddr < {input_blocks[total_length//2][1]}) {{
             case_block = self.gen_switch_case_block_of_dynamic_op(kernel_info_of_tiling_key, tiling_key, kernel_type)
             origin_switch_block.append([case_block, tiling_key])
         origin_switch_block.sort(key=lambda x: int(x[1]))
-        switch_code = self.gen_binary_search_block(origin_switch_block)
+        switch_code = self.gen_tiling_key_table_block(origin_switch_block) if self.tiling_key_table else None
+        if switch_code is None and self.tiling_key_profile:
+            weights = [self.tiling_key_profile.get(int(tiling_key), 0) for _, tiling_key in origin_switch_block]
+            switch_code = self.gen_weighted_search_block(origin_switch_block, weights)
+        if switch_code is None:
+            switch_code = self.gen_binary_search_block(origin_switch_block)
         aiv_func_addr_str = self.gen_param_code('uint64_t& aiv_func_addr')
         aic_func_addr_str = self.gen_param_code('uint64_t& aic_func_addr')
         self.dynamic_impl_func_block = f"""
@@ -557,9 +674,9 @@ kernelType == {KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0.value}) {{
         self.dynamic_bin = self.bin_path
         #set block_dim to max
         if self.kernel_type in [KernelMetaType.KERNEL_TYPE_AIV_ONLY, KernelMetaType.KERNEL_TYPE_MIX_AIV_1_0]:
-            self.block_dim = int(get_soc_spec('vector_core_cnt'))
+            self.block_dim = int(self.compile_context.get_soc_spec('vector_core_cnt'))
         else:
-            self.block_dim = int(get_soc_spec('ai_core_cnt'))
+            self.block_dim = int(self.compile_context.get_soc_spec('ai_core_cnt'))
         self.extra_kernel_params = [f"__ac_dynamic_tiling_key_{self.index}", f"__ac_dynamic_block_dim_{self.index}", \
                                     f"__ac_wait_lock_{self.index}"]
         aiv_func_addr_str = self.gen_param_code('aiv_func_addr')
@@ -576,6 +693,23 @@ param_base[{dynamic_extra_param_offset + 1}], param_base[{dynamic_extra_param_of
 
 
     def get_text_section_size(self, binary_file):
+        if self.artifact_entry is not None:
+            text_len = self.artifact_entry.get_text_len(binary_file)
+            if text_len is not None:
+                return text_len
+        # icache on aiv has 8 * 2k, max text length set to min(real text length, 8 * 2k)
+        try:
+            size = get_elf_text_section_size(binary_file)
+        except (OSError, ValueError, struct.error) as err:
+            CommonUtility.print_compile_log("", \
+                f"read ELF sections of {binary_file} failed, fall back to llvm-objdump, reason is: {err}", \
+                AscendCLogLevel.LOG_DEBUG)
+        else:
+            if size is not None:
+                return min(size, 2048 * 8)
+        return self.get_text_section_size_by_objdump(binary_file)
+
+    def get_text_section_size_by_objdump(self, binary_file):
         command = ['llvm-objdump', '-h', binary_file]
         result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
@@ -585,7 +719,6 @@ param_base[{dynamic_extra_param_offset + 1}], param_base[{dynamic_extra_param_of
                     AscendCLogLevel.LOG_WARNING)
             return 0
 
-        # icache on aiv has 8 * 2k, max text length set to min(real text length, 8 * 2k)
         for line in result.stdout.splitlines():
             if '.text' in line:
                 parts = line.split()
@@ -598,36 +731,63 @@ param_base[{dynamic_extra_param_offset + 1}], param_base[{dynamic_extra_param_of
         return 0
 
     def extract_sub_bin_file(self, kernel_meta_dir, bin_file_name):
-        with change_dir(kernel_meta_dir):
-            try:
-                if os.path.exists(os.path.join(kernel_meta_dir, bin_file_name)):
-                    return
-                CommonUtility.dump_compile_log(\
-                    ['cd', f'{kernel_meta_dir};', 'ar', 'x', self.bin_path], \
-                    CompileStage.UNPACK, self.compile_log_path)
-                subprocess.run(['ar', 'x', self.bin_path])
-            except Exception as err:
-                CommonUtility().ascendc_raise_python_err(ERR_CODE, ("ar extract files or mv files failed", err))
+        if os.path.exists(os.path.join(kernel_meta_dir, bin_file_name)):
+            return
+        self.extract_sub_bin_members(kernel_meta_dir, [bin_file_name])
 
     def extract_sub_bin_file_of_mix_kernel(self, kernel_meta_dir, aiv_bin_file_name, aic_bin_file_name):
-        with change_dir(kernel_meta_dir):
-            try:
-                if os.path.exists(os.path.join(kernel_meta_dir, aiv_bin_file_name)) and \
-                            os.path.exists(os.path.join(kernel_meta_dir, aic_bin_file_name)):
-                    return
-                CommonUtility.dump_compile_log(\
-                    ['cd', f'{kernel_meta_dir};', 'ar', 'x', self.bin_path], \
-                    CompileStage.UNPACK, self.compile_log_path)
-                subprocess.run(['ar', 'x', self.bin_path])
-            except Exception as err:
-                CommonUtility().ascendc_raise_python_err(ERR_CODE, ("ar extract files or mv files failed", err))
+        if os.path.exists(os.path.join(kernel_meta_dir, aiv_bin_file_name)) and \
+                    os.path.exists(os.path.join(kernel_meta_dir, aic_bin_file_name)):
+            return
+        self.extract_sub_bin_members(kernel_meta_dir, [aiv_bin_file_name, aic_bin_file_name])
+
+    def extract_sub_bin_members(self, kernel_meta_dir, bin_file_names):
+        # objects split by sub op compile are linked in gen_compile_info as <obj>_split{i}.o
+        member_names = list(bin_file_names)
+        if self.split_mode_in_json is not None:
+            for bin_file_name in bin_file_names:
+                member_names += [bin_file_name[:-2] + f"_split{i}.o" for i in range(1, self.split_mode_in_json)]
+        try:
+            extracted = extract_ar_members(self.bin_path, kernel_meta_dir, member_names)
+            missing = [name for name in bin_file_names if name not in extracted]
+            if not missing:
+                CommonUtility.dump_compile_log(['extract', ' '.join(extracted), 'from', self.bin_path, \
+                    'to', kernel_meta_dir], CompileStage.UNPACK, self.compile_log_path)
+                return
+            reason = f"members {missing} not found"
+        except (OSError, ValueError) as err:
+            reason = err
+        CommonUtility.print_compile_log("", \
+            f"read archive {self.bin_path} failed, fall back to ar, reason is: {reason}", AscendCLogLevel.LOG_DEBUG)
+        try:
+            CommonUtility.dump_compile_log(\
+                ['cd', f'{kernel_meta_dir};', 'ar', 'x', self.bin_path], \
+                CompileStage.UNPACK, self.compile_log_path)
+            subprocess.run(['ar', 'x', self.bin_path], cwd=kernel_meta_dir)
+        except Exception as err:
+            CommonUtility().ascendc_raise_python_err(ERR_CODE, ("ar extract files or mv files failed", err))
+
+
+    def get_extract_dir(self):
+        if self.artifact_entry is not None:
+            return self.artifact_entry.entry_dir
+        if self.extract_dir is not None:
+            return self.extract_dir
+        return os.path.join(self.compile_context.get_kernel_meta_dir(), str(threading.get_ident()))
+
+
+    def prepare_bin_files(self):
+        """extract binaries and read .text sizes ahead of code_gen, safe to run in a worker thread"""
+        if self.sub_op_task_type is SubOperatorType.DYNAMIC_OP:
+            return
+        self.extract_sub_op_bin_files()
+        self.bin_files_prepared = True
 
 
     def extract_sub_op_bin_files(self):
-        chip_version = CommonUtility.get_chip_version()
-        kernel_meta_dir_with_thread_id = os.path.join(CommonUtility.get_kernel_meta_dir(), str(threading.get_ident()))
-        if not os.path.exists(kernel_meta_dir_with_thread_id):
-            os.makedirs(kernel_meta_dir_with_thread_id)
+        chip_version = self.compile_context.get_chip_version()
+        kernel_meta_dir_with_thread_id = self.get_extract_dir()
+        os.makedirs(kernel_meta_dir_with_thread_id, exist_ok=True)
         if self.kernel_type == KernelMetaType.KERNEL_TYPE_AIV_ONLY:
             bin_file_name = os.path.basename(self.called_kernel_name["AiCore"]["obj_files"])
             if self.split_mode_in_json is None:
@@ -811,14 +971,19 @@ f"""else {{
         return self._gen_preload_list_with_num(aicore_kernel_name, math.ceil(text_len / 2048))
 
 
+    def add_preload_call_block(self, arch, preload_list, core_type, block_type):
+        self.preload_call_blocks[arch] = self.gen_call_func(preload_list, core_type, block_type, is_preload=True)
+        self.preload_call_block += self.preload_call_blocks[arch]
+
+
     def gen_sub_kernel_declare_and_call_func(self):
         params_with_type = ', '.join([f"GM_ADDR {param}" for param in self.kernel_params])
-        chip_version = CommonUtility.get_chip_version()
+        chip_version = self.compile_context.get_chip_version()
 
         # generate date cache preload for sub operator
         self.data_cache_preload_call += f"// begin add dc preload of sub_operator: {self.kernel_name}\n"
         len_of_param = len(self.kernel_params)
-        if self.index == 0 and not CommonUtility.is_c310():
+        if self.index == 0 and not self.compile_context.is_c310():
             len_of_param += 1
         for index in range(0, len_of_param, 8):
             self.data_cache_preload_call += f"dc_preload((__gm__ uint64_t *)(param_base), 0); \n"
@@ -834,8 +999,7 @@ f"""else {{
             self.kernel_call_block_with_syncall = \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIV", f"AscendC::GetBlockIdx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aiv_text_len)
-            self.preload_call_block = \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIV", f"AscendC::GetBlockIdx", is_preload=True)
+            self.add_preload_call_block('aiv', preload_call_block, "ASCEND_IS_AIV", f"AscendC::GetBlockIdx")
             self.set_early_start_complement_blocks("ASCEND_IS_AIV", f"AscendC::GetBlockIdx() >= {self.block_dim}")
             self.set_early_start_complement_blocks("ASCEND_IS_AIC", "true")
         elif self.kernel_type == KernelMetaType.KERNEL_TYPE_AIC_ONLY:
@@ -848,8 +1012,7 @@ f"""else {{
             self.kernel_call_block_with_syncall = \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIC", "get_block_idx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aic_text_len)
-            self.preload_call_block = \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIC", "get_block_idx", is_preload=True)
+            self.add_preload_call_block('aic', preload_call_block, "ASCEND_IS_AIC", "get_block_idx")
             self.set_early_start_complement_blocks("ASCEND_IS_AIC", f"get_block_idx() >= {self.block_dim}")
             self.set_early_start_complement_blocks("ASCEND_IS_AIV", "true")
         elif self.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIV_1_0:
@@ -862,8 +1025,7 @@ f"""else {{
             self.kernel_call_block_with_syncall = \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIV", f"AscendC::GetBlockIdx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aiv_text_len)
-            self.preload_call_block = \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIV", f"AscendC::GetBlockIdx", is_preload=True)
+            self.add_preload_call_block('aiv', preload_call_block, "ASCEND_IS_AIV", f"AscendC::GetBlockIdx")
             self.set_early_start_complement_blocks("ASCEND_IS_AIV", f"AscendC::GetBlockIdx() >= {self.block_dim}")
             self.set_early_start_complement_blocks("ASCEND_IS_AIC", "true")
         elif self.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0:
@@ -876,8 +1038,7 @@ f"""else {{
             self.kernel_call_block_with_syncall = \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIC", "get_block_idx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aic_text_len)
-            self.preload_call_block = \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIC", "get_block_idx", is_preload=True)
+            self.add_preload_call_block('aic', preload_call_block, "ASCEND_IS_AIC", "get_block_idx")
             self.set_early_start_complement_blocks("ASCEND_IS_AIC", f"get_block_idx() >= {self.block_dim}")
             self.set_early_start_complement_blocks("ASCEND_IS_AIV", "true")
         elif self.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1:  
@@ -891,8 +1052,7 @@ f"""else {{
             self.kernel_call_block_with_syncall = \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIC", "get_block_idx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aic_text_len)
-            self.preload_call_block = \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIC", "get_block_idx", is_preload=True)
+            self.add_preload_call_block('aic', preload_call_block, "ASCEND_IS_AIC", "get_block_idx")
             aicore_kernel_name = self.called_kernel_name[f"dav-{chip_version}-vec"]["func_name"]
             self.sub_kernel_names.append(aicore_kernel_name)
             self.kernel_declare += self._gen_sub_kernel_decare_once(aicore_kernel_name, params_with_type)
@@ -902,8 +1062,7 @@ f"""else {{
             self.kernel_call_block_with_syncall += \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIV", "get_block_idx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aiv_text_len)
-            self.preload_call_block += \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIV", "get_block_idx", is_preload=True)
+            self.add_preload_call_block('aiv', preload_call_block, "ASCEND_IS_AIV", "get_block_idx")
             self.set_early_start_complement_blocks("ASCEND_IS_AIC", f"get_block_idx() >= {self.block_dim}")
             self.set_early_start_complement_blocks("ASCEND_IS_AIV", f"get_block_idx() >= {self.block_dim}")
         elif self.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2:
@@ -916,8 +1075,7 @@ f"""else {{
             self.kernel_call_block_with_syncall = \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIC", "get_block_idx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aic_text_len)
-            self.preload_call_block = \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIC", "get_block_idx", is_preload=True)
+            self.add_preload_call_block('aic', preload_call_block, "ASCEND_IS_AIC", "get_block_idx")
             aicore_kernel_name = self.called_kernel_name[f"dav-{chip_version}-vec"]["func_name"]
             self.sub_kernel_names.append(aicore_kernel_name)
             self.kernel_declare += self._gen_sub_kernel_decare_once(aicore_kernel_name, params_with_type)
@@ -927,8 +1085,7 @@ f"""else {{
             self.kernel_call_block_with_syncall += \
                 self.gen_call_func_with_syncall(func_call, "ASCEND_IS_AIV", "get_block_idx")
             preload_call_block = self._gen_preload_list(aicore_kernel_name, self.aiv_text_len)
-            self.preload_call_block += \
-                self.gen_call_func(preload_call_block, "ASCEND_IS_AIV", "get_block_idx", is_preload=True)
+            self.add_preload_call_block('aiv', preload_call_block, "ASCEND_IS_AIV", "get_block_idx")
             self.set_early_start_complement_blocks("ASCEND_IS_AIC", f"get_block_idx() >= {self.block_dim}")
             self.set_early_start_complement_blocks("ASCEND_IS_AIV", f"get_block_idx() >= {self.block_dim}")
         else:
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel double stream sync graph
+"""
+
+# one bit per sync direction, in the order they are joined in sync names like "cub:vec;vec:cub"
+SYNC_CUB_CUB = 1
+SYNC_CUB_VEC = 2
+SYNC_VEC_CUB = 4
+SYNC_VEC_VEC = 8
+SYNC_FLAG_NAMES = [(SYNC_CUB_CUB, "cub:cub"), (SYNC_CUB_VEC, "cub:vec"), (SYNC_VEC_CUB, "vec:cub"),
+    (SYNC_VEC_VEC, "vec:vec")]
+SYNC_NAME_FLAGS = {name: flag for flag, name in SYNC_FLAG_NAMES}
+
+
+def encode_sync_flags(sync_name):
+    flags = 0
+    for name in sync_name.split(';'):
+        flags |= SYNC_NAME_FLAGS.get(name, 0)
+    return flags
+
+
+def decode_sync_flags(flags):
+    return ";".join(name for flag, name in SYNC_FLAG_NAMES if flags & flag)
+
+
+class SyncGraph:
+    """send_info and recv_info of double stream sub ops as per op adjacency of sync flags.
+    ops are looked up by kernel_name_for_multi_stream through index maps, the position of a name in cub_op_list
+    and vec_op_list is that of its first op, 0 when there is none.
+    every update is written through to send_info and recv_info of the ops."""
+    def __init__(self, info_base, cub_op_list, vec_op_list):
+        self.cub_op_list = cub_op_list
+        self.vec_op_list = vec_op_list
+        self.cub_idx = {}
+        for idx, sub_op in enumerate(cub_op_list):
+            self.cub_idx.setdefault(sub_op.kernel_name_for_multi_stream, idx)
+        self.vec_idx = {}
+        for idx, sub_op in enumerate(vec_op_list):
+            self.vec_idx.setdefault(sub_op.kernel_name_for_multi_stream, idx)
+        # updates go to all ops of info_base with the name
+        self.ops_by_name = {}
+        for sub_op in info_base:
+            self.ops_by_name.setdefault(sub_op.kernel_name_for_multi_stream, []).append(sub_op)
+        self.send_flags = {}
+        self.recv_flags = {}
+        for sub_op in info_base + cub_op_list + vec_op_list:
+            if id(sub_op) in self.send_flags:
+                continue
+            self.send_flags[id(sub_op)] = \
+                {name: encode_sync_flags(sync_name) for name, sync_name in sub_op.send_info.items()}
+            self.recv_flags[id(sub_op)] = \
+                {name: encode_sync_flags(sync_name) for name, sync_name in sub_op.recv_info.items()}
+
+    def get_cub_idx(self, op_name):
+        return self.cub_idx.get(op_name, 0)
+
+    def get_vec_idx(self, op_name):
+        return self.vec_idx.get(op_name, 0)
+
+    def get_send(self, sub_op):
+        return self.send_flags[id(sub_op)]
+
+    def get_recv(self, sub_op):
+        return self.recv_flags[id(sub_op)]
+
+    def update(self, op_name, peer_name, is_recv, flags):
+        """the peer entry is removed when no flag is left, else replaced"""
+        for sub_op in self.ops_by_name.get(op_name, []):
+            infos = sub_op.recv_info if is_recv else sub_op.send_info
+            adjacency = self.recv_flags[id(sub_op)] if is_recv else self.send_flags[id(sub_op)]
+            if flags == 0:
+                infos.pop(peer_name, None)
+                adjacency.pop(peer_name, None)
+            else:
+                infos[peer_name] = decode_sync_flags(flags)
+                adjacency[peer_name] = flags
+
+    def apply(self, updates):
+        for op_name, peer_name, is_recv, flags in updates:
+            self.update(op_name, peer_name, is_recv, flags)
+
+    def gen_crossed_line_judge(self, recv_op_list, recv_flag, get_send_idx):
+        """max send op idx of recv_flag syncs received before each position of recv_op_list, -1 for none.
+        a sync from send idx s to recv idx r is crossed when the value at r is greater than s."""
+        max_send_idx = [-1]
+        for recv_op in recv_op_list:
+            send_idx = max_send_idx[-1]
+            for send_name, flags in self.get_recv(recv_op).items():
+                if flags & recv_flag:
+                    send_idx = max(send_idx, get_send_idx(send_name))
+            max_send_idx.append(send_idx)
+        return max_send_idx
+
+    def remove_crossed_line_sync(self):
+        """a sync is removed when another sync of same direction is sent later and received earlier"""
+        updates = []
+        for send_op_list, recv_op_list, flag, get_send_idx, get_recv_idx in [
+                (self.cub_op_list, self.vec_op_list, SYNC_CUB_VEC, self.get_cub_idx, self.get_vec_idx),
+                (self.vec_op_list, self.cub_op_list, SYNC_VEC_CUB, self.get_vec_idx, self.get_cub_idx)]:
+            max_send_idx = self.gen_crossed_line_judge(recv_op_list, flag, get_send_idx)
+            for sub_op in send_op_list:
+                send_name = sub_op.kernel_name_for_multi_stream
+                for recv_name, flags in self.get_send(sub_op).items():
+                    if flags & flag and max_send_idx[get_recv_idx(recv_name)] > get_send_idx(send_name):
+                        updates.append((send_name, recv_name, False, flags & ~flag))
+                        updates.append((recv_name, send_name, True, flags & ~flag))
+        self.apply(updates)
+
+    def remove_multi_send_info(self):
+        """a sub op keeps only the sync to the first receiver of the other core type"""
+        for send_op_list, flag, get_recv_idx in [(self.vec_op_list, SYNC_VEC_CUB, self.get_cub_idx),
+                (self.cub_op_list, SYNC_CUB_VEC, self.get_vec_idx)]:
+            updates = []
+            for sub_op in send_op_list:
+                send_flags = self.get_send(sub_op)
+                if len(send_flags) <= 1:
+                    continue
+                send_list = [(name, flags) for name, flags in send_flags.items() if flags & flag]
+                send_list.sort(key=lambda x: get_recv_idx(x[0]))
+                for recv_name, flags in send_list[1:]:
+                    updates.append((sub_op.kernel_name_for_multi_stream, recv_name, False, flags & ~flag))
+                    updates.append((recv_name, sub_op.kernel_name_for_multi_stream, True, flags & ~flag))
+            self.apply(updates)
+
+    def remove_multi_recv_info(self):
+        """a sub op keeps only the sync from the last sender of the other core type"""
+        for recv_op_list, flag, get_send_idx in [(self.vec_op_list, SYNC_CUB_VEC, self.get_cub_idx),
+                (self.cub_op_list, SYNC_VEC_CUB, self.get_vec_idx)]:
+            updates = []
+            for sub_op in recv_op_list:
+                recv_flags = self.get_recv(sub_op)
+                if len(recv_flags) <= 1:
+                    continue
+                recv_list = [(name, flags) for name, flags in recv_flags.items() if flags & flag]
+                recv_list.sort(key=lambda x: get_send_idx(x[0]), reverse=True)
+                for send_name, flags in recv_list[1:]:
+                    updates.append((sub_op.kernel_name_for_multi_stream, send_name, True, flags & ~flag))
+                    updates.append((send_name, sub_op.kernel_name_for_multi_stream, False, flags & ~flag))
+            self.apply(updates)
+
+    def get_node(self, op_name, core_type):
+        """node of the op on cub or vec core in the happens-before graph, cub ops first then vec ops.
+        None when the op is not on that core."""
+        if core_type == "cub":
+            return self.cub_idx.get(op_name)
+        idx = self.vec_idx.get(op_name)
+        return None if idx is None else len(self.cub_op_list) + idx
+
+    def gen_node_masks(self):
+        """bit mask of each node and the nodes after it in program order of its core"""
+        cub_num = len(self.cub_op_list)
+        node_num = cub_num + len(self.vec_op_list)
+        from_masks = []
+        for node in range(node_num):
+            end = cub_num if node < cub_num else node_num
+            from_masks.append(((1 << end) - 1) & ~((1 << node) - 1))
+        return from_masks
+
+    def gen_sync_edges(self):
+        """(src node, dst node, send op name, recv op name, flag) of every sync, syncs of unknown ops are left out"""
+        sync_edges = []
+        visited = set()
+        for sub_op in self.cub_op_list + self.vec_op_list:
+            if id(sub_op) in visited:
+                continue
+            visited.add(id(sub_op))
+            send_name = sub_op.kernel_name_for_multi_stream
+            for recv_name, flags in self.get_send(sub_op).items():
+                for flag, sync_name in SYNC_FLAG_NAMES:
+                    if not flags & flag:
+                        continue
+                    send_core, recv_core = sync_name.split(":")
+                    src = self.get_node(send_name, send_core)
+                    dst = self.get_node(recv_name, recv_core)
+                    if src is not None and dst is not None and src != dst:
+                        sync_edges.append((src, dst, send_name, recv_name, flag))
+        return sync_edges
+
+    def gen_topo_order(self, node_num, sync_edges):
+        succ = [[] for _ in range(node_num)]
+        for node in range(node_num - 1):
+            if node + 1 != len(self.cub_op_list):
+                succ[node].append(node + 1)
+        for src, dst, _, _, _ in sync_edges:
+            succ[src].append(dst)
+        in_degree = [0] * node_num
+        for node in range(node_num):
+            for dst in succ[node]:
+                in_degree[dst] += 1
+        order = [node for node in range(node_num) if in_degree[node] == 0]
+        for node in order:
+            for dst in succ[node]:
+                in_degree[dst] -= 1
+                if in_degree[dst] == 0:
+                    order.append(dst)
+        return order
+
+    def gen_sync_reach(self):
+        """(sync edges, program order masks, sync edges from each node, nodes reached from each node by paths
+        through at least one sync), None when syncs go against program order and nothing can be proved.
+        a node happens before every node it reaches on all cores."""
+        sync_edges = self.gen_sync_edges()
+        from_masks = self.gen_node_masks()
+        node_num = len(from_masks)
+        order = self.gen_topo_order(node_num, sync_edges)
+        if len(order) != node_num:
+            return None
+        out_edges = [[] for _ in range(node_num)]
+        for edge in sync_edges:
+            out_edges[edge[0]].append(edge)
+
+        sync_reach = [0] * node_num
+        for node in reversed(order):
+            reach = 0
+            if from_masks[node] != 1 << node:
+                reach |= sync_reach[node + 1]
+            for _, dst, _, _, _ in out_edges[node]:
+                reach |= from_masks[dst] | sync_reach[dst]
+            sync_reach[node] = reach
+        return sync_edges, from_masks, out_edges, sync_reach
+
+    def remove_transitive_sync(self):
+        """transitive reduction of the program order plus sync graph of cub_op_list and vec_op_list.
+        a sync is removed when its recv op is reached from its send op by another path through at least one
+        sync, program order alone is not a happens-before across cores. returns the number of removed syncs."""
+        reach_graph = self.gen_sync_reach()
+        if reach_graph is None:
+            return 0
+        sync_edges, from_masks, out_edges, sync_reach = reach_graph
+
+        removed_flags = {}
+        for src, dst, send_name, recv_name, flag in sync_edges:
+            reach = sync_reach[src + 1] if from_masks[src] != 1 << src else 0
+            for _, other_dst, _, _, _ in out_edges[src]:
+                if other_dst != dst:
+                    reach |= from_masks[other_dst] | sync_reach[other_dst]
+            if reach >> dst & 1:
+                removed_flags[(send_name, recv_name)] = removed_flags.get((send_name, recv_name), 0) | flag
+
+        updates = []
+        removed_num = 0
+        for (send_name, recv_name), flags in removed_flags.items():
+            send_ops = self.ops_by_name.get(send_name, [])
+            if not send_ops:
+                continue
+            remain = self.get_send(send_ops[0]).get(recv_name, 0) & ~flags
+            removed_num += bin(flags).count("1")
+            updates.append((send_name, recv_name, False, remain))
+            updates.append((recv_name, send_name, True, remain))
+        self.apply(updates)
+        return removed_num
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel option auto tuner
+"""
+import os
+import json
+import hashlib
+import itertools
+from abc import ABC, abstractmethod
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility, AscendCLogLevel
+from asc_op_compile_base.asc_op_compiler.super_kernel_constants import ERR_CODE
+from .super_kernel import compile_many, running_compile
+from .super_kernel_cache import gen_compile_cache_key
+from .super_kernel_context import use_compile_context
+from .super_kernel_file_utils import atomic_write
+from .super_kernel_options import OPTION_SEPARATOR
+
+SUPER_KERNEL_TUNE_DIR_ENV = "ASCEND_SUPER_KERNEL_TUNE_DIR"
+SUPER_KERNEL_TUNE_DIR_NAME = "super_kernel_tune"
+# bump it when the content of scope signature or the layout of tuned record changes
+TUNE_FORMAT_VERSION = 1
+# options deciding performance, key: candidate values
+DEFAULT_TUNE_SPACE = {
+    'early-start': ['0', '1'],
+    'preload-code': ['0', '1', '2'],
+    'preload-data': ['0', '1'],
+    'split-mode': ['1', '2', '4'],
+    'func-align': ['0', '1'],
+    'feed-sync-all': ['0', '1'],
+    'stream-fusion': ['0', '1'],
+}
+# variants compiled at most by one tune, a larger space is searched one option at a time
+DEFAULT_MAX_VARIANTS = 64
+
+
+def split_option_str(option_str):
+    """[(key, value)] of option_str in order, options without '=' keep value None"""
+    options = []
+    for option in option_str.split(OPTION_SEPARATOR):
+        if option.strip() == "":
+            continue
+        key, sep, value = option.partition('=')
+        options.append((key.strip(), value.strip() if sep else None))
+    return options
+
+
+def join_option_str(options):
+    return OPTION_SEPARATOR.join(key if value is None else f"{key}={value}" for key, value in options)
+
+
+def update_option_str(option_str, updates):
+    """option_str with values of keys in updates replaced, keys not in option_str appended in order of updates"""
+    options = [(key, updates.get(key, value)) for key, value in split_option_str(option_str)]
+    keys = {key for key, _ in options}
+    options += [(key, value) for key, value in updates.items() if key not in keys]
+    return join_option_str(options)
+
+
+def remove_options(option_str, keys):
+    return join_option_str([(key, value) for key, value in split_option_str(option_str) if key not in keys])
+
+
+def gen_scope_signature(kernel_infos, tune_space, impl_mode=""):
+    """hash of scope without its tuned options: sub ops, other options, soc and toolchain.
+    return None when any sub op file can not be read, such scope is never tuned"""
+    untuned_infos = dict(kernel_infos)
+    untuned_infos["super_kernel_options"] = remove_options(kernel_infos.get("super_kernel_options", ""), tune_space)
+    cache_key = gen_compile_cache_key(untuned_infos, impl_mode)
+    if cache_key is None:
+        return None
+    sha256 = hashlib.sha256()
+    for item in [TUNE_FORMAT_VERSION, cache_key, sorted(tune_space)]:
+        sha256.update(f"{item}\n".encode())
+    return sha256.hexdigest()
+
+
+def gen_option_product(tune_space):
+    """every combination of tune_space, as {key: value}"""
+    keys = list(tune_space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(tune_space[key] for key in keys))]
+
+
+class TuneRunner(ABC):
+    """measures a compiled super kernel variant, kernel_meta_dir/<kernel_name>.o and .json,
+    measure returns latency in us, None when the variant can not run.
+    a device runner is used in production, a simulator or mock runner in CI"""
+    name = "tune_runner"
+
+    @abstractmethod
+    def measure(self, kernel_infos, kernel_name, kernel_meta_dir):
+        pass
+
+
+class TunedOptionStore:
+    """persistent best option string of each scope signature:
+        <store_dir>/<signature[:2]>/<signature>.json
+    """
+    def __init__(self, store_dir):
+        self.store_dir = os.path.realpath(store_dir)
+
+    @staticmethod
+    def get_default_store_dir(kernel_meta_dir):
+        store_dir = os.environ.get(SUPER_KERNEL_TUNE_DIR_ENV, "")
+        if store_dir != "":
+            return store_dir
+        return os.path.join(kernel_meta_dir, SUPER_KERNEL_TUNE_DIR_NAME)
+
+    def get_record_path(self, signature):
+        return os.path.join(self.store_dir, signature[:2], signature + ".json")
+
+    def load(self, signature):
+        try:
+            with open(self.get_record_path(signature), 'r') as fd:
+                return json.load(fd)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, signature, record):
+        record_path = self.get_record_path(signature)
+        os.makedirs(os.path.dirname(record_path), exist_ok=True)
+        atomic_write(record_path, json.dumps(record, indent=2))
+
+
+class OptionTuner:
+    """compiles option variants of a scope in parallel by compile_many and measures them by runner one by one.
+    a space of no more than max_variants combinations is enumerated, a larger one is searched one option
+    at a time in order of tune_space, keeping the best value of each option for the following ones."""
+    def __init__(self, runner, tune_space=None, max_variants=DEFAULT_MAX_VARIANTS, impl_mode="", cache_dir=None, \
+            enable_cache=True, jobs=1, compile_context=None):
+        self.runner = runner
+        self.tune_space = tune_space if tune_space is not None else DEFAULT_TUNE_SPACE
+        self.max_variants = max_variants
+        self.impl_mode = impl_mode
+        self.cache_dir = cache_dir
+        self.enable_cache = enable_cache
+        self.jobs = jobs
+        self.compile_context = compile_context
+        self.trials = []
+
+    def measure_variants(self, kernel_infos, called_kernel_name, variants):
+        """[(latency, option str)] of variants compiled and run successfully"""
+        base_option_str = kernel_infos.get("super_kernel_options", "")
+        option_strs = [update_option_str(base_option_str, variant) for variant in variants]
+        kernel_infos_list = [dict(kernel_infos, super_kernel_options=option_str) for option_str in option_strs]
+        kernel_names = [f"{called_kernel_name}_tune_{len(self.trials) + index}" for index in range(len(variants))]
+        results = compile_many(kernel_infos_list, kernel_names, self.impl_mode, self.cache_dir, self.enable_cache, \
+            self.jobs, self.compile_context)
+        kernel_meta_dir = self.compile_context.get_kernel_meta_dir()
+        measured = []
+        for option_str, variant_infos, result in zip(option_strs, kernel_infos_list, results):
+            latency = None
+            if result["status"] != "failed":
+                latency = self.runner.measure(variant_infos, result["kernel_name"], kernel_meta_dir)
+            self.trials.append({"option_str": option_str, "status": result["status"], "error": result["error"], \
+                "latency": latency})
+            if latency is not None:
+                measured.append((latency, option_str))
+        return measured
+
+    def search(self, kernel_infos, called_kernel_name):
+        """(latency, option str) of the best variant, None when no variant runs"""
+        if len(gen_option_product(self.tune_space)) <= self.max_variants:
+            measured = self.measure_variants(kernel_infos, called_kernel_name, gen_option_product(self.tune_space))
+            return min(measured, key=lambda item: item[0], default=None)
+        best = None
+        for key, values in self.tune_space.items():
+            base_infos = kernel_infos if best is None else dict(kernel_infos, super_kernel_options=best[1])
+            measured = self.measure_variants(base_infos, called_kernel_name, [{key: value} for value in values])
+            best = min(measured + ([] if best is None else [best]), key=lambda item: item[0], default=best)
+        return best
+
+    def tune(self, kernel_infos, called_kernel_name, store_dir=None):
+        """best option string of scope, reused from store when its signature was tuned before.
+        return {"option_str": str, "latency": float or None, "reused": bool, "trials": [...]}"""
+        self.trials = []
+        # all variants of the scope are one batch of compiles sharing one global_var_storage reset
+        with running_compile(self.compile_context) as compile_context, use_compile_context(compile_context):
+            self.compile_context = compile_context
+            if store_dir is None:
+                store_dir = TunedOptionStore.get_default_store_dir(self.compile_context.get_kernel_meta_dir())
+            store = TunedOptionStore(store_dir)
+            signature = gen_scope_signature(kernel_infos, self.tune_space, self.impl_mode)
+            record = store.load(signature) if signature is not None else None
+            if record is not None:
+                CommonUtility.print_compile_log(called_kernel_name, \
+                    f"reuse tuned super kernel options: {record['option_str']}", AscendCLogLevel.LOG_DEBUG)
+                return dict(record, reused=True, trials=[])
+            best = self.search(kernel_infos, called_kernel_name)
+            if best is None:
+                CommonUtility().ascendc_raise_python_err(ERR_CODE, \
+                    f"no option variant of super kernel {called_kernel_name} compiled and ran, trials: {self.trials}")
+            record = {"option_str": best[1], "latency": best[0]}
+            if signature is not None:
+                store.store(signature, dict(record, trials=self.trials))
+            CommonUtility.print_compile_log(called_kernel_name, \
+                f"tuned super kernel options: {best[1]}, latency: {best[0]} us", AscendCLogLevel.LOG_DEBUG)
+        return dict(record, reused=False, trials=self.trials)
+
+
+def tune_options(kernel_infos, runner, called_kernel_name="ascendc_super_kernel_plus", store_dir=None, **kwargs):
+    """ entry of super kernel option auto tuning
+
+        Args:
+            kernel_infos: infos of sub kernel, see compile, its super_kernel_options are the base of every variant
+            runner: TuneRunner measuring compiled variants
+            store_dir: dir of tuned option strings, default is $ASCEND_SUPER_KERNEL_TUNE_DIR or
+                <kernel_meta>/super_kernel_tune
+            kwargs: tune_space, max_variants, impl_mode, cache_dir, enable_cache, jobs and compile_context of
+                OptionTuner, jobs bounds parallel bisheng compiles of variants
+
+        Returns:
+            {"option_str": str, "latency": float, "reused": bool, "trials": [...]}, compile the scope with
+            option_str as super_kernel_options to use the result
+    """
+    return OptionTuner(runner, **kwargs).tune(kernel_infos, called_kernel_name, store_dir)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+"""
+super kernel workspace arena planner, workspaces of sub ops never running at the same time share memory
+"""
+import os
+import json
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility, CompileStage
+from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SuperKernelEarlyStartMode, ERR_CODE
+from .super_kernel_sync_graph import SyncGraph
+from .super_kernel_file_utils import atomic_write
+
+WORKSPACE_PLAN_FILE_SUFFIX = "_workspace_plan.json"
+# every workspace starts at an offset of the arena aligned to 512 bytes
+WORKSPACE_ALIGN = 512
+
+
+def align_workspace_size(size, align=WORKSPACE_ALIGN):
+    return (size + align - 1) // align * align
+
+
+def plan_workspace_arena(sizes, conflicts, align=WORKSPACE_ALIGN):
+    """
+    (arena size, offset of each buffer in the arena)
+    sizes: bytes of each buffer
+    conflicts: set of (i, j) with i < j, buffers which may be alive at the same time
+    bigger buffers are placed first, each at the lowest offset not overlapping any placed conflicting buffer
+    """
+    aligned_sizes = [align_workspace_size(size, align) for size in sizes]
+    offsets = [0] * len(sizes)
+    placed = []
+    for buf in sorted(range(len(sizes)), key=lambda buf: (-aligned_sizes[buf], buf)):
+        offset = 0
+        for other in sorted(placed, key=lambda other: offsets[other]):
+            if (min(buf, other), max(buf, other)) not in conflicts:
+                continue
+            if offset + aligned_sizes[buf] <= offsets[other]:
+                break
+            offset = max(offset, offsets[other] + aligned_sizes[other])
+        offsets[buf] = offset
+        placed.append(buf)
+    arena_size = max([offset + size for offset, size in zip(offsets, aligned_sizes)], default=0)
+    return arena_size, offsets
+
+
+def gen_single_stream_overlaps(op_num, early_start):
+    """pairs of op positions which may run at the same time, ops are separated by inter op barriers
+    and only early start lets an op start before the op ahead of it ends"""
+    if not early_start:
+        return set()
+    return {(pos, pos + 1) for pos in range(op_num - 1)}
+
+
+def gen_double_stream_overlaps(sub_ops, cub_op_list, vec_op_list):
+    """pairs of op positions not ordered by syncs, program order of one core type alone
+    does not order ops running on different cores"""
+    graph = SyncGraph(sub_ops, cub_op_list, vec_op_list)
+    reach_graph = graph.gen_sync_reach()
+    sync_reach = None if reach_graph is None else reach_graph[3]
+    op_nodes = []
+    for sub_op in sub_ops:
+        nodes = [graph.get_node(sub_op.kernel_name_for_multi_stream, core_type) for core_type in ["cub", "vec"]]
+        op_nodes.append([node for node in nodes if node is not None])
+
+    def happens_before(pos, other_pos):
+        return sync_reach is not None and len(op_nodes[pos]) != 0 and len(op_nodes[other_pos]) != 0 and \
+            all(sync_reach[node] >> other_node & 1 for node in op_nodes[pos] for other_node in op_nodes[other_pos])
+
+    overlaps = set()
+    for pos in range(len(sub_ops)):
+        for other_pos in range(pos + 1, len(sub_ops)):
+            if not happens_before(pos, other_pos) and not happens_before(other_pos, pos):
+                overlaps.add((pos, other_pos))
+    return overlaps
+
+
+def get_workspace_args(sub_op):
+    """[(index in super kernel args, bytes)] of workspace params of sub op,
+    None when sizes are only known after tiling or do not match the workspace params, or when a workspace
+    of non zero type has to start cleared and can not be placed over a buffer another op left dirty"""
+    positions = [pos for pos, param in enumerate(sub_op.kernel_params) if param.startswith("workspace")]
+    if len(positions) != len(sub_op.workspace_sizes) or any(size < 0 for size in sub_op.workspace_sizes):
+        return None
+    if any(workspace_type != 0 for workspace_type in sub_op.workspace_types):
+        return None
+    return [(sub_op.param_offset + pos, size) for pos, size in zip(positions, sub_op.workspace_sizes)]
+
+
+def gen_workspace_plan(super_operator):
+    """one arena holding workspaces of all sub ops, workspaces of ops which never run at the same time
+    share memory. workspaces of unplanned ops keep their own buffers"""
+    sub_ops = super_operator.info_base
+    if super_operator.enable_double_stream:
+        overlaps = gen_double_stream_overlaps(sub_ops, super_operator.cub_op_list, super_operator.vec_op_list)
+    else:
+        overlaps = gen_single_stream_overlaps(len(sub_ops), \
+            super_operator.early_start_mode != SuperKernelEarlyStartMode.EarlyStartDisable)
+    buffers = []
+    unplanned = []
+    for pos, sub_op in enumerate(sub_ops):
+        workspace_args = get_workspace_args(sub_op)
+        if workspace_args is None:
+            unplanned.append(sub_op.kernel_name_for_multi_stream)
+            continue
+        buffers += [(pos, sub_op, arg_index, size) for arg_index, size in workspace_args]
+    conflicts = set()
+    for buf, (pos, _, _, _) in enumerate(buffers):
+        for other in range(buf + 1, len(buffers)):
+            other_pos = buffers[other][0]
+            if pos == other_pos or (pos, other_pos) in overlaps:
+                conflicts.add((buf, other))
+    arena_size, offsets = plan_workspace_arena([size for _, _, _, size in buffers], conflicts)
+    return {
+        "kernel_name": super_operator.kernel_name,
+        "align": WORKSPACE_ALIGN,
+        "arena_size": arena_size,
+        "workspaces": [{"kernel_name": sub_op.kernel_name_for_multi_stream, "arg_index": arg_index, "size": size, \
+            "offset": offset} for (_, sub_op, arg_index, size), offset in zip(buffers, offsets)],
+        "unplanned": unplanned,
+    }
+
+
+def get_workspace_plan_path(kernel_meta_dir, kernel_name):
+    return os.path.join(kernel_meta_dir, kernel_name + WORKSPACE_PLAN_FILE_SUFFIX)
+
+
+def write_workspace_plan(super_operator):
+    """write <kernel_name>_workspace_plan.json next to the super kernel"""
+    workspace_plan = gen_workspace_plan(super_operator)
+    separate_size = sum(align_workspace_size(workspace["size"]) for workspace in workspace_plan["workspaces"])
+    CommonUtility.dump_compile_log([f'###Workspace arena: {workspace_plan["arena_size"]} bytes, \
+separate workspaces: {separate_size} bytes, unplanned: {workspace_plan["unplanned"]}'], \
+        CompileStage.SPLIT_SUB_OBJS, super_operator.compile_log_path)
+    plan_path = get_workspace_plan_path(os.path.dirname(super_operator.kernel_file), super_operator.kernel_name)
+    try:
+        atomic_write(plan_path, json.dumps(workspace_plan, indent=2))
+    except OSError as err:
+        CommonUtility().ascendc_raise_python_err(ERR_CODE, ("gen super kernel workspace plan failed, reason is:", err))
+
+
+def load_workspace_plan(kernel_meta_dir, kernel_name):
+    """workspace plan written by compile, None when there is none"""
+    try:
+        with open(get_workspace_plan_path(kernel_meta_dir, kernel_name), 'r') as fd:
+            return json.load(fd)
+    except (OSError, ValueError):
+        return None
+
+
+def patch_workspace_args(workspace_plan, args, arena_addr):
+    """args of super kernel with planned workspace params pointing into one buffer of arena_size bytes
+    at arena_addr, offsets are multiples of align so every workspace keeps the alignment of arena_addr.
+    args of unplanned workspaces are kept."""
+    patched_args = list(args)
+    for workspace in workspace_plan["workspaces"]:
+        patched_args[workspace["arg_index"]] = arena_addr + workspace["offset"]
+    return patched_args
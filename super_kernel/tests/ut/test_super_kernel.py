@@ -28,6 +28,7 @@ GLODEN_FILE_PATH = os.path.join(FILE_PATH, "./golden")
 
 from utils import validate_codegen_output, validate_compile_options, compare_files
 from superkernel.super_kernel import *
+from superkernel.super_kernel_workspace_plan import get_workspace_plan_path
 
 sub_op_add_json = {
     "binFileName": "te_op_add",
@@ -115,6 +116,110 @@ class TestSuperKernel:
                                 compile(kernel_info, super_kernel_optype)
                                 mock_raise.assert_called()
 
+    @staticmethod
+    def test_running_compile_resets_once_per_batch(tmp_dir):
+        compile_context = SuperKernelCompileContext(kernel_meta_dir=tmp_dir)
+        with mock.patch("superkernel.super_kernel.global_var_storage") as mock_storage:
+            with running_compile(compile_context) as running_context:
+                assert running_context is compile_context
+                # compiles overlapping a running one must not reset global state it still reads
+                with running_compile():
+                    pass
+                run_compile_stage(compile_context, lambda: None)
+                assert mock_storage.global_storage_reset.call_count == 1
+            with running_compile(compile_context):
+                assert mock_storage.global_storage_reset.call_count == 2
+            run_compile_stage(compile_context, lambda: None)
+            assert mock_storage.global_storage_reset.call_count == 2
+
+    @staticmethod
+    def test_compile_many(tmp_dir):
+        case_dir = os.path.join(tmp_dir, "compile_many_case")
+        os.makedirs(case_dir, exist_ok=True)
+
+        def gen_kernel_infos(bin_content):
+            bin_path = os.path.join(case_dir, f"add_{len(bin_content)}.o")
+            with open(bin_path, 'wb') as fd:
+                fd.write(bin_content)
+            json_path = os.path.join(case_dir, "add.json")
+            with open(json_path, 'w') as fd:
+                fd.write("{}")
+            return {"op_list": [{"bin_path": bin_path, "json_path": json_path, "kernel_name": "add"}]}
+
+        def fake_super_kernel_compile(compile_info, compile_log_path):
+            for suffix, content in [(".o", b"super kernel"), (".json", b'{"kernelName": "sk"}')]:
+                with open(os.path.join(tmp_dir, compile_info["kernel_name"] + suffix), 'wb') as fd:
+                    fd.write(content)
+
+        kernel_infos_list = [gen_kernel_infos(b"add"), gen_kernel_infos(b"add"), gen_kernel_infos(b"retuned add")]
+        with mock.patch("json.load", side_effect=lambda fd: sub_op_add_json), \
+            mock.patch("subprocess.run"), \
+            mock.patch.object(CommonUtility, 'is_support_super_kernel', return_value=True), \
+            mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=tmp_dir), \
+            mock.patch("superkernel.super_kernel_cache.get_build_env_fingerprint", return_value={}), \
+            mock.patch("superkernel.super_kernel.super_kernel_compile", \
+                side_effect=fake_super_kernel_compile) as mock_compile:
+            results = compile_many(kernel_infos_list, ["sk_many_a", "sk_many_b", "sk_many_c"], enable_cache=False, \
+                jobs=2)
+            assert mock_compile.call_count == 2
+        assert [result["kernel_name"] for result in results] == ["sk_many_a", "sk_many_b", "sk_many_c"]
+        assert [result["status"] for result in results] == ["compiled", "deduplicated", "compiled"]
+        assert "compile" in results[0]["timings"] and "restore" in results[1]["timings"]
+        assert os.path.isfile(os.path.join(tmp_dir, "sk_many_b.o"))
+        # deduplicated scope gets the workspace plan of the compiled one
+        for kernel_name in ["sk_many_a", "sk_many_b", "sk_many_c"]:
+            assert os.path.isfile(get_workspace_plan_path(tmp_dir, kernel_name))
+
+        with mock.patch.object(CommonUtility, 'ascendc_raise_python_err', side_effect=RuntimeError("bad")):
+            with pytest.raises(RuntimeError):
+                compile_many(kernel_infos_list, ["sk_many_a"])
+
+    @staticmethod
+    def test_compile_async(tmp_dir):
+        import asyncio
+        import threading
+        kernel_info = {
+            "op_list": [
+                {
+                    "bin_path": "",
+                    "json_path": "",
+                    "kernel_name": "add"
+                }],
+        }
+        compile_started = threading.Event()
+        release_compile = threading.Event()
+
+        def blocked_super_kernel_compile(compile_info, compile_log_path):
+            compile_started.set()
+            release_compile.wait(10)
+
+        with mock.patch("builtins.open", new_callable=mock.mock_open, read_data="{}"), \
+            mock.patch("json.load", return_value=sub_op_add_json), \
+            mock.patch("subprocess.run"), \
+            mock.patch.object(CommonUtility, 'is_support_super_kernel', return_value=True), \
+            mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=tmp_dir):
+            with mock.patch("superkernel.super_kernel.super_kernel_compile") as mock_compile:
+                asyncio.run(compile_async(kernel_info, "test_compile_async_ok", enable_cache=False))
+                mock_compile.assert_called_once()
+            with mock.patch("superkernel.super_kernel.super_kernel_compile", \
+                    side_effect=blocked_super_kernel_compile):
+                with pytest.raises(asyncio.TimeoutError):
+                    asyncio.run(compile_async(kernel_info, "test_compile_async_timeout", enable_cache=False, \
+                        timeout=2))
+                assert compile_started.is_set()
+                release_compile.set()
+
+    @staticmethod
+    def test_compile_cancelled_between_stages(tmp_dir):
+        import threading
+        cancel_event = threading.Event()
+        cancel_event.set()
+        super_operator = mock.MagicMock()
+        with mock.patch("superkernel.super_kernel.super_kernel_compile") as mock_compile:
+            with pytest.raises(CompileCancelledError):
+                compile_super_kernel(super_operator, cancel_event=cancel_event)
+            mock_compile.assert_not_called()
+
     @staticmethod
     def test_gen_early_start_config_pre_op_is_aiv():
         info_dict = {
@@ -1281,6 +1386,44 @@ if ASCEND_IS_AIC {
 """
                 assert goden_code == code_gen
 
+    @staticmethod
+    def test_gen_sync_all_epoch_code():
+        kernel_info = {
+            "op_list": [],
+        }
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add"
+        }
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            super_operator = SuperOperatorInfos(kernel_info, "test_gen_sync_all_epoch_code")
+            super_operator.info_base = [SubOperatorInfos(0, info_dict, 0, {}), SubOperatorInfos(1, info_dict, 0, {})]
+            super_operator.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2
+            super_operator.block_dim = 2
+            super_operator.feed_sync_all_mode = SuperKernelFeedSyncAllMode.FeedSyncAllEnable
+
+            super_operator.sync_all_epoch = False
+            assert gen_sync_all_base_addr_code(super_operator) == \
+                "AscendC::g_superKernelAutoSyncAllConfigGmBaseAddr = workspace;\n"
+            assert gen_sync_all_epoch_advance_code(super_operator) == ""
+
+            super_operator.sync_all_epoch = True
+            assert gen_clear_syncall_worskspace(super_operator) == ""
+            code_gen = gen_sync_all_base_addr_code(super_operator)
+            assert "syncAllCoreIdx = 2 + AscendC::GetBlockIdx();" in code_gen
+            assert "(workspace + 512 + syncAllCoreIdx * 64)" in code_gen
+            assert "g_superKernelAutoSyncAllConfigGmBaseAddr = workspace + (syncAllEpoch & 1) * 256;" in code_gen
+
+            code_gen = gen_sync_all_epoch_advance_code(super_operator)
+            assert "(workspace + ((syncAllEpoch + 1) & 1) * 256)" in code_gen
+            assert "slot < 4; slot += 6)" in code_gen
+            assert code_gen.endswith("*syncAllEpochAddr = syncAllEpoch + 1;\ndcci(syncAllEpochAddr, 0, 2);\n")
+
+            super_operator.feed_sync_all_mode = SuperKernelFeedSyncAllMode.FeedSyncAllDisable
+            assert gen_sync_all_base_addr_code(super_operator) == ""
+            assert gen_sync_all_epoch_advance_code(super_operator) == ""
+
     @staticmethod
     def test_gen_sync_and_event_code():
         kernel_info = {
@@ -1332,6 +1475,42 @@ if ASCEND_IS_AIC {
 """
             assert goden_code == code_gen
 
+    @staticmethod
+    def test_build_sync_and_event_nodes():
+        kernel_info = {
+            "op_list": [],
+        }
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add"
+        }
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            super_operator = SuperOperatorInfos(kernel_info, "test_build_sync_and_event_nodes")
+            pre_sub_operator = SubOperatorInfos(0, info_dict, 0, {})
+            sub_operator = SubOperatorInfos(0, info_dict, 0, {})
+
+            sub_operator.recv_event_list = [100]
+            pre_sub_operator.send_event_list = [100]
+            pre_sub_operator.notify_block = "notify();\n"
+            sub_operator.wait_block = "wait();\n"
+            sub_operator.early_start_complement_wait_flag_block = "WaitPreTaskEnd<__placehoder__earlay_config__>();\n"
+            super_operator.early_start_mode = SuperKernelEarlyStartMode.EarlyStartEnableV2
+            super_operator.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
+            pre_sub_operator.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
+            sub_operator.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
+
+            nodes = build_sync_and_event_nodes(super_operator, pre_sub_operator, sub_operator)
+            assert [node.kind for node in nodes] == \
+                [NodeKind.BARRIER, NodeKind.NOTIFY, NodeKind.WAIT, NodeKind.BARRIER]
+            assert [node.scope for node in nodes if node.kind is NodeKind.BARRIER] == \
+                [BarrierScope.EARLY_START, BarrierScope.SYNC_ALL]
+            assert "WaitPreTaskEnd<10>();" in nodes[0].code
+            # placeholder is resolved when printing, sub op block is left as it is
+            assert "__placehoder__earlay_config__" in sub_operator.early_start_complement_wait_flag_block
+            assert gen_code_of_nodes(nodes, 1) == gen_sync_and_event_code(super_operator, pre_sub_operator, \
+                sub_operator)
+
     @staticmethod
     def test_gen_super_kernel_file():
         kernel_info = {
@@ -1464,5 +1643,31 @@ extern "C"  __global__ __attribute__((aligned(512))) __aicore__ void auto_gen_te
                         assert "next_sub_operator.preload_call_block" in code_gen
 
 
+    @staticmethod
+    def test_write_super_kernel_file(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "write_super_kernel_file")
+        os.makedirs(kernel_meta_dir, exist_ok=True)
+        with mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=kernel_meta_dir):
+            super_operator = SuperOperatorInfos({"op_list": []}, "test_write_super_kernel_file")
+            write_super_kernel_file(super_operator, "long generated source\n")
+            write_super_kernel_file(super_operator, "short\n")
+            with open(super_operator.kernel_file, 'r') as f:
+                assert f.read() == "short\n"
+
+            super_operator = SuperOperatorInfos({"op_list": []}, "test_write_super_kernel_file", \
+                content_naming=True)
+            write_super_kernel_file(super_operator, "generated source\n")
+            kernel_file = super_operator.kernel_file
+            assert os.path.basename(kernel_file).startswith("test_write_super_kernel_file_")
+            assert super_operator.compile_info["kernel_file"] == kernel_file
+            write_super_kernel_file(super_operator, "generated source\n")
+            assert super_operator.kernel_file == kernel_file
+            write_super_kernel_file(super_operator, "other generated source\n")
+            assert super_operator.kernel_file != kernel_file
+            with open(kernel_file, 'r') as f:
+                assert f.read() == "generated source\n"
+            assert not [name for name in os.listdir(kernel_meta_dir) if name.endswith(".tmp")]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel ar archive reader."""
+
+import os
+import sys
+import pytest
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_ar import *
+from utils import write_file
+
+LONG_MEMBER_NAME = "te_add_mix_aiv_1234567890.o"
+
+
+def gen_ar_header(name, size):
+    return f"{name:<16}{0:<12}{0:<6}{0:<6}{644:<8}{size:<10}".encode() + b"`\n"
+
+
+def gen_ar_member(name, content):
+    member = gen_ar_header(name, len(content)) + content
+    return member + b"\n" if len(content) % 2 else member
+
+
+def gen_gnu_archive(members):
+    long_names = b""
+    body = gen_ar_member("/", b"\x00" * 4)
+    headers = []
+    for name, content in members:
+        if len(name) >= 16:
+            headers.append((f"/{len(long_names)}", content))
+            long_names += name.encode() + b"/\n"
+        else:
+            headers.append((name + "/", content))
+    if long_names:
+        body += gen_ar_member("//", long_names)
+    for name, content in headers:
+        body += gen_ar_member(name, content)
+    return AR_MAGIC + body
+
+
+def gen_bsd_archive(members):
+    body = gen_ar_member("__.SYMDEF", b"\x00" * 8)
+    for name, content in members:
+        body += gen_ar_member(f"#1/{len(name)}", name.encode() + content)
+    return AR_MAGIC + body
+
+
+class TestSuperKernelAr:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"--------------TearDown-------------")
+
+    @staticmethod
+    @pytest.mark.parametrize("gen_archive", [gen_gnu_archive, gen_bsd_archive])
+    def test_read_members(tmp_dir, gen_archive):
+        members = [("add.o", b"odd"), (LONG_MEMBER_NAME, b"long member"), ("add_split1.o", b"split1")]
+        archive_path = write_file(os.path.join(tmp_dir, f"{gen_archive.__name__}.a"), gen_archive(members))
+        with ArArchive(archive_path) as archive:
+            assert sorted(archive.members) == sorted(name for name, _ in members)
+            for name, content in members:
+                with archive.member_view(name) as member:
+                    assert bytes(member) == content
+
+    @staticmethod
+    def test_extract_ar_members(tmp_dir):
+        archive_path = write_file(os.path.join(tmp_dir, "extract.a"), \
+            gen_gnu_archive([("add.o", b"add"), ("add_split1.o", b"split1"), ("mul.o", b"mul")]))
+        dst_dir = os.path.join(tmp_dir, "extract_members")
+        os.makedirs(dst_dir, exist_ok=True)
+        cwd = os.getcwd()
+        extracted = extract_ar_members(archive_path, dst_dir, ["add.o", "add_split1.o", "add_split2.o"])
+        assert os.getcwd() == cwd
+        assert extracted == ["add.o", "add_split1.o"]
+        assert sorted(os.listdir(dst_dir)) == ["add.o", "add_split1.o"]
+        with open(os.path.join(dst_dir, "add_split1.o"), 'rb') as fd:
+            assert fd.read() == b"split1"
+
+    @staticmethod
+    def test_read_invalid_archive(tmp_dir):
+        with pytest.raises(ArFormatError):
+            ArArchive(write_file(os.path.join(tmp_dir, "empty.a"), b""))
+        with pytest.raises(ArFormatError):
+            ArArchive(write_file(os.path.join(tmp_dir, "thin.a"), b"!<thin>\n"))
+        with pytest.raises(ArFormatError):
+            ArArchive(write_file(os.path.join(tmp_dir, "truncated.a"), \
+                gen_gnu_archive([("add.o", b"add" * 10)])[:-8]))
+
+
+if __name__ == "__main__":
+    pytest.main()
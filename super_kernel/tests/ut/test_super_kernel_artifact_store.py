@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel sub op artifact store."""
+
+import os
+import json
+import sys
+import pytest
+from types import SimpleNamespace
+from unittest import mock
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_artifact_store import *
+from superkernel.super_kernel_context import SuperKernelCompileContext
+from utils import write_file
+
+
+def gen_sub_op(tmp_dir, bin_content=b"sub op binary"):
+    case_dir = os.path.join(tmp_dir, "artifact_store_case")
+    os.makedirs(case_dir, exist_ok=True)
+    sub_op = SimpleNamespace(
+        kernel_name="add",
+        index=0,
+        stream_index=0,
+        param_offset=1,
+        split_mode=4,
+        bin_path=write_file(os.path.join(case_dir, "add.o"), bin_content),
+        json_path=write_file(os.path.join(case_dir, "add.json"), b'{"kernelName": "add"}'),
+        sub_op_task_type=SubOperatorType.STATIC_OP,
+        send_event_list=[],
+        recv_event_list=[],
+        tiling_key_profile={},
+        compile_context=SuperKernelCompileContext(chip_version="dav-c220", c310=False, \
+            soc_spec={"ai_core_cnt": 24, "vector_core_cnt": 48}),
+    )
+    for attr in CODE_GEN_ATTRS:
+        setattr(sub_op, attr, None)
+    return sub_op
+
+
+class TestSuperKernelArtifactStore:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"--------------TearDown-------------")
+
+    @staticmethod
+    def test_gen_prepare_key(tmp_dir):
+        store = SubOpArtifactStore(os.path.join(tmp_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        key = store.gen_prepare_key(gen_sub_op(tmp_dir))
+        assert key == store.gen_prepare_key(gen_sub_op(tmp_dir))
+        assert key != store.gen_prepare_key(gen_sub_op(tmp_dir, bin_content=b"retuned sub op binary"))
+        sub_op = gen_sub_op(tmp_dir)
+        sub_op.split_mode = 2
+        assert key != store.gen_prepare_key(sub_op)
+
+    @staticmethod
+    def test_commit_and_get_text_len(tmp_dir):
+        store = SubOpArtifactStore(os.path.join(tmp_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        sub_op = gen_sub_op(tmp_dir, bin_content=b"committed sub op binary")
+        entry = store.open_entry(sub_op)
+        assert os.path.isdir(entry.entry_dir)
+        assert entry.prepared is False
+        assert entry.get_text_len("add.o") is None
+
+        sub_op.aiv_bin = os.path.join(entry.entry_dir, "add_mix_aiv.o")
+        sub_op.aiv_text_len = 1024
+        entry.commit(sub_op)
+        reopened_entry = store.open_entry(sub_op)
+        assert reopened_entry.entry_dir == entry.entry_dir
+        assert reopened_entry.prepared is True
+        assert reopened_entry.get_text_len(sub_op.aiv_bin) == 1024
+        assert reopened_entry.get_text_len("add_mix_aic.o") is None
+
+    @staticmethod
+    def test_save_and_restore_code_gen(tmp_dir):
+        store = SubOpArtifactStore(os.path.join(tmp_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        sub_op = gen_sub_op(tmp_dir)
+        entry = store.open_entry(sub_op)
+        key = entry.gen_code_gen_key(sub_op, set(), False, {})
+        assert entry.restore_code_gen(sub_op, key) is False
+
+        sub_op.kernel_call_block = "add_mix_aiv(param_base[1]);\n"
+        sub_op.block_dim = 8
+        sub_op.sub_kernel_names = ["add_mix_aiv"]
+        entry.save_code_gen(sub_op, key)
+
+        restored_sub_op = gen_sub_op(tmp_dir)
+        with mock.patch.object(CommonUtility, 'dump_compile_log'):
+            assert entry.restore_code_gen(restored_sub_op, key) is True
+        assert restored_sub_op.kernel_call_block == "add_mix_aiv(param_base[1]);\n"
+        assert restored_sub_op.block_dim == 8
+        assert restored_sub_op.sub_kernel_names == ["add_mix_aiv"]
+        assert restored_sub_op.sub_op_task_type is SubOperatorType.STATIC_OP
+
+    @staticmethod
+    def test_restore_code_gen_of_older_entry(tmp_dir):
+        store = SubOpArtifactStore(os.path.join(tmp_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        sub_op = gen_sub_op(tmp_dir)
+        entry = store.open_entry(sub_op)
+        key = entry.gen_code_gen_key(sub_op, set(), False, {})
+        code_gen_infos = {attr: None for attr in CODE_GEN_ATTRS if attr != "preload_call_blocks"}
+        code_gen_infos["sub_op_task_type"] = SubOperatorType.STATIC_OP.name
+        with open(entry.get_code_gen_path(key), 'w') as fd:
+            json.dump(code_gen_infos, fd)
+        assert entry.restore_code_gen(gen_sub_op(tmp_dir), key) is False
+
+    @staticmethod
+    def test_gen_code_gen_key(tmp_dir):
+        store = SubOpArtifactStore(os.path.join(tmp_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        sub_op = gen_sub_op(tmp_dir)
+        entry = store.open_entry(sub_op)
+        key = entry.gen_code_gen_key(sub_op, set(), False, {})
+        assert key == entry.gen_code_gen_key(sub_op, {100}, False, {})
+        assert key != entry.gen_code_gen_key(sub_op, set(), True, {})
+        assert key != entry.gen_code_gen_key(sub_op, set(), False, {"split-mode": 2})
+        sub_op.send_event_list = [100]
+        send_key = entry.gen_code_gen_key(sub_op, set(), False, {})
+        assert key != send_key
+        assert send_key != entry.gen_code_gen_key(sub_op, {100}, False, {})
+        sub_op.param_offset = 5
+        assert send_key != entry.gen_code_gen_key(sub_op, set(), False, {})
+
+    @staticmethod
+    def test_open_entry_failed(tmp_dir):
+        store = SubOpArtifactStore(os.path.join(tmp_dir, SUB_OP_ARTIFACT_DIR_NAME))
+        with mock.patch("os.makedirs", side_effect=OSError("read-only file system")), \
+            mock.patch.object(CommonUtility, 'dump_compile_log') as mock_log:
+            assert store.open_entry(gen_sub_op(tmp_dir)) is None
+            mock_log.assert_called()
+
+
+if __name__ == "__main__":
+    pytest.main()
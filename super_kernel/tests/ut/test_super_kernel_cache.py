@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel compile cache."""
+
+import os
+import sys
+import json
+import subprocess
+import pytest
+from unittest import mock
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_cache import *
+from utils import write_file
+
+build_env_fingerprint = {
+    "soc_version": "Ascend910B1",
+    "short_soc_version": "Ascend910B",
+    "toolchain_version": "bisheng 1.0",
+}
+
+
+def gen_kernel_infos(tmp_dir, bin_content=b"sub op binary", options="compile-options=-g:"):
+    case_dir = os.path.join(tmp_dir, "compile_cache_case")
+    os.makedirs(case_dir, exist_ok=True)
+    return {
+        "super_kernel_options": options,
+        "op_list": [
+            {
+                "stream_id": 1,
+                "bin_path": write_file(os.path.join(case_dir, "add.o"), bin_content),
+                "json_path": write_file(os.path.join(case_dir, "add.json"), b'{"kernelName": "add"}'),
+            }],
+    }
+
+
+class TestSuperKernelCache:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"--------------TearDown-------------")
+
+    @staticmethod
+    def test_gen_compile_cache_key(tmp_dir):
+        with mock.patch("superkernel.super_kernel_cache.get_build_env_fingerprint",
+                        return_value=build_env_fingerprint):
+            key = gen_compile_cache_key(gen_kernel_infos(tmp_dir))
+            assert key == gen_compile_cache_key(gen_kernel_infos(tmp_dir))
+            assert key != gen_compile_cache_key(gen_kernel_infos(tmp_dir, bin_content=b"retuned sub op binary"))
+            assert key != gen_compile_cache_key(gen_kernel_infos(tmp_dir, options="compile-options=-O2:"))
+            assert key != gen_compile_cache_key(gen_kernel_infos(tmp_dir), impl_mode="high_performance")
+            with mock.patch("superkernel.super_kernel_cache.CACHE_FORMAT_VERSION", CACHE_FORMAT_VERSION - 1):
+                assert key != gen_compile_cache_key(gen_kernel_infos(tmp_dir))
+
+            kernel_infos = gen_kernel_infos(tmp_dir)
+            kernel_infos["op_list"][0]["send_event_list"] = [100]
+            assert key != gen_compile_cache_key(kernel_infos)
+
+        with mock.patch("superkernel.super_kernel_cache.get_build_env_fingerprint",
+                        return_value=dict(build_env_fingerprint, toolchain_version="bisheng 2.0")):
+            assert key != gen_compile_cache_key(gen_kernel_infos(tmp_dir))
+
+    @staticmethod
+    def test_generator_and_header_digest(tmp_dir):
+        assert get_generator_digest() == get_generator_digest()
+        assert len(get_generator_digest()) == 64
+
+        header_dir = os.path.join(tmp_dir, "asc_header_digest")
+        os.makedirs(os.path.join(header_dir, "impl"), exist_ok=True)
+        header_path = write_file(os.path.join(header_dir, "impl", "kernel_operator.h"), b"#define A 1\n")
+        digest = get_header_tree_digest(header_dir)
+        write_file(header_path, b"#define A 12\n")
+        get_header_tree_digest.cache_clear()
+        assert digest != get_header_tree_digest(header_dir)
+
+    @staticmethod
+    def test_gen_compile_cache_key_of_unreadable_op(tmp_dir):
+        with mock.patch("superkernel.super_kernel_cache.get_build_env_fingerprint",
+                        return_value=build_env_fingerprint):
+            assert gen_compile_cache_key({"op_list": []}) is None
+            kernel_infos = gen_kernel_infos(tmp_dir)
+            kernel_infos["op_list"][0]["bin_path"] = os.path.join(tmp_dir, "not_exist.o")
+            assert gen_compile_cache_key(kernel_infos) is None
+
+    @staticmethod
+    def test_replace_kernel_name():
+        assert replace_kernel_name("te_superkernel_1", "te_superkernel_1", "te_sk_2") == "te_sk_2"
+        assert replace_kernel_name("te_superkernel_1_mix_aic", "te_superkernel_1", "te_sk_2") == "te_sk_2_mix_aic"
+        assert replace_kernel_name("auto_gen_te_superkernel_1_kernel", "te_superkernel_1", "te_sk_2") == \
+            "auto_gen_te_sk_2_kernel"
+        assert replace_kernel_name("te_superkernel_12", "te_superkernel_1", "te_sk_2") == "te_superkernel_12"
+
+    @staticmethod
+    def test_store_and_load_same_name(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "compile_cache_same_name")
+        os.makedirs(kernel_meta_dir, exist_ok=True)
+        compile_cache = SuperKernelCompileCache(os.path.join(kernel_meta_dir, SUPER_KERNEL_CACHE_DIR_NAME))
+        key = "ab" * 32
+        assert compile_cache.load(key, kernel_meta_dir, "te_superkernel_1") is False
+        assert compile_cache.store(key, kernel_meta_dir, "te_superkernel_1") is False
+
+        write_file(os.path.join(kernel_meta_dir, "te_superkernel_1.o"), b"super kernel binary")
+        write_file(os.path.join(kernel_meta_dir, "te_superkernel_1.json"), b'{"kernelName": "te_superkernel_1"}')
+        assert compile_cache.store(key, kernel_meta_dir, "te_superkernel_1") is True
+        assert os.path.isfile(os.path.join(compile_cache.get_entry_dir(key), CACHE_META_FILE_NAME))
+
+        os.remove(os.path.join(kernel_meta_dir, "te_superkernel_1.o"))
+        os.remove(os.path.join(kernel_meta_dir, "te_superkernel_1.json"))
+        assert compile_cache.load(key, kernel_meta_dir, "te_superkernel_1") is True
+        with open(os.path.join(kernel_meta_dir, "te_superkernel_1.o"), 'rb') as fd:
+            assert fd.read() == b"super kernel binary"
+
+    @staticmethod
+    def test_load_with_other_name(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "compile_cache_other_name")
+        os.makedirs(kernel_meta_dir, exist_ok=True)
+        compile_cache = SuperKernelCompileCache(os.path.join(kernel_meta_dir, SUPER_KERNEL_CACHE_DIR_NAME))
+        key = "cd" * 32
+        obj_path = write_file(os.path.join(kernel_meta_dir, "te_superkernel_1.o"), b"super kernel binary")
+        json_infos = {
+            "binFileName": "te_superkernel_1",
+            "kernelName": "te_superkernel_1_mix_aic",
+            "sha256": calc_file_sha256(obj_path),
+            "SuperkernelInfo": {"kernelList": {"aicore": [{"func_name": "is_inf__kernel0"}]}},
+        }
+        write_file(os.path.join(kernel_meta_dir, "te_superkernel_1.json"), json.dumps(json_infos).encode())
+        assert compile_cache.store(key, kernel_meta_dir, "te_superkernel_1") is True
+
+        nm_result = subprocess.CompletedProcess([], 0, stdout="0000000000000000 T te_superkernel_1_mix_aic\n\
+                 U is_inf__kernel0\n", stderr="")
+        with mock.patch("subprocess.run", return_value=nm_result) as mock_run:
+            assert compile_cache.load(key, kernel_meta_dir, "te_superkernel_2") is True
+            objcopy_cmd = mock_run.call_args_list[-1][0][0]
+            assert objcopy_cmd[0] == "llvm-objcopy"
+        with open(os.path.join(kernel_meta_dir, "te_superkernel_2.json"), 'r') as fd:
+            renamed_json = json.load(fd)
+        assert renamed_json["binFileName"] == "te_superkernel_2"
+        assert renamed_json["kernelName"] == "te_superkernel_2_mix_aic"
+        assert renamed_json["SuperkernelInfo"]["kernelList"]["aicore"][0]["func_name"] == "is_inf__kernel0"
+
+    @staticmethod
+    def test_store_and_load_workspace_plan(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "compile_cache_workspace_plan")
+        os.makedirs(kernel_meta_dir, exist_ok=True)
+        compile_cache = SuperKernelCompileCache(os.path.join(kernel_meta_dir, SUPER_KERNEL_CACHE_DIR_NAME))
+        write_file(os.path.join(kernel_meta_dir, "sk.o"), b"super kernel binary")
+        write_file(os.path.join(kernel_meta_dir, "sk.json"), b'{"kernelName": "sk"}')
+        assert compile_cache.store("12" * 32, kernel_meta_dir, "sk") is True
+        plan_path = write_file(get_workspace_plan_path(kernel_meta_dir, "sk"), b'{"kernel_name": "sk"}')
+        assert compile_cache.store("34" * 32, kernel_meta_dir, "sk") is True
+
+        os.remove(plan_path)
+        assert compile_cache.load("34" * 32, kernel_meta_dir, "sk") is True
+        with open(plan_path, 'r') as fd:
+            assert json.load(fd) == {"kernel_name": "sk"}
+        # plan of an earlier compile does not belong to an entry without plan
+        assert compile_cache.load("12" * 32, kernel_meta_dir, "sk") is True
+        assert not os.path.exists(plan_path)
+
+        restore_workspace_plan(compile_cache.get_entry_dir("34" * 32), "sk", kernel_meta_dir, "sk_2")
+        with open(get_workspace_plan_path(kernel_meta_dir, "sk_2"), 'r') as fd:
+            assert json.load(fd) == {"kernel_name": "sk_2"}
+
+    @staticmethod
+    def test_load_broken_entry(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "compile_cache_broken_entry")
+        compile_cache = SuperKernelCompileCache(os.path.join(kernel_meta_dir, SUPER_KERNEL_CACHE_DIR_NAME))
+        key = "ef" * 32
+        os.makedirs(compile_cache.get_entry_dir(key), exist_ok=True)
+        write_file(os.path.join(compile_cache.get_entry_dir(key), CACHE_META_FILE_NAME), b'{"kernel_name": "sk"}')
+        with mock.patch.object(CommonUtility, 'print_compile_log') as mock_log:
+            assert compile_cache.load(key, kernel_meta_dir, "sk") is False
+            mock_log.assert_called()
+
+    @staticmethod
+    def test_get_default_cache_dir(tmp_dir):
+        with mock.patch.dict(os.environ, {SUPER_KERNEL_CACHE_DIR_ENV: ""}):
+            assert SuperKernelCompileCache.get_default_cache_dir(str(tmp_dir)) == \
+                os.path.join(str(tmp_dir), SUPER_KERNEL_CACHE_DIR_NAME)
+        with mock.patch.dict(os.environ, {SUPER_KERNEL_CACHE_DIR_ENV: "/tmp/sk_cache"}):
+            assert SuperKernelCompileCache.get_default_cache_dir(str(tmp_dir)) == "/tmp/sk_cache"
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel code emitter."""
+
+import os
+import sys
+import hashlib
+import pytest
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_code_emitter import *
+
+
+class TestSuperKernelCodeEmitter:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_emit_with_indent():
+        emitter = CodeEmitter()
+        emitter.write("void func() {\n")
+        with emitter.indent():
+            emitter.emit("if (flag) {\n")
+            with emitter.indent():
+                emitter.emit("call();\n\nwait();\n")
+            emitter.emit("}\n")
+            # raw code keeps its own indentation
+            emitter.write("    // raw\n")
+        emitter.write("}\n")
+        assert emitter.getvalue() == \
+            "void func() {\n    if (flag) {\n        call();\n\n        wait();\n    }\n    // raw\n}\n"
+        assert emitter.indent_level == 0
+        assert emitter.hexdigest() == hashlib.sha256(emitter.getvalue().encode()).hexdigest()
+
+    @staticmethod
+    def test_file_code_emitter_commit(tmp_dir):
+        dst_path = os.path.join(tmp_dir, "code_emitter_commit.cpp")
+        with FileCodeEmitter(dst_path, flush_size=16) as emitter:
+            for index in range(100):
+                emitter.emit(f"call_{index}();\n")
+            # streamed out once pending code reaches flush size
+            assert emitter.pending_size < 16
+            assert not os.path.exists(dst_path)
+            emitter.commit(dst_path)
+            content_sha256 = emitter.hexdigest()
+        with open(dst_path, 'r') as f:
+            content = f.read()
+        assert content == "".join(f"call_{index}();\n" for index in range(100))
+        assert content_sha256 == hashlib.sha256(content.encode()).hexdigest()
+
+        with FileCodeEmitter(dst_path) as emitter:
+            emitter.write("other();\n")
+            emitter.commit(dst_path, keep_existing=True)
+        with open(dst_path, 'r') as f:
+            assert f.read() == content
+        assert sorted(os.listdir(tmp_dir)).count("code_emitter_commit.cpp") == 1
+        assert not [name for name in os.listdir(tmp_dir) if name.startswith("code_emitter_commit.cpp.")]
+
+    @staticmethod
+    def test_file_code_emitter_discard(tmp_dir):
+        dst_path = os.path.join(tmp_dir, "code_emitter_discard.cpp")
+        with pytest.raises(RuntimeError):
+            with FileCodeEmitter(dst_path) as emitter:
+                emitter.write("call();\n")
+                raise RuntimeError("code generation failed")
+        assert not os.path.exists(dst_path)
+        assert not os.path.exists(emitter.tmp_path)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel codegen ir."""
+
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_codegen_ir import *
+from superkernel.super_kernel_code_emitter import CodeEmitter
+
+
+class RemoveNodesPass(CodeGenPass):
+    name = "remove_nodes"
+
+    def __init__(self, kind):
+        self.kind = kind
+
+    def run(self, super_operator, body):
+        node_num = len(body.nodes)
+        body.nodes = [node for node in body.nodes if node.kind is not self.kind]
+        return node_num - len(body.nodes)
+
+
+class TestSuperKernelCodegenIr:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_node_segments_and_placeholders():
+        node = CodeGenNode(NodeKind.BARRIER, "// begin inter ops barrier\n", scope=BarrierScope.EARLY_START)
+        node.add_code("set_flag();\n")
+        node.add_code("wait_flag<__placehoder__earlay_config__>();\n")
+        node.placeholders["__placehoder__earlay_config__"] = "5"
+        # code of same indentation is kept as one segment
+        assert len(node.segments) == 1
+        assert node.code == "// begin inter ops barrier\nset_flag();\nwait_flag<5>();\n"
+        assert node.segments[0][0].endswith("wait_flag<__placehoder__earlay_config__>();\n")
+        assert CodeGenNode(NodeKind.NOTIFY, "").empty
+
+    @staticmethod
+    def test_print_codegen_nodes():
+        wait_sync = CodeGenNode(NodeKind.BARRIER, "// reason3\n", indented=False)
+        wait_sync.add_code("sync_all();\n\n")
+        nodes = [CodeGenNode(NodeKind.WAIT, "wait();\n"), wait_sync, CodeGenNode(NodeKind.NOTIFY, "notify();")]
+        assert gen_code_of_nodes(nodes) == "wait();\n// reason3\nsync_all();\n\nnotify();"
+        assert gen_code_of_nodes(nodes, 1) == "    wait();\n// reason3\n    sync_all();\n\n    notify();"
+
+        emitter = CodeEmitter()
+        with emitter.indent(2):
+            print_codegen_nodes(emitter, nodes)
+        assert emitter.getvalue() == "        wait();\n// reason3\n        sync_all();\n\n        notify();"
+
+    @staticmethod
+    def test_run_codegen_passes():
+        body = CodeGenBody("aiv")
+        body.append(CodeGenNode(NodeKind.SUB_OP_CALL, "call_0();\n"))
+        body.append(CodeGenNode(NodeKind.PRELOAD, ""))
+        body.append(CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL))
+        body.append(CodeGenNode(NodeKind.SUB_OP_CALL, "call_1();\n"))
+        # empty nodes are never kept
+        assert [node.kind for node in body.nodes] == [NodeKind.SUB_OP_CALL, NodeKind.BARRIER, NodeKind.SUB_OP_CALL]
+
+        with pytest.raises(TypeError):
+            CodeGenPass()
+        super_operator = SimpleNamespace(kernel_name="test_run_codegen_passes")
+        run_codegen_passes(super_operator, body, [])
+        assert len(body.nodes) == 3
+        run_codegen_passes(super_operator, body, [RemoveNodesPass(NodeKind.BARRIER)])
+        assert body.nodes_of(NodeKind.BARRIER) == []
+        assert gen_code_of_nodes(body.nodes) == "call_0();\ncall_1();\n"
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel codegen passes."""
+
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_codegen_ir import NodeKind, BarrierScope, CodeGenNode, CodeGenBody, \
+    run_codegen_passes, gen_code_of_nodes
+from superkernel.super_kernel_codegen_passes import *
+
+
+def gen_body(nodes, arch=None):
+    body = CodeGenBody(arch)
+    body.extend(nodes)
+    return body
+
+
+class TestSuperKernelCodegenPasses:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_remove_duplicated_barrier():
+        super_operator = SimpleNamespace(kernel_name="test_remove_duplicated_barrier")
+        body = gen_body([
+            CodeGenNode(NodeKind.SUB_OP_CALL, "call_0();\n"),
+            CodeGenNode(NodeKind.DEBUG, "// op end debug sync all.\nsync_all();\n", scope=BarrierScope.SYNC_ALL),
+            CodeGenNode(NodeKind.CODE, "//begin func call of sub operator op_1\n"),
+            CodeGenNode(NodeKind.PRELOAD, "preload_1();\n"),
+            CodeGenNode(NodeKind.BARRIER, "// begin inter ops barrier\nsync_all();\n", scope=BarrierScope.SYNC_ALL),
+            CodeGenNode(NodeKind.SUB_OP_CALL, "call_1();\n"),
+        ])
+        pass_stats = run_codegen_passes(super_operator, body, [RedundantBarrierPass()])
+        assert pass_stats == {"remove_redundant_barrier": 1}
+        assert gen_code_of_nodes(body.nodes) == "call_0();\n// op end debug sync all.\nsync_all();\n" \
+            "//begin func call of sub operator op_1\npreload_1();\ncall_1();\n"
+
+    @staticmethod
+    def test_remove_subsumed_barrier():
+        super_operator = SimpleNamespace(kernel_name="test_remove_subsumed_barrier")
+        wait_node = CodeGenNode(NodeKind.WAIT, "wait();\n")
+        extra_sync = CodeGenNode(NodeKind.BARRIER, "sync_all_aiv();\n", scope=BarrierScope.AIV_ALL)
+        inter_ops_barrier = CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL)
+        body = gen_body([wait_node, extra_sync, inter_ops_barrier])
+        assert RedundantBarrierPass().run(super_operator, body) == 1
+        assert body.nodes == [wait_node, inter_ops_barrier]
+
+        # barriers apart from each other are all needed
+        nodes = [
+            CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL),
+            CodeGenNode(NodeKind.NOTIFY, "notify();\n"),
+            CodeGenNode(NodeKind.WAIT, "wait();\n"),
+            CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL),
+            CodeGenNode(NodeKind.CODE, "AscendC::g_superKernelAutoSyncAllEnable = false;\n"),
+            CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL),
+            CodeGenNode(NodeKind.DATA_CACHE_PRELOAD, "data_cache_preload();\n"),
+            CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL),
+        ]
+        body = gen_body(nodes)
+        assert RedundantBarrierPass().run(super_operator, body) == 0
+        assert body.nodes == nodes
+
+        # early start flags and pipe barriers are never subsumed by sync all
+        nodes = [
+            CodeGenNode(NodeKind.BARRIER, "set_flag();\nwait_flag();\n", scope=BarrierScope.EARLY_START),
+            CodeGenNode(NodeKind.BARRIER, "pipe_barrier(PIPE_ALL);\n", scope=BarrierScope.PIPE_ALL),
+            CodeGenNode(NodeKind.BARRIER, "sync_all();\n", scope=BarrierScope.SYNC_ALL),
+            CodeGenNode(NodeKind.BARRIER, "set_flag();\nwait_flag();\n", scope=BarrierScope.EARLY_START),
+        ]
+        body = gen_body(nodes, "aic")
+        assert RedundantBarrierPass().run(super_operator, body) == 0
+        assert body.nodes == nodes
+
+
+if __name__ == "__main__":
+    pytest.main()
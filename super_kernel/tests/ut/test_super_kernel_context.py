@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel compile context."""
+
+import os
+import sys
+import threading
+import contextvars
+import pytest
+from unittest import mock
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import CommonUtility
+from superkernel.super_kernel_context import *
+
+
+soc_spec = {"SOC_VERSION": "Ascend910B1", "SHORT_SOC_VERSION": "Ascend910B", "ai_core_cnt": 24,
+    "vector_core_cnt": 48}
+
+
+def mock_global_config(kernel_meta_dir, c310=False):
+    patches = [
+        mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=kernel_meta_dir),
+        mock.patch.object(CommonUtility, 'get_chip_version', return_value="dav-c220"),
+        mock.patch.object(CommonUtility, 'is_c310', return_value=c310),
+        mock.patch.object(CommonUtility, 'is_has_ffts_mode', return_value=True),
+        mock.patch.object(CommonUtility, 'get_distinct_filename_tag', return_value=""),
+        mock.patch.object(CommonUtility, 'is_support_super_kernel', return_value=not c310),
+        mock.patch("superkernel.super_kernel_context.get_soc_spec", side_effect=lambda key: soc_spec[key]),
+        mock.patch("superkernel.super_kernel_context.get_op_debug_config", return_value=""),
+    ]
+    for patch in patches:
+        patch.start()
+    return patches
+
+
+def stop_patches(patches):
+    for patch in patches:
+        patch.stop()
+
+
+class TestSuperKernelContext:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_default_context_follows_global_config(tmp_dir):
+        compile_context = get_compile_context()
+        patches = mock_global_config(os.path.join(tmp_dir, "kernel_meta_a"))
+        try:
+            assert compile_context.get_kernel_meta_dir() == os.path.join(tmp_dir, "kernel_meta_a")
+            assert compile_context.get_soc_spec("ai_core_cnt") == 24
+            assert compile_context.is_c310() is False
+        finally:
+            stop_patches(patches)
+        patches = mock_global_config(os.path.join(tmp_dir, "kernel_meta_b"), c310=True)
+        try:
+            assert compile_context.get_kernel_meta_dir() == os.path.join(tmp_dir, "kernel_meta_b")
+            assert compile_context.is_c310() is True
+        finally:
+            stop_patches(patches)
+
+    @staticmethod
+    def test_capture_is_snapshot(tmp_dir):
+        patches = mock_global_config(os.path.join(tmp_dir, "kernel_meta_a"))
+        try:
+            compile_context = SuperKernelCompileContext.capture(compile_log_path="compile.log")
+        finally:
+            stop_patches(patches)
+        patches = mock_global_config(os.path.join(tmp_dir, "kernel_meta_b"), c310=True)
+        try:
+            assert compile_context.get_kernel_meta_dir() == os.path.join(tmp_dir, "kernel_meta_a")
+            assert compile_context.get_chip_version() == "dav-c220"
+            assert compile_context.get_soc_spec("vector_core_cnt") == 48
+            assert compile_context.is_c310() is False
+            assert compile_context.is_has_ffts_mode() is True
+            assert compile_context.compile_log_path == "compile.log"
+            assert compile_context.is_support_super_kernel() is True
+        finally:
+            stop_patches(patches)
+
+    @staticmethod
+    def test_use_compile_context_nesting(tmp_dir):
+        default_context = get_compile_context()
+        outer_context = SuperKernelCompileContext(kernel_meta_dir=os.path.join(tmp_dir, "outer"))
+        inner_context = SuperKernelCompileContext(kernel_meta_dir=os.path.join(tmp_dir, "inner"))
+        with use_compile_context(outer_context):
+            assert get_compile_context() is outer_context
+            with use_compile_context(inner_context):
+                assert get_compile_context() is inner_context
+            assert get_compile_context() is outer_context
+        assert get_compile_context() is default_context
+
+    @staticmethod
+    def test_compile_context_of_threads(tmp_dir):
+        seen_dirs = {}
+        barrier = threading.Barrier(2)
+
+        def run(name):
+            with use_compile_context(SuperKernelCompileContext(kernel_meta_dir=os.path.join(tmp_dir, name))):
+                barrier.wait()
+                seen_dirs[name] = get_compile_context().get_kernel_meta_dir()
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in ["scope_a", "scope_b"]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert seen_dirs == {name: os.path.join(tmp_dir, name) for name in ["scope_a", "scope_b"]}
+
+        # a worker started from a copied context sees the compile context of its caller
+        compile_context = SuperKernelCompileContext(kernel_meta_dir=os.path.join(tmp_dir, "caller"))
+        with use_compile_context(compile_context):
+            worker = threading.Thread(target=contextvars.copy_context().run, \
+                args=(lambda: seen_dirs.update(worker=get_compile_context().get_kernel_meta_dir()),))
+        worker.start()
+        worker.join()
+        assert seen_dirs["worker"] == os.path.join(tmp_dir, "caller")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel cost model of kernel type and block dim."""
+
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_utility import KernelMetaType
+from superkernel.super_kernel_cost_model import *
+
+
+def gen_sub_op(kernel_type, block_dim, estimated_duration=0):
+    return SimpleNamespace(kernel_type=kernel_type, block_dim=block_dim, estimated_duration=estimated_duration)
+
+
+class TestSuperKernelCostModel:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_get_core_num():
+        assert get_core_num(KernelMetaType.KERNEL_TYPE_MIX_AIV_1_0, 8) == (0, 8)
+        assert get_core_num(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_0, 8) == (8, 0)
+        assert get_core_num(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, 8) == (8, 8)
+        assert get_core_num(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, 8) == (8, 16)
+        assert get_core_num(KernelMetaType.KERNEL_TYPE_AIV_ONLY, 8) == (0, 8)
+        assert get_core_num(KernelMetaType.KERNEL_TYPE_AIC_ONLY, 8) == (8, 0)
+
+    @staticmethod
+    def test_gen_mix_kernel_type_candidates():
+        assert gen_mix_kernel_type_candidates(24, 30) == [(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, 30), \
+            (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, 24)]
+        assert gen_mix_kernel_type_candidates(8, 48) == [(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, 48), \
+            (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, 24)]
+
+    @staticmethod
+    def test_core_overhead_cost_model():
+        with pytest.raises(TypeError):
+            CostModel()
+        cost_model = CoreOverheadCostModel()
+        sub_ops = [gen_sub_op(KernelMetaType.KERNEL_TYPE_AIC_ONLY, 8, 10), \
+            gen_sub_op(KernelMetaType.KERNEL_TYPE_AIV_ONLY, 16, 20)]
+        cost = cost_model.estimate(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, 8, sub_ops)
+        # aiv cores poll in complement branch of the aic op and aic cores in that of the aiv op
+        assert cost == pytest.approx(30 + 24 * 0.01 + 2 * 24 * 0.005 + (16 * 10 + 8 * 20) * 0.001)
+        assert cost < cost_model.estimate(KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, 16, sub_ops)
+
+    @staticmethod
+    def test_select_kernel_type_and_block_dim():
+        cost_model = CoreOverheadCostModel()
+        sub_ops = [gen_sub_op(KernelMetaType.KERNEL_TYPE_AIC_ONLY, 24), \
+            gen_sub_op(KernelMetaType.KERNEL_TYPE_AIV_ONLY, 30)]
+        candidates = gen_mix_kernel_type_candidates(24, 30)
+        kernel_type, block_dim, lines = select_kernel_type_and_block_dim(cost_model, candidates, sub_ops, 48, 96)
+        assert (kernel_type, block_dim) == (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, 30)
+        assert len(lines) == 3
+        kernel_type, block_dim, lines = select_kernel_type_and_block_dim(cost_model, candidates, sub_ops, 24, 48)
+        assert (kernel_type, block_dim) == (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, 24)
+        assert "exceeds cores of soc" in lines[0]
+
+    @staticmethod
+    def test_select_by_estimated_duration():
+        cost_model = CoreOverheadCostModel()
+        candidates = gen_mix_kernel_type_candidates(24, 30)
+        sub_ops = [gen_sub_op(KernelMetaType.KERNEL_TYPE_AIC_ONLY, 24, 10), \
+            gen_sub_op(KernelMetaType.KERNEL_TYPE_AIV_ONLY, 30, 10)]
+        kernel_type, block_dim, _ = select_kernel_type_and_block_dim(cost_model, candidates, sub_ops, 48, 96)
+        assert (kernel_type, block_dim) == (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1, 30)
+        # a long aiv op is better off with 24 aic cores polling in its complement branch than 30
+        sub_ops[0].estimated_duration = 1
+        sub_ops[1].estimated_duration = 100
+        kernel_type, block_dim, _ = select_kernel_type_and_block_dim(cost_model, candidates, sub_ops, 48, 96)
+        assert (kernel_type, block_dim) == (KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2, 24)
+
+    @staticmethod
+    def test_get_cost_model():
+        assert get_cost_model({}) is None
+        assert isinstance(get_cost_model({"cost-model": True}), CoreOverheadCostModel)
+
+
+if __name__ == "__main__":
+    pytest.main()
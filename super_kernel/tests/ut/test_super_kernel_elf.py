@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel elf reader."""
+
+import os
+import sys
+import pytest
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from utils import build_elf64, write_file
+from superkernel.super_kernel_elf import *
+
+
+class TestSuperKernelElf:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"--------------TearDown-------------")
+
+    @staticmethod
+    def test_get_section_sizes(tmp_dir):
+        obj_path = write_file(os.path.join(tmp_dir, "elf_sections.o"), \
+            build_elf64([(".text", b"\x00" * 0x120), (".data", b"\x01" * 8)]))
+        assert get_section_sizes(obj_path) == {".text": 0x120, ".data": 8, ".shstrtab": 23}
+        assert get_text_section_size(obj_path) == 0x120
+
+    @staticmethod
+    def test_get_text_section_size_of_function_sections(tmp_dir):
+        obj_path = write_file(os.path.join(tmp_dir, "elf_function_sections.o"), \
+            build_elf64([(".data", b"\x01" * 8), (".text.add_mix_aiv", b"\x00" * 0x40), (".text", b"")]))
+        # the first section containing .text, the same as llvm-objdump -h
+        assert get_text_section_size(obj_path) == 0x40
+
+    @staticmethod
+    def test_get_text_section_size_without_text(tmp_dir):
+        obj_path = write_file(os.path.join(tmp_dir, "elf_without_text.o"), build_elf64([(".data", b"\x01" * 8)]))
+        assert get_text_section_size(obj_path) is None
+
+    @staticmethod
+    def test_read_invalid_elf(tmp_dir):
+        with pytest.raises(ElfFormatError):
+            get_text_section_size(write_file(os.path.join(tmp_dir, "empty.o"), b""))
+        with pytest.raises(ElfFormatError):
+            get_text_section_size(write_file(os.path.join(tmp_dir, "not_elf.o"), b"!<arch>\n" + b"\x00" * 64))
+        elf_content = bytearray(build_elf64([(".text", b"\x00" * 4)]))
+        elf_content[4] = 1
+        with pytest.raises(ElfFormatError):
+            get_text_section_size(write_file(os.path.join(tmp_dir, "elf32.o"), bytes(elf_content)))
+        with pytest.raises(ElfFormatError):
+            get_text_section_size(write_file(os.path.join(tmp_dir, "truncated.o"), \
+                build_elf64([(".text", b"\x00" * 4)])[:80]))
+
+    @staticmethod
+    def test_clone_with_renamed_symbols(tmp_dir):
+        obj_path = write_file(os.path.join(tmp_dir, "elf_symbols.o"), build_elf64([(".text", b"\x00" * 0x40)], \
+            ["add_mix_aiv", "add_mix_aiv_1", "helper"]))
+        clones = [(os.path.join(tmp_dir, f"elf_symbols_split{i}.o"), {"add_mix_aiv": f"add_mix_aiv_split{i}"}) \
+            for i in range(1, 4)]
+        clone_with_renamed_symbols(obj_path, clones)
+        for i in range(1, 4):
+            clone_path = os.path.join(tmp_dir, f"elf_symbols_split{i}.o")
+            assert get_symbol_names(clone_path) == [f"add_mix_aiv_split{i}", "add_mix_aiv_1", "helper"]
+            # section names share no offsets with renamed symbols
+            assert get_section_sizes(clone_path).keys() == get_section_sizes(obj_path).keys()
+            assert get_text_section_size(clone_path) == 0x40
+        assert get_symbol_names(obj_path) == ["add_mix_aiv", "add_mix_aiv_1", "helper"]
+
+    @staticmethod
+    def test_clone_without_renamed_symbols(tmp_dir):
+        obj_path = write_file(os.path.join(tmp_dir, "elf_no_rename.o"), build_elf64([(".text", b"\x00" * 4)], \
+            ["add_mix_aic"]))
+        clone_path = os.path.join(tmp_dir, "elf_no_rename_split1.o")
+        clone_with_renamed_symbols(obj_path, [(clone_path, {"mul_mix_aic": "mul_mix_aic_split1"})])
+        with open(obj_path, 'rb') as src_fd, open(clone_path, 'rb') as dst_fd:
+            assert src_fd.read() == dst_fd.read()
+
+
+if __name__ == "__main__":
+    pytest.main()
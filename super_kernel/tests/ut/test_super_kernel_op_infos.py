@@ -17,8 +17,10 @@ import sys
 import pytest
 from unittest import mock
 import importlib
-from utils import compare_files
+from utils import compare_files, build_elf64
 from superkernel.super_kernel_op_infos import *
+from superkernel.super_kernel_elf import get_symbol_names
+from superkernel.super_kernel_context import SuperKernelCompileContext
 
 THIS_FILE_NAME = __file__
 FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
@@ -119,7 +121,7 @@ class TestSuperKernelOpInfos:
         rename_file = os.path.join(tmp_dir_str, "rename.txt")
 
         with mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=tmp_dir_str):
-            with mock.patch('subprocess.run'):
+            with mock.patch('subprocess.run'), mock.patch('os.replace') as mock_replace:
                 with mock.patch('os.path.exists') as mock_exists:
                     filename = os.path.basename(orign_bin_path) 
                     kernel_meta_dir = CommonUtility.get_kernel_meta_dir() 
@@ -130,6 +132,9 @@ class TestSuperKernelOpInfos:
                         orign_bin_path, rename_file, 1, super_operator.compile_log_path
                     )
                     assert new_bin_path_exist_mock == new_bin_path
+                    # the clone is written aside and renamed, concurrent splits of one binary never share a file
+                    work_bin_path, published_path = mock_replace.call_args[0]
+                    assert published_path == new_bin_path and work_bin_path != new_bin_path
 
             with mock.patch('subprocess.run', side_effect=subprocess.CalledProcessError(1, "test_command")):
                 with mock.patch.object(CommonUtility, 'ascendc_raise_python_err') as mock_raise:
@@ -177,6 +182,46 @@ class TestSuperKernelOpInfos:
             assert super_operator.cub_op_list == [sub_op1]
             assert super_operator.vec_op_list == [sub_op2]
 
+    @staticmethod
+    def test_split_op_by_kernel_type_of_multi_stream():
+        kernel_info = {"op_list": []}
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add"
+        }
+
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            super_operator = SuperOperatorInfos(kernel_info, "test_split_by_type_of_multi_stream")
+            sub_op1 = SubOperatorInfos(0, info_dict, 0, {})
+            sub_op1.kernel_type = KernelMetaType.KERNEL_TYPE_AIC_ONLY
+            sub_op1.recv_event_list = [100]
+            sub_op2 = SubOperatorInfos(1, info_dict, 1, {})
+            sub_op2.kernel_type = KernelMetaType.KERNEL_TYPE_AIV_ONLY
+            sub_op3 = SubOperatorInfos(2, info_dict, 2, {})
+            sub_op3.kernel_type = KernelMetaType.KERNEL_TYPE_AIC_ONLY
+            sub_op3.send_event_list = [100]
+            sub_op4 = SubOperatorInfos(3, info_dict, 0, {})
+            sub_op4.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
+            super_operator.info_base = [sub_op1, sub_op2, sub_op3, sub_op4]
+
+            # sub_op1 waits for event of sub_op3, sub_op4 follows sub_op1 in stream 0
+            assert super_operator.gen_schedule_order() == [sub_op2, sub_op3, sub_op1, sub_op4]
+            super_operator.split_op_by_kernel_type()
+            assert super_operator.cub_op_list == [sub_op3, sub_op1, sub_op4]
+            assert super_operator.vec_op_list == [sub_op2, sub_op4]
+            # event 100 stays inside the super kernel although its receiver is listed first
+            super_operator.find_all_inner_event_id_set()
+            assert super_operator.inner_event_id_set == {100}
+            sub_op1.gen_wait_from_outside(super_operator.inner_event_id_set, True)
+            assert sub_op1.wait_block == ''
+
+            sub_op3.recv_event_list = [101]
+            sub_op4.send_event_list = [101]
+            with mock.patch.object(CommonUtility, 'ascendc_raise_python_err') as mock_raise:
+                super_operator.gen_schedule_order()
+                mock_raise.assert_called()
+
     @staticmethod
     def test_get_task_type():
         kernel_info = {"op_list": []}
@@ -360,118 +405,6 @@ class TestSuperKernelOpInfos:
             assert op1.notify_block['aiv'] == 'aiv_tmp_notify'
 
 
-    @staticmethod
-    def test_remove_info_by_name():
-        kernel_info = {"op_list": []}
-        info_dict = {
-            "bin_path": "",
-            "json_path": "",
-            "kernel_name": "add"
-        }
-
-        with mock.patch("json.load", return_value=sub_op_add_json):
-            super_operator = SuperOperatorInfos(kernel_info, "test_remove_info_by_name")
-
-            op1 = SubOperatorInfos(0, info_dict, 0, {})
-            op1.kernel_name_for_multi_stream = "op1"
-            op1.send_info = {"op1": "cub:vec", "op2": "cub:vec"}
-
-            op2 = SubOperatorInfos(1, info_dict, 0, {})
-            op2.recv_info = {"op2": "cub:vec"}
-
-            super_operator.info_base = [op1, op2]
-
-            super_operator.remove_info_by_name("op1", "op2", True, "")
-            assert "op2" not in op1.recv_info
-
-            super_operator.remove_info_by_name("op1", "op2", False, "")
-            assert "op2" not in op1.send_info
-
-            super_operator.remove_info_by_name("op1", "op2", True, "new_content")
-            assert op1.recv_info.get("op2") == "new_content"
-
-            super_operator.remove_info_by_name("op1", "op2", False, "new_content")
-            assert op1.send_info.get("op2") == "new_content"
-
-    @staticmethod
-    def test_get_remain_events():
-        kernel_info = {"op_list": []}
-
-        with mock.patch("json.load", return_value=sub_op_add_json):
-            super_operator = SuperOperatorInfos(kernel_info, "test_get_remain_events")
-
-            origin_events = "cub:vec;vec:cub;cub:cub"
-            delete_event = "vec:cub"
-            result = super_operator.get_remain_events(origin_events, delete_event)
-            assert result == "cub:vec;cub:cub"
-
-    @staticmethod
-    def test_get_idx():
-        kernel_info = {"op_list": []}
-        info_dict = {
-            "bin_path": "",
-            "json_path": "",
-            "kernel_name": "add"
-        }
-
-        with mock.patch("json.load", return_value=sub_op_add_json):
-            super_operator = SuperOperatorInfos(kernel_info, "test_get_idx")
-
-            op1 = SubOperatorInfos(0, info_dict, 0, {})
-            op1.kernel_name_for_multi_stream = "op1"
-
-            op2 = SubOperatorInfos(1, info_dict, 0, {})
-            op2.kernel_name_for_multi_stream = "op2"
-
-            super_operator.vec_op_list = [op1]
-            super_operator.cub_op_list = [op2]
-
-            idx = super_operator.get_idx("op1", True)
-            assert idx == 0
-
-            idx = super_operator.get_idx("op2", False)
-            assert idx == 0
-
-    @staticmethod
-    def test_judge_remove():
-        kernel_info = {"op_list": []}
-        info_dict = {
-            "bin_path": "",
-            "json_path": "",
-            "kernel_name": "add"
-        }
-
-        with mock.patch("json.load", return_value=sub_op_add_json):
-            super_operator = SuperOperatorInfos(kernel_info, "test_judge_remove")
-
-            op1 = SubOperatorInfos(0, info_dict, 0, {})
-            op1.kernel_name_for_multi_stream = "op1"
-            op1.recv_info = {"op2": "cub:vec"}
-            op2 = SubOperatorInfos(1, info_dict, 0, {})
-            op2.kernel_name_for_multi_stream = "op2"
-            super_operator.cub_op_list = [op1, op2]
-            super_operator.vec_op_list = [op1, op2]
-            result = super_operator.judge_remove("op1", "op2", True)
-            assert result == True
-
-            op1.recv_info = {"op1": "cub:vec"}
-            result = super_operator.judge_remove("op1", "op2", True)
-            assert result == False
-
-            op1 = SubOperatorInfos(0, info_dict, 0, {})
-            op1.kernel_name_for_multi_stream = "op1"
-            op1.recv_info = {"op2": "vec:cub"}
-            op2 = SubOperatorInfos(1, info_dict, 0, {})
-            op2.kernel_name_for_multi_stream = "op2"
-            super_operator.cub_op_list = [op1, op2]
-            super_operator.vec_op_list = [op1, op2]
-            result = super_operator.judge_remove("op1", "op2", False)
-            assert result == True
-
-            op1.recv_info = {"op1": "vec:cub"}
-            result = super_operator.judge_remove("op1", "op2", False)
-            assert result == False
-
     @staticmethod
     def test_remove_crossed_line_sync():
         kernel_info = {"op_list": []}
@@ -746,7 +679,7 @@ recv_info: {'op1': 'cub:vec'}\
         with mock.patch("json.load", return_value=sub_op_add_json):
             with mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=tmp_dir):
                 with mock.patch.object(CommonUtility, 'get_distinct_filename_tag', return_value=distinct_tag):
-                    with mock.patch("superkernel.super_kernel_op_infos.get_op_debug_config" , \
+                    with mock.patch("superkernel.super_kernel_context.get_op_debug_config" , \
                                     return_value="dump_cce"):
                         super_operator = SuperOperatorInfos(kernel_info, "test_creat_compile_log")
                         super_operator.creat_compile_log()
@@ -773,6 +706,30 @@ recv_info: {'op1': 'cub:vec'}\
             result = super_operator.sub_op_connect_set(op1, op2)
             assert result == {101}
 
+    @staticmethod
+    def test_sub_op_event_index():
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add"
+        }
+
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            op1 = SubOperatorInfos(0, info_dict, 0, {})
+            op1.send_event_list = [100, 101]
+            op2 = SubOperatorInfos(1, info_dict, 1, {})
+            op2.recv_event_list = [101, 102]
+            op3 = SubOperatorInfos(2, info_dict, 2, {})
+            op3.send_event_list = [102]
+            op3.recv_event_list = [100]
+
+            event_index = SubOpEventIndex([op1, op2, op3])
+            assert event_index.senders == {100: [0], 101: [0], 102: [2]}
+            assert event_index.receivers == {101: [1], 102: [1], 100: [2]}
+            assert event_index.connect_set(0, op2) == {101}
+            assert event_index.connect_set(0, op3) == {100}
+            assert event_index.connect_set(1, op3) == set()
+
     @staticmethod
     def test_find_all_inner_event_id_set():
         kernel_info = {"op_list": []}
@@ -800,6 +757,11 @@ recv_info: {'op1': 'cub:vec'}\
             with mock.patch.object(CommonUtility, 'ascendc_raise_python_err') as mock_raise:
                 super_operator.find_all_inner_event_id_set()
                 mock_raise.assert_called()
+
+            super_operator.info_base = [op2, op1]
+            with mock.patch.object(CommonUtility, 'ascendc_raise_python_err') as mock_raise:
+                super_operator.find_all_inner_event_id_set()
+                mock_raise.assert_called()
                 
 
     @staticmethod
@@ -867,6 +829,25 @@ recv_info: {'op1': 'cub:vec'}\
 
             super_operator.get_finale_type_and_block_dim(0b100000, 10, 20)
             assert super_operator.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2
+
+    @staticmethod
+    def test_get_finale_type_and_block_dim_by_cost_model():
+        kernel_info = {"op_list": [], "super_kernel_options": "cost-model=1"}
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            super_operator = SuperOperatorInfos(kernel_info, "test_get_finale_type_and_block_dim_by_cost_model")
+            super_operator.compile_context = SuperKernelCompileContext(soc_spec={"ai_core_cnt": 32, \
+                "vector_core_cnt": 64})
+            with mock.patch.object(CommonUtility, 'dump_compile_log') as mock_dump:
+                # 1:1 launches 60 cores against 72 of 1:2
+                super_operator.get_finale_type_and_block_dim(0b100001, 24, 30)
+                assert super_operator.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_1
+                assert super_operator.block_dim == 30
+                mock_dump.assert_called()
+
+                # 1:1 needs 48 aic cores, more than 32 of soc
+                super_operator.get_finale_type_and_block_dim(0b100001, 24, 48)
+                assert super_operator.kernel_type == KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2
+                assert super_operator.block_dim == 24
                 
     @staticmethod
     def test_get_summary_type_and_options(tmp_dir):
@@ -943,7 +924,7 @@ recv_info: {'op1': 'cub:vec'}\
 
         
         with mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=tmp_dir_str):
-            with mock.patch('subprocess.run'):
+            with mock.patch('subprocess.run'), mock.patch('os.replace'):
                 with mock.patch('os.path.exists'):
                     with mock.patch.object(CommonUtility, 'dump_compile_log') as mock_dump_compile_log:
                         new_bin_path_goden = os.path.join(tmp_dir_str, "original_split1.o")
@@ -1040,6 +1021,16 @@ recv_info: {'op1': 'cub:vec'}\
             super_operator.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2
             super_operator.calc_workspace_size()
             assert super_operator.workspace_size == 1024
+
+            # two tables of 4 ops, then epoch of the only aic core
+            super_operator.sync_all_epoch = True
+            super_operator.kernel_type = KernelMetaType.KERNEL_TYPE_AIC_ONLY
+            super_operator.calc_workspace_size()
+            assert super_operator.workspace_size == 2 * 512 + 64
+
+            super_operator.kernel_type = KernelMetaType.KERNEL_TYPE_MIX_AIC_1_2
+            super_operator.calc_workspace_size()
+            assert super_operator.workspace_size == 2 * 512 + 3 * 64
             
     @staticmethod
     def test_add_define_options():
@@ -1132,7 +1123,7 @@ recv_info: {'op1': 'cub:vec'}\
                         tmp_dir_str = str(tmp_dir)
                         sub_operator.dynamic_bin = os.path.join(tmp_dir_str, "original.o")
                         with mock.patch('os.environ.get', return_value=None):
-                            with mock.patch("superkernel.super_kernel_op_infos.get_op_debug_config", \
+                            with mock.patch("superkernel.super_kernel_context.get_op_debug_config", \
                                             return_value="dump_cce"):
                                 super_operator.gen_compile_info()
                                 assert sub_operator.dynamic_bin \
@@ -1142,6 +1133,82 @@ recv_info: {'op1': 'cub:vec'}\
                                 assert ['cube_kernel_name_split1'] \
                                     == super_operator.compile_info["sub_operator"][1]['sub_kernel_names']
 
+    @staticmethod
+    def test_map_sub_operators_in_pool():
+        import time
+        super_operator = SuperOperatorInfos({"op_list": []}, "test_map_sub_operators_in_pool", jobs=4)
+        assert super_operator.jobs == 4
+        sub_ops = list(range(8))
+
+        def slow_square(sub_op):
+            time.sleep(0.01 * (8 - sub_op))
+            return sub_op * sub_op
+        assert super_operator.map_sub_operators(slow_square, sub_ops) == [sub_op * sub_op for sub_op in sub_ops]
+
+        def failed_on_odd(sub_op):
+            if sub_op % 2 == 1:
+                raise RuntimeError(f"sub op {sub_op} failed")
+            return sub_op
+        with pytest.raises(RuntimeError, match="sub op 1 failed"):
+            super_operator.map_sub_operators(failed_on_odd, sub_ops)
+
+        super_operator = SuperOperatorInfos({"op_list": []}, "test_map_sub_operators_in_pool", jobs=0)
+        assert super_operator.jobs >= 1
+
+    @staticmethod
+    def test_gen_compile_info_in_pool(tmp_dir):
+        kernel_info = {"op_list": []}
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add"
+        }
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            with mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=tmp_dir):
+                super_operator = SuperOperatorInfos(kernel_info, "test_gen_compile_info_in_pool", jobs=4)
+                super_operator.info_base = []
+                for index in range(4):
+                    sub_operator = SubOperatorInfos(index, info_dict, 0, {})
+                    sub_operator.dynamic_bin = None
+                    sub_operator.split_mode = 2
+                    sub_operator.split_mode_in_json = 2
+                    sub_operator.sub_kernel_names = [f"kernel{index}_mix_aic"]
+                    sub_operator.aic_bin = os.path.join("aic_bin_mock", f"op{index}.o")
+                    super_operator.info_base.append(sub_operator)
+                super_operator.gen_compile_info()
+                assert [info["aic_bin"] for info in super_operator.compile_info["sub_operator"]] == \
+                    [os.path.join("aic_bin_mock", name) for index in range(4) \
+                        for name in [f"op{index}.o", f"op{index}_split1.o"]]
+
+
+    @staticmethod
+    def test_split_o_clones_by_content(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "split_o_clones_by_content")
+        os.makedirs(kernel_meta_dir, exist_ok=True)
+        orign_bin_path = os.path.join(kernel_meta_dir, "op_mix_aic.o")
+        with open(orign_bin_path, 'wb') as fd:
+            fd.write(build_elf64([(".text", b"\x00" * 64)], ["op_mix_aic"]))
+        with mock.patch.object(CommonUtility, 'get_kernel_meta_dir', return_value=kernel_meta_dir):
+            super_operator = SuperOperatorInfos({"op_list": []}, "test_split_o_clones_by_content", \
+                content_naming=True)
+            split_objs = super_operator.split_o_clones_in_super_kernel(orign_bin_path, "op_mix_aic", 3)
+            content_tag = super_operator.gen_split_content_tag(orign_bin_path, "op_mix_aic")
+            assert split_objs == [(os.path.join(kernel_meta_dir, f"op_mix_aic{content_tag}_split{i}.o"), \
+                f"op_mix_aic_split{i}") for i in [1, 2]]
+            assert all(new_kernel_name in get_symbol_names(split_o_path) \
+                for split_o_path, new_kernel_name in split_objs)
+            assert not [name for name in os.listdir(kernel_meta_dir) if name.endswith(".tmp")]
+
+            # clones named by content are shared, a second compile does not write them again
+            with mock.patch("superkernel.super_kernel_op_infos.clone_split_objs") as mock_clone:
+                assert super_operator.split_o_clones_in_super_kernel(orign_bin_path, "op_mix_aic", 3) == split_objs
+                mock_clone.assert_not_called()
+
+            with open(orign_bin_path, 'wb') as fd:
+                fd.write(build_elf64([(".text", b"\x01" * 64)], ["op_mix_aic"]))
+            assert super_operator.gen_split_content_tag(orign_bin_path, "op_mix_aic") != content_tag
+            assert super_operator.gen_split_content_tag(orign_bin_path, "op_mix_aic", object()) == ""
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel options."""
+
+import os
+import sys
+import pytest
+from unittest import mock
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_options import *
+
+
+class TestSuperKernelOptions:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_parse_options():
+        with mock.patch("superkernel.super_kernel_options.parse_super_kernel_options", \
+                side_effect=lambda option_str: {"option_str": option_str}):
+            op_options = parse_options("split-mode=1:remove-redundant-sync=1:early-start=0")
+            assert op_options == {"option_str": "split-mode=1:early-start=0", "remove-redundant-sync": True}
+
+            op_options = parse_options("compile-options=-g:")
+            assert op_options == {"option_str": "compile-options=-g:"}
+            assert get_extension_option(op_options, "remove-redundant-sync") is False
+
+            op_options = parse_options("remove-redundant-sync=0")
+            assert get_extension_option(op_options, "remove-redundant-sync") is False
+
+            with pytest.raises(Exception):
+                parse_options("remove-redundant-sync=2")
+
+            op_options = parse_options("tiling-key-table=1")
+            assert get_extension_option(op_options, "tiling-key-table") is True
+
+            assert get_extension_option(parse_options(""), "preload-lookahead") == 0
+            op_options = parse_options("preload-lookahead=4")
+            assert get_extension_option(op_options, "preload-lookahead") == 4
+
+            with pytest.raises(Exception):
+                parse_options("preload-lookahead=-1")
+
+            op_options = parse_options("preload-data-lookahead=2")
+            assert get_extension_option(op_options, "preload-data-lookahead") == 2
+            assert get_extension_option(op_options, "cost-model") is False
+            assert get_extension_option(op_options, "sync-all-epoch") is False
+            assert get_extension_option(parse_options("sync-all-epoch=1"), "sync-all-epoch") is True
+
+
+if __name__ == "__main__":
+    pytest.main()
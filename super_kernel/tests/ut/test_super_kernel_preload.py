@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel lookahead preload planner."""
+
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+
+from asc_op_compile_base.asc_op_compiler.super_kernel_constants import SubOperatorType
+from superkernel.super_kernel_preload import *
+
+
+def gen_sub_op(aic_text_len=0, aiv_text_len=0, sub_op_task_type=SubOperatorType.STATIC_OP):
+    preload_call_blocks = {}
+    if aic_text_len > 0:
+        preload_call_blocks['aic'] = "aic_preload"
+    if aiv_text_len > 0:
+        preload_call_blocks['aiv'] = "aiv_preload"
+    return SimpleNamespace(aic_text_len=aic_text_len, aiv_text_len=aiv_text_len, \
+        preload_call_blocks=preload_call_blocks, sub_op_task_type=sub_op_task_type)
+
+
+class TestSuperKernelPreload:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_get_icache_units():
+        assert get_icache_units(0) == 0
+        assert get_icache_units(1) == 1
+        assert get_icache_units(2048) == 1
+        assert get_icache_units(2049) == 2
+
+    @staticmethod
+    def test_plan_icache_preload_of_small_ops():
+        assert plan_icache_preload([1, 1, 1, 1, 1, 1], 3, 8) == [[0, 1, 2, 3], [4], [5], [], [], []]
+        assert plan_icache_preload([1, 1, 1], 0, 8) == [[0], [1], [2]]
+
+    @staticmethod
+    def test_plan_icache_preload_within_capacity():
+        assert plan_icache_preload([4, 4, 4, 4], 4, 8) == [[0, 1], [2], [3], []]
+        assert plan_icache_preload([8, 8, 1], 2, 8) == [[0], [1], [2]]
+
+    @staticmethod
+    def test_plan_icache_preload_skips_ops_without_code():
+        assert plan_icache_preload([2, 0, 2, 2], 8, 16) == [[0, 2, 3], [], [], []]
+
+    @staticmethod
+    def test_plan_icache_preload_stops_at_dynamic_op():
+        assert plan_icache_preload([1, 1, None, 1, 1], 8, 8) == [[0, 1], [], [], [3, 4], []]
+
+    @staticmethod
+    def test_gen_icache_preload_plan():
+        sub_op1 = gen_sub_op(aic_text_len=2048, aiv_text_len=4096)
+        sub_op2 = gen_sub_op(aiv_text_len=2048 * 6)
+        sub_op3 = gen_sub_op(aic_text_len=2048)
+        sub_ops = [sub_op1, sub_op2, sub_op3]
+        plan = gen_icache_preload_plan(sub_ops, 'aic', 2)
+        assert plan == {id(sub_op1): [sub_op1, sub_op3], id(sub_op2): [], id(sub_op3): []}
+        plan = gen_icache_preload_plan(sub_ops, 'aiv', 2)
+        assert plan == {id(sub_op1): [sub_op1, sub_op2], id(sub_op2): [], id(sub_op3): []}
+
+    @staticmethod
+    def test_get_param_cache_lines():
+        assert get_param_cache_lines(1, 5) == [0]
+        assert get_param_cache_lines(6, 5) == [0, 1]
+        assert get_param_cache_lines(8, 8) == [1]
+        assert get_param_cache_lines(8, 0) == []
+
+    @staticmethod
+    def test_plan_data_cache_preload():
+        op_lines = [[0], [0, 1], [1, 2], [2]]
+        assert plan_data_cache_preload(op_lines, 0) == [[0], [0, 1], [1, 2], [2]]
+        assert plan_data_cache_preload(op_lines, 1) == [[0, 1], [2], [], []]
+        assert plan_data_cache_preload(op_lines, 8) == [[0, 1, 2], [], [], []]
+
+    @staticmethod
+    def test_gen_data_cache_preload_plan():
+        sub_op1 = SimpleNamespace(param_offset=1, kernel_params=["x", "y"], extra_kernel_params=["lock"])
+        sub_op2 = SimpleNamespace(param_offset=4, kernel_params=["x", "y", "z", "w", "v"], extra_kernel_params=[])
+        plan = gen_data_cache_preload_plan([sub_op1, sub_op2], 1)
+        assert plan == {id(sub_op1): [0, 1], id(sub_op2): []}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -163,5 +163,74 @@ if ASCEND_IS_AIV {
                 assert "NotifyFunc<false>" in sub_op.notify_block
 
 
+    @staticmethod
+    def test_gen_tiling_key_index():
+        index_code, index_of_key = gen_tiling_key_index([10, 11, 13, 15])
+        assert index_code == "tilingKey - 10"
+        assert index_of_key == {10: 0, 11: 1, 13: 3, 15: 5}
+
+        index_code, index_of_key = gen_tiling_key_index([1000, 2001, 3002, 4003])
+        assert index_code == "tilingKey % 4"
+        assert sorted(index_of_key.values()) == [0, 1, 2, 3]
+
+        # multiples of 720720 share residue of every modulus from 4 to 16
+        assert gen_tiling_key_index([0, 720720, 1441440, 2162160]) is None
+
+    @staticmethod
+    def test_gen_tiling_key_table_block():
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add"
+        }
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            sub_op = SubOperatorInfos(0, info_dict, 0, {"tiling-key-table": True})
+            assert sub_op.tiling_key_table is True
+            input_blocks = [[f"case_{key}", str(key)] for key in [1, 2, 3, 5]]
+            block_str = sub_op.gen_tiling_key_table_block(input_blocks)
+            assert block_str.startswith("uint64_t tilingKey = *tilingKeyAddr;\nswitch (tilingKey - 1) {\n")
+            assert "case 4:\n    if (tilingKey == 5) {\n        case_5\n        return;\n    }\n    break;\n" \
+                in block_str
+            # keys out of table fall back to the last leaf of binary search, other case blocks are emitted once
+            assert block_str.endswith(sub_op.gen_binary_search_block(input_blocks[2:]))
+            assert block_str.count("case_1") == 1
+            input_blocks = [[f"case_{key}", str(key)] for key in [1, 2, 3, 5, 6]]
+            assert sub_op.gen_tiling_key_table_block(input_blocks).endswith( \
+                sub_op.gen_binary_search_block(input_blocks[3:]))
+            assert sub_op.gen_tiling_key_table_block(input_blocks[:3]) is None
+
+    @staticmethod
+    def test_gen_weighted_search_block():
+        info_dict = {
+            "bin_path": "",
+            "json_path": "",
+            "kernel_name": "add",
+            "tiling_key_profile": {"3": 100, "1": 1}
+        }
+        with mock.patch("json.load", return_value=sub_op_add_json):
+            sub_op = SubOperatorInfos(0, info_dict, 0, {})
+            assert sub_op.tiling_key_profile == {3: 100, 1: 1}
+            input_blocks = [[f"case_{key}", str(key)] for key in [1, 2, 3, 4]]
+
+            # hot key is tested first
+            block_str = sub_op.gen_weighted_search_block(input_blocks, [1, 0, 100, 0])
+            assert block_str.startswith("if (*tilingKeyAddr == 3) {\n    case_3\n} else {\n")
+
+            # no hot key, split where call counts are balanced
+            block_str = sub_op.gen_weighted_search_block(input_blocks, [30, 30, 20, 20])
+            assert block_str.startswith("if (*tilingKeyAddr < 3) {\n")
+            block_str = sub_op.gen_weighted_search_block(input_blocks, [40, 10, 10, 40])
+            assert block_str.startswith("if (*tilingKeyAddr < 3) {\n")
+            block_str = sub_op.gen_weighted_search_block(input_blocks, [45, 45, 5, 5])
+            assert block_str.startswith("if (*tilingKeyAddr < 2) {\n")
+
+            # two keys, hotter one is compared
+            block_str = sub_op.gen_weighted_search_block(input_blocks[:2], [1, 5])
+            assert block_str.startswith("if (*tilingKeyAddr == 2) {\n")
+
+            # no call count, balanced tree
+            assert sub_op.gen_weighted_search_block(input_blocks, [0, 0, 0, 0]) == \
+                sub_op.gen_binary_search_block(input_blocks)
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel double stream sync graph."""
+
+import os
+import sys
+import pytest
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_sync_graph import *
+from utils import gen_op, add_sync
+
+
+class TestSuperKernelSyncGraph:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_encode_decode_sync_flags():
+        assert encode_sync_flags("cub:vec") == SYNC_CUB_VEC
+        assert encode_sync_flags("cub:vec;vec:cub") == SYNC_CUB_VEC | SYNC_VEC_CUB
+        assert decode_sync_flags(SYNC_CUB_VEC | SYNC_VEC_CUB) == "cub:vec;vec:cub"
+        assert decode_sync_flags(0) == ""
+
+    @staticmethod
+    def test_get_idx():
+        op1, op2 = gen_op("op1"), gen_op("op2")
+        graph = SyncGraph([op1, op2], [op1], [op2])
+        assert graph.get_cub_idx("op1") == 0
+        assert graph.get_vec_idx("op2") == 0
+        assert graph.get_vec_idx("not_exist") == 0
+
+    @staticmethod
+    def test_remove_crossed_line_sync():
+        cub_op1, vec_op2, cub_op3, vec_op4 = gen_op("op1"), gen_op("op2"), gen_op("op3"), gen_op("op4")
+        add_sync(cub_op1, vec_op4, "cub:vec")
+        add_sync(cub_op3, vec_op2, "cub:vec")
+        graph = SyncGraph([cub_op1, vec_op2, cub_op3, vec_op4], [cub_op1, cub_op3], [vec_op2, vec_op4])
+        graph.remove_crossed_line_sync()
+        assert cub_op1.send_info == {}
+        assert vec_op4.recv_info == {}
+        assert cub_op3.send_info == {"op2": "cub:vec"}
+        assert graph.get_send(cub_op1) == {}
+
+    @staticmethod
+    def test_remove_keeps_other_direction():
+        mix_op1, mix_op2, vec_op3 = gen_op("op1"), gen_op("op2"), gen_op("op3")
+        add_sync(mix_op1, vec_op3, "cub:vec")
+        add_sync(mix_op1, mix_op2, "cub:vec;vec:cub")
+        graph = SyncGraph([mix_op1, mix_op2, vec_op3], [mix_op1, mix_op2], [mix_op1, mix_op2, vec_op3])
+        graph.remove_multi_send_info()
+        assert mix_op1.send_info == {"op2": "cub:vec;vec:cub"}
+        assert vec_op3.recv_info == {}
+
+    @staticmethod
+    def test_remove_multi_recv_info():
+        cub_op1, cub_op2, vec_op3 = gen_op("op1"), gen_op("op2"), gen_op("op3")
+        add_sync(cub_op1, vec_op3, "cub:vec")
+        add_sync(cub_op2, vec_op3, "cub:vec")
+        graph = SyncGraph([cub_op1, cub_op2, vec_op3], [cub_op1, cub_op2], [vec_op3])
+        graph.remove_multi_recv_info()
+        assert cub_op1.send_info == {}
+        assert vec_op3.recv_info == {"op2": "cub:vec"}
+
+    @staticmethod
+    def test_remove_transitive_sync():
+        # cub_op1 -> vec_op2 -> cub_op3 already orders cub_op1 before cub_op3
+        cub_op1, vec_op2, cub_op3 = gen_op("op1"), gen_op("op2"), gen_op("op3")
+        add_sync(cub_op1, vec_op2, "cub:vec")
+        add_sync(vec_op2, cub_op3, "vec:cub")
+        add_sync(cub_op1, cub_op3, "cub:cub")
+        graph = SyncGraph([cub_op1, vec_op2, cub_op3], [cub_op1, cub_op3], [vec_op2])
+        assert graph.remove_transitive_sync() == 1
+        assert cub_op1.send_info == {"op2": "cub:vec"}
+        assert cub_op3.recv_info == {"op2": "vec:cub"}
+
+    @staticmethod
+    def test_remove_transitive_sync_keeps_program_order_only_path():
+        # program order alone does not order cub_op1 before cub_op3 on other cub cores
+        cub_op1, cub_op2, cub_op3 = gen_op("op1"), gen_op("op2"), gen_op("op3")
+        add_sync(cub_op1, cub_op3, "cub:cub")
+        graph = SyncGraph([cub_op1, cub_op2, cub_op3], [cub_op1, cub_op2, cub_op3], [])
+        assert graph.remove_transitive_sync() == 0
+        assert cub_op1.send_info == {"op3": "cub:cub"}
+
+        add_sync(cub_op2, cub_op3, "cub:cub")
+        graph = SyncGraph([cub_op1, cub_op2, cub_op3], [cub_op1, cub_op2, cub_op3], [])
+        assert graph.remove_transitive_sync() == 1
+        assert cub_op1.send_info == {}
+        assert cub_op3.recv_info == {"op2": "cub:cub"}
+
+    @staticmethod
+    def test_remove_transitive_sync_of_mix_op():
+        # vec part of mix_op1 reaches vec_op3 through the cub part of mix_op2
+        mix_op1, mix_op2, vec_op3 = gen_op("op1"), gen_op("op2"), gen_op("op3")
+        add_sync(mix_op1, mix_op2, "cub:vec;vec:cub")
+        add_sync(mix_op2, vec_op3, "cub:vec")
+        add_sync(mix_op1, vec_op3, "vec:vec")
+        graph = SyncGraph([mix_op1, mix_op2, vec_op3], [mix_op1, mix_op2], [mix_op1, mix_op2, vec_op3])
+        assert graph.remove_transitive_sync() == 1
+        assert mix_op1.send_info == {"op2": "cub:vec;vec:cub"}
+        assert vec_op3.recv_info == {"op2": "cub:vec"}
+
+    @staticmethod
+    def test_remove_transitive_sync_against_program_order():
+        cub_op1, cub_op2 = gen_op("op1"), gen_op("op2")
+        add_sync(cub_op2, cub_op1, "cub:cub")
+        add_sync(cub_op1, cub_op2, "cub:cub")
+        graph = SyncGraph([cub_op1, cub_op2], [cub_op1, cub_op2], [])
+        assert graph.remove_transitive_sync() == 0
+        assert cub_op2.send_info == {"op1": "cub:cub"}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel option auto tuner."""
+
+import os
+import sys
+import pytest
+from unittest import mock
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_tuner import *
+from superkernel.super_kernel_context import SuperKernelCompileContext
+
+
+class MockRunner(TuneRunner):
+    """latency of variant is looked up by its options, missing combinations can not run"""
+    name = "mock_runner"
+
+    def __init__(self, latency_of_options):
+        self.latency_of_options = latency_of_options
+        self.measured = []
+
+    def measure(self, kernel_infos, kernel_name, kernel_meta_dir):
+        self.measured.append(kernel_name)
+        options = tuple(sorted(split_option_str(kernel_infos["super_kernel_options"])))
+        return self.latency_of_options.get(options)
+
+
+def fake_compile_many(kernel_infos_list, called_kernel_names, *args):
+    return [{"kernel_name": kernel_name, "status": "compiled", "error": None, "timings": {}} \
+        for kernel_name in called_kernel_names]
+
+
+def gen_kernel_infos(options="compile-options=-g"):
+    return {"op_list": [{"bin_path": "add.o", "json_path": "add.json"}], "super_kernel_options": options}
+
+
+class TestSuperKernelTuner:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_tune_runner_is_abstract():
+        with pytest.raises(TypeError):
+            TuneRunner()
+        assert MockRunner({}).measure({"super_kernel_options": ""}, "sk", "") is None
+
+    @staticmethod
+    def test_update_option_str():
+        assert split_option_str("split-mode=1:compile-options=-g:") == [("split-mode", "1"), \
+            ("compile-options", "-g")]
+        assert update_option_str("split-mode=1:compile-options=-g", {"split-mode": "4", "early-start": "0"}) == \
+            "split-mode=4:compile-options=-g:early-start=0"
+        assert remove_options("split-mode=1:compile-options=-g", ["split-mode"]) == "compile-options=-g"
+
+    @staticmethod
+    def test_gen_option_product():
+        assert gen_option_product({"early-start": ["0", "1"], "split-mode": ["1", "4"]}) == [ \
+            {"early-start": "0", "split-mode": "1"}, {"early-start": "0", "split-mode": "4"}, \
+            {"early-start": "1", "split-mode": "1"}, {"early-start": "1", "split-mode": "4"}]
+
+    @staticmethod
+    def test_gen_scope_signature():
+        tune_space = {"split-mode": ["1", "4"]}
+        with mock.patch("superkernel.super_kernel_tuner.gen_compile_cache_key", \
+                side_effect=lambda kernel_infos, impl_mode: kernel_infos["super_kernel_options"]):
+            signature = gen_scope_signature(gen_kernel_infos("split-mode=1:compile-options=-g"), tune_space)
+            assert signature == gen_scope_signature(gen_kernel_infos("split-mode=4:compile-options=-g"), tune_space)
+            assert signature != gen_scope_signature(gen_kernel_infos("split-mode=4"), tune_space)
+        with mock.patch("superkernel.super_kernel_tuner.gen_compile_cache_key", return_value=None):
+            assert gen_scope_signature(gen_kernel_infos(), tune_space) is None
+
+    @staticmethod
+    def test_tune_options_and_reuse(tmp_dir):
+        store_dir = os.path.join(tmp_dir, "tune_case", SUPER_KERNEL_TUNE_DIR_NAME)
+        tune_space = {"early-start": ["0", "1"], "split-mode": ["1", "4"]}
+        runner = MockRunner({
+            (("compile-options", "-g"), ("early-start", "0"), ("split-mode", "1")): 30.0,
+            (("compile-options", "-g"), ("early-start", "1"), ("split-mode", "4")): 10.0,
+            (("compile-options", "-g"), ("early-start", "1"), ("split-mode", "1")): 20.0,
+        })
+        compile_context = SuperKernelCompileContext(kernel_meta_dir=tmp_dir)
+        with mock.patch("superkernel.super_kernel_tuner.compile_many", side_effect=fake_compile_many), \
+                mock.patch("superkernel.super_kernel_tuner.gen_compile_cache_key", return_value="scope_key"):
+            result = tune_options(gen_kernel_infos(), runner, "sk", store_dir, tune_space=tune_space, \
+                compile_context=compile_context)
+            assert result["option_str"] == "compile-options=-g:early-start=1:split-mode=4"
+            assert result["latency"] == 10.0
+            assert result["reused"] is False
+            assert len(result["trials"]) == 4
+            assert len(runner.measured) == 4
+
+            result = tune_options(gen_kernel_infos(), runner, "sk", store_dir, tune_space=tune_space, \
+                compile_context=compile_context)
+            assert result["option_str"] == "compile-options=-g:early-start=1:split-mode=4"
+            assert result["reused"] is True
+            assert len(runner.measured) == 4
+
+    @staticmethod
+    def test_tune_options_one_option_at_a_time(tmp_dir):
+        store_dir = os.path.join(tmp_dir, "tune_search_case", SUPER_KERNEL_TUNE_DIR_NAME)
+        tune_space = {"early-start": ["0", "1"], "split-mode": ["1", "4"]}
+        runner = MockRunner({
+            (("compile-options", "-g"), ("early-start", "0")): 30.0,
+            (("compile-options", "-g"), ("early-start", "1")): 20.0,
+            (("compile-options", "-g"), ("early-start", "1"), ("split-mode", "4")): 10.0,
+        })
+        compile_context = SuperKernelCompileContext(kernel_meta_dir=tmp_dir)
+        with mock.patch("superkernel.super_kernel_tuner.compile_many", side_effect=fake_compile_many), \
+                mock.patch("superkernel.super_kernel_tuner.gen_compile_cache_key", return_value=None):
+            tuner = OptionTuner(runner, tune_space, max_variants=2, compile_context=compile_context)
+            result = tuner.tune(gen_kernel_infos(), "sk", store_dir)
+            assert result["option_str"] == "compile-options=-g:early-start=1:split-mode=4"
+            assert len(result["trials"]) == 4
+            assert not os.path.isdir(store_dir)
+
+
+if __name__ == "__main__":
+    pytest.main()
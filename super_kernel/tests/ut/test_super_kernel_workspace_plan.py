@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------
+
+"""Unit tests of super kernel workspace arena planner."""
+
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+THIS_FILE_NAME = __file__
+FILE_PATH = os.path.dirname(os.path.realpath(THIS_FILE_NAME))
+SUPER_KERNEL_PATH = os.path.join(FILE_PATH, "../../src")
+sys.path.append(SUPER_KERNEL_PATH)
+
+from superkernel.super_kernel_workspace_plan import *
+from utils import gen_op, add_sync
+
+
+def gen_super_operator(tmp_dir, sub_ops, early_start_mode=SuperKernelEarlyStartMode.EarlyStartDisable):
+    return SimpleNamespace(kernel_name="te_superkernel_1", info_base=sub_ops, enable_double_stream=False, \
+        early_start_mode=early_start_mode, compile_log_path=None, cub_op_list=[], vec_op_list=[], \
+        kernel_file=os.path.join(tmp_dir, "te_superkernel_1_kernel.cpp"))
+
+
+class TestSuperKernelWorkspacePlan:
+    @staticmethod
+    def setup_method():
+        print(f"---------------SetUp---------------")
+
+    @staticmethod
+    def teardown_method():
+        print(f"---------------TearDown---------------")
+
+    @staticmethod
+    def test_plan_workspace_arena():
+        assert plan_workspace_arena([1000, 512, 2048], set()) == (2048, [0, 0, 0])
+        assert plan_workspace_arena([1000, 512, 2048], {(0, 1), (1, 2)}) == (2560, [0, 2048, 0])
+        # a smaller buffer fills the gap below a placed conflicting buffer
+        assert plan_workspace_arena([512, 1024, 512], {(0, 1), (0, 2)}) == (1536, [1024, 0, 0])
+        assert plan_workspace_arena([512, 1024, 512], {(1, 2)}) == (1536, [0, 0, 1024])
+        assert plan_workspace_arena([0, 32], {(0, 1)}) == (512, [0, 0])
+        assert plan_workspace_arena([], set()) == (0, [])
+
+    @staticmethod
+    def test_gen_single_stream_overlaps():
+        assert gen_single_stream_overlaps(3, False) == set()
+        assert gen_single_stream_overlaps(3, True) == {(0, 1), (1, 2)}
+
+    @staticmethod
+    def test_gen_double_stream_overlaps():
+        cub_op1, vec_op2, cub_op3, vec_op4 = gen_op("op1"), gen_op("op2"), gen_op("op3"), gen_op("op4")
+        add_sync(cub_op1, vec_op2, "cub:vec")
+        add_sync(vec_op2, cub_op3, "vec:cub")
+        sub_ops = [cub_op1, vec_op2, cub_op3, vec_op4]
+        # op4 follows op1 through the sync received by op2, program order alone does not order it after op2
+        assert gen_double_stream_overlaps(sub_ops, [cub_op1, cub_op3], [vec_op2, vec_op4]) == {(1, 3), (2, 3)}
+
+        add_sync(cub_op3, vec_op4, "cub:vec")
+        assert gen_double_stream_overlaps(sub_ops, [cub_op1, cub_op3], [vec_op2, vec_op4]) == set()
+
+    @staticmethod
+    def test_gen_double_stream_overlaps_of_mix_op():
+        mix_op1, vec_op2 = gen_op("op1"), gen_op("op2")
+        add_sync(mix_op1, vec_op2, "vec:vec")
+        # cub part of mix_op1 is not ordered before vec_op2
+        assert gen_double_stream_overlaps([mix_op1, vec_op2], [mix_op1], [mix_op1, vec_op2]) == {(0, 1)}
+        add_sync(mix_op1, vec_op2, "cub:vec;vec:vec")
+        assert gen_double_stream_overlaps([mix_op1, vec_op2], [mix_op1], [mix_op1, vec_op2]) == set()
+
+    @staticmethod
+    def test_get_workspace_args():
+        sub_op = gen_op("op1", [1024], 5, ["x_1", "y_1", "workspace_1", "tiling_1"])
+        assert get_workspace_args(sub_op) == [(7, 1024)]
+        sub_op.workspace_sizes = [-1]
+        assert get_workspace_args(sub_op) is None
+        sub_op.workspace_sizes = [32, 32]
+        assert get_workspace_args(sub_op) is None
+        assert get_workspace_args(gen_op("op2", [], 1, ["x_2", "y_2"])) == []
+
+    @staticmethod
+    def test_get_workspace_args_of_cleared_workspace():
+        sub_op = gen_op("op1", [1024], 5, ["x_1", "workspace_1"], workspace_types=[0])
+        assert get_workspace_args(sub_op) == [(6, 1024)]
+        # workspace of type 1 is cleared before the op runs, another op must not leave it dirty
+        sub_op.workspace_types = [1]
+        assert get_workspace_args(sub_op) is None
+
+    @staticmethod
+    def test_gen_workspace_plan(tmp_dir):
+        sub_ops = [
+            gen_op("op0", [1024], 1, ["x_0", "y_0", "workspace_0"]),
+            gen_op("op1", [2048], 4, ["x_1", "workspace_1"]),
+            gen_op("op2", [-1], 6, ["x_2", "workspace_2", "tiling_2"]),
+            gen_op("op3", [512], 9, ["x_3", "workspace_3"]),
+            gen_op("op4", [4096], 11, ["x_4", "workspace_4"], workspace_types=[1]),
+        ]
+        super_operator = gen_super_operator(tmp_dir, sub_ops)
+        workspace_plan = gen_workspace_plan(super_operator)
+        assert workspace_plan["arena_size"] == 2048
+        assert [(workspace["arg_index"], workspace["offset"]) for workspace in workspace_plan["workspaces"]] == \
+            [(3, 0), (5, 0), (10, 0)]
+        assert workspace_plan["unplanned"] == ["op2", "op4"]
+
+        super_operator.early_start_mode = SuperKernelEarlyStartMode.EarlyStartEnableV2
+        workspace_plan = gen_workspace_plan(super_operator)
+        assert workspace_plan["arena_size"] == 3072
+        assert [(workspace["arg_index"], workspace["offset"]) for workspace in workspace_plan["workspaces"]] == \
+            [(3, 2048), (5, 0), (10, 0)]
+
+    @staticmethod
+    def test_write_load_and_patch_workspace_plan(tmp_dir):
+        kernel_meta_dir = os.path.join(tmp_dir, "workspace_plan")
+        os.makedirs(kernel_meta_dir, exist_ok=True)
+        assert load_workspace_plan(kernel_meta_dir, "te_superkernel_1") is None
+
+        sub_ops = [gen_op("op0", [1024], 1, ["x_0", "workspace_0"]), gen_op("op1", [512], 3, ["x_1", "workspace_1"])]
+        super_operator = gen_super_operator(kernel_meta_dir, sub_ops, SuperKernelEarlyStartMode.EarlyStartEnableV2)
+        write_workspace_plan(super_operator)
+        workspace_plan = load_workspace_plan(kernel_meta_dir, "te_superkernel_1")
+        assert workspace_plan["arena_size"] == 1536
+
+        args = [0xff00, 0x1000, None, 0x2000, None]
+        assert patch_workspace_args(workspace_plan, args, 0x100000) == [0xff00, 0x1000, 0x100000, 0x2000, 0x100400]
+        assert args[2] is None
+
+
+if __name__ == "__main__":
+    pytest.main()
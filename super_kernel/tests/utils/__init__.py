@@ -14,5 +14,8 @@
 """Utility helpers for system tests."""
 
 from .validators import validate_codegen_output, validate_compile_options, compare_files
+from .file_writer import write_file
+from .elf_builder import build_elf64
+from .sub_op_builder import gen_op, add_sync
 
-__all__ = ["validate_codegen_output", "validate_compile_options"]
+__all__ = ["validate_codegen_output", "validate_compile_options", "write_file", "build_elf64", "gen_op", "add_sync"]
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+"""Build minimal ELF64 relocatable objects for unit tests."""
+
+import struct
+
+SHT_PROGBITS = 1
+SHT_SYMTAB = 2
+SHT_STRTAB = 3
+STB_GLOBAL_FUNC = (1 << 4) | 2
+
+
+def _build_strtab(names):
+    table = b"\x00"
+    offsets = {}
+    for name in names:
+        if name not in offsets:
+            offsets[name] = len(table)
+            table += name.encode() + b"\x00"
+    return table, offsets
+
+
+def build_elf64(sections, symbols=None):
+    """sections: [(name, content)], symbols: [name] defined as global functions in the first section.
+    a .strtab and .symtab are appended when symbols is not None, .shstrtab is always the last section."""
+    all_sections = [(name, SHT_PROGBITS, content, 0, 0) for name, content in sections]
+    if symbols is not None:
+        strtab, name_offsets = _build_strtab(symbols)
+        symtab = b"\x00" * 24
+        for symbol in symbols:
+            symtab += struct.pack("<IBBHQQ", name_offsets[symbol], STB_GLOBAL_FUNC, 0, 1, 0, 0)
+        strtab_index = len(all_sections) + 1
+        all_sections.append((".strtab", SHT_STRTAB, strtab, 0, 0))
+        all_sections.append((".symtab", SHT_SYMTAB, symtab, strtab_index, 24))
+    shstrtab, section_name_offsets = _build_strtab([name for name, *_ in all_sections] + [".shstrtab"])
+    all_sections.append((".shstrtab", SHT_STRTAB, shstrtab, 0, 0))
+
+    data = bytearray(64)
+    headers = [struct.pack("<IIQQQQIIQQ", 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)]
+    for name, sh_type, content, link, entsize in all_sections:
+        offset = len(data)
+        data += content
+        headers.append(struct.pack("<IIQQQQIIQQ", section_name_offsets[name], sh_type, 0, 0, offset, \
+            len(content), link, 1 if sh_type == SHT_SYMTAB else 0, 8, entsize))
+    while len(data) % 8 != 0:
+        data += b"\x00"
+    shoff = len(data)
+    for header in headers:
+        data += header
+    ident = b"\x7fELF" + bytes([2, 1, 1]) + b"\x00" * 9
+    data[0:64] = ident + struct.pack("<HHIQQQIHHHHHH", 1, 0x1029, 1, 0, 0, shoff, 0, 64, 0, 0, 64, \
+        len(headers), len(headers) - 1)
+    return bytes(data)
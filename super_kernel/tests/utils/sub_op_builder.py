@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------------------------------------------------
+# Copyright (c) 2025 Huawei Technologies Co., Ltd.
+# This program is free software, you can redistribute it and/or modify it under the terms and contiditions of
+# CANN Open Software License Agreement Version 2.0 (the "License").
+# Please refer to the License for details. You may not use this file except in compliance with the License.
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY, OR FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE in the root of the software repository for the full text of the License.
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+
+"""Build double stream sub ops and syncs between them for unit tests."""
+
+from types import SimpleNamespace
+
+
+def gen_op(name, workspace_sizes=None, param_offset=0, kernel_params=None, workspace_types=None):
+    return SimpleNamespace(kernel_name_for_multi_stream=name, send_info={}, recv_info={}, param_offset=param_offset, \
+        workspace_sizes=workspace_sizes or [], kernel_params=kernel_params or [], \
+        workspace_types=workspace_types or [0] * len(workspace_sizes or []))
+
+
+def add_sync(send_op, recv_op, sync_name):
+    send_op.send_info[recv_op.kernel_name_for_multi_stream] = sync_name
+    recv_op.recv_info[send_op.kernel_name_for_multi_stream] = sync_name